@@ -127,6 +127,12 @@ def main():
             help="Provide context to improve translation quality"
         )
         
+        file_workers = st.number_input(
+            "Parallel Files", min_value=1, max_value=16,
+            value=st.session_state.translator.file_workers,
+            help="How many documents are translated at the same time"
+        )
+        
         st.divider()
         
         # Features info
@@ -189,6 +195,7 @@ def main():
                         # Load glossaries if any were uploaded
                         if glossary_files:
                             st.write("📚 Loading glossaries...")
+                            loaded_glossaries = []
                             for glossary_file in glossary_files:
                                 try:
                                     # Save glossary file to temp folder
@@ -200,12 +207,19 @@ def main():
                                     result = st.session_state.translator.load_glossary_csv(str(glossary_path))
                                     if "successfully" in result:
                                         glossary_name = Path(glossary_path).stem
-                                        st.session_state.translator.set_active_glossary(glossary_name)
+                                        loaded_glossaries.append(glossary_name)
                                         st.success(f"✅ Loaded glossary: {glossary_name}")
                                     else:
                                         st.error(f"❌ Failed to load glossary: {result}")
                                 except Exception as e:
                                     st.error(f"❌ Error loading glossary: {e}")
+                            
+                            # Several glossaries are layered in upload order - later ones win
+                            if len(loaded_glossaries) > 1:
+                                st.session_state.translator.set_glossary_stack(loaded_glossaries)
+                                st.info(f"📚 Glossary stack: {' → '.join(loaded_glossaries)} (later files win)")
+                            elif loaded_glossaries:
+                                st.session_state.translator.set_active_glossary(loaded_glossaries[0])
                         
                         # Progress tracking
                         progress_bar = st.progress(0)
@@ -237,6 +251,7 @@ def main():
                             "processed_files": [],
                             "skipped_files": [],
                             "failed_files": [],
+                            "deferred_files": [],
                             "total_time": 0,
                             "total_chars": 0,
                             "output_folder": output_folder,
@@ -249,43 +264,37 @@ def main():
                         import time
                         start_time = time.time()
                         
-                        for i, file_info in enumerate(sorted_files):
-                            file_path = file_info["path"]
+                        st.session_state.translator.set_concurrency(file_workers=int(file_workers))
+                        
+                        def on_file_done(completed, total, file_info, file_result):
                             file_name = file_info["name"]
                             
-                            status_text.text(f"📄 Processing {i+1}/{len(sorted_files)}: {file_name}")
-                            progress = 10 + (80 * i / len(sorted_files))
+                            status_text.text(f"📄 Processed {completed}/{total}: {file_name}")
+                            progress = 10 + (80 * completed / total)
                             progress_bar.progress(int(progress))
                             
-                            try:
-                                # Process single document
-                                file_result = st.session_state.translator.process_single_document(
-                                    file_path, source_lang, target_lang, context, output_folder
-                                )
-                                
-                                if file_result["success"]:
-                                    results["processed_files"].append(file_result)
-                                    results["total_chars"] += file_result["char_count"]
-                                    st.write(f"✅ Completed: {file_name}")
-                                else:
-                                    results["failed_files"].append({
-                                        "file": file_name,
-                                        "error": file_result["error"]
-                                    })
-                                    st.error(f"❌ Failed: {file_name} - {file_result['error']}")
-                                
-                            except Exception as e:
-                                error_msg = str(e)
-                                results["failed_files"].append({
-                                    "file": file_name,
-                                    "error": error_msg
-                                })
-                                st.error(f"❌ Error processing {file_name}: {error_msg}")
+                            if file_result["success"]:
+                                st.write(f"✅ Completed: {file_name}")
+                            elif file_result.get("deferred"):
+                                st.warning(f"⏸️ Deferred: {file_name} - {file_result['error']}")
+                            elif file_result.get("timed_out"):
+                                st.error(f"⏰ Timed out: {file_name} - {file_result['error']}")
+                            else:
+                                st.error(f"❌ Failed: {file_name} - {file_result['error']}")
+                        
+                        # Process files in parallel
+                        status_text.text(f"📄 Processing {len(sorted_files)} files...")
+                        st.session_state.translator.process_documents(
+                            sorted_files, source_lang, target_lang, context, output_folder, results, on_file_done
+                        )
                         
                         # Final results
                         total_time = time.time() - start_time
                         results["total_time"] = total_time
                         
+                        if results.get("aborted"):
+                            st.error(f"🛑 Run aborted: {results['aborted']}")
+                        
                         # Save glossary and logs (new functionality)
                         try:
                             # Save updated glossary with usage stats
@@ -307,7 +316,7 @@ def main():
                         st.session_state.translation_results = results
                         
                         # Show summary
-                        if results["processed_files"] or results["failed_files"]:
+                        if results["processed_files"] or results["failed_files"] or results["deferred_files"]:
                             st.markdown("""
                             <div class="success-box">
                                 <h4>🎉 Translation Process Completed!</h4>
@@ -331,6 +340,12 @@ def main():
                                 for failed in results['failed_files']:
                                     st.error(f"**{failed['file']}**: {failed['error']}")
                             
+                            if results['deferred_files']:
+                                st.subheader("⏸️ Deferred Files")
+                                st.caption("Resume these later from the deferred manifest in the logs folder")
+                                for deferred in results['deferred_files']:
+                                    st.warning(f"**{deferred['file']}**: {deferred['reason']}")
+                            
                             # Switch to results tab
                             st.success("👉 Check the 'Results' tab for detailed information!")
                         else:
@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ultimateTranslator as ut
+
+
+@pytest.fixture
+def translator(monkeypatch):
+    """DeepSeekOnlyTranslator with no Azure credentials - nothing is sent anywhere"""
+    monkeypatch.delenv("AZURE_AI_ENDPOINT", raising=False)
+    monkeypatch.delenv("AZURE_AI_API_KEY", raising=False)
+    monkeypatch.setattr(ut, "load_azure_config", lambda: ("", ""))
+    return ut.DeepSeekOnlyTranslator()
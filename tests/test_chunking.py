@@ -0,0 +1,81 @@
+import pytest
+
+import ultimateTranslator as ut
+
+
+def reassemble(chunks, joiners):
+    text = chunks[0]
+    for chunk, joiner in zip(chunks[1:], joiners[1:]):
+        text += joiner + chunk
+    return text
+
+
+@pytest.fixture
+def budget(translator):
+    return translator.chunk_budget
+
+
+def test_paragraphs_are_packed_up_to_the_limit(translator, budget):
+    paragraphs = [f"{i}번째 문단입니다. " + "가" * 30 for i in range(20)]
+
+    chunks, joiners = translator.pack_paragraphs(paragraphs, 200)
+
+    assert len(chunks) < len(paragraphs)
+    assert all(budget.count(chunk) <= 200 for chunk in chunks)
+    assert joiners == ["\n\n"] * len(chunks)
+    assert reassemble(chunks, joiners) == "\n\n".join(paragraphs)
+
+
+def test_limit_is_capped_by_the_output_budget(translator, budget):
+    budget.configure(max_output_tokens=100)
+    paragraphs = ["가" * 60 for _ in range(6)]
+
+    chunks, _ = translator.pack_paragraphs(paragraphs, 1000)
+
+    assert len(chunks) == 6
+
+
+def test_word_split_chunks_are_filled(translator, budget):
+    paragraph = " ".join(["마법사는"] * 600)
+
+    chunks, joiners = translator.pack_paragraphs([paragraph], 200)
+
+    assert all(budget.count(chunk) <= 200 for chunk in chunks)
+    assert all(budget.count(chunk) >= 190 for chunk in chunks[:-1])
+    assert reassemble(chunks, joiners) == paragraph
+
+
+def test_oversized_paragraph_is_cut_at_line_breaks_first(translator):
+    lines = ["가" * 40 for _ in range(5)]
+
+    pieces = translator.split_oversized_paragraph("\n".join(lines), 100)
+
+    assert pieces == [("\n\n", lines[0])] + [("\n", line) for line in lines[1:]]
+
+
+def test_long_line_is_cut_at_sentence_ends(translator, budget):
+    sentences = [f"이시헌은 {i}번째 계단을 올랐다." for i in range(12)] + ["“정말이요?”", "그래요."]
+    paragraph = " ".join(sentences)
+
+    pieces = translator.split_oversized_paragraph(paragraph, 20)
+
+    assert [piece for _, piece in pieces] == sentences
+    assert [separator for separator, _ in pieces] == ["\n\n"] + [" "] * (len(sentences) - 1)
+
+
+def test_long_sentence_is_cut_between_words_then_inside_words(translator, budget):
+    pieces = translator.split_oversized_paragraph("마법사는 " * 10 + "가" * 50, 12)
+
+    assert all(budget.count(piece) <= 12 for _, piece in pieces)
+    assert [piece for _, piece in pieces[:10]] == ["마법사는"] * 10
+    assert "".join(piece for _, piece in pieces[10:]) == "가" * 50
+    assert [separator for separator, _ in pieces[10:]] == [" "] + [""] * (len(pieces) - 11)
+
+
+def test_packed_pieces_keep_their_separators(translator, budget):
+    paragraph = "\n".join(" ".join(f"{i}-{j}번째 문장입니다." for j in range(8)) for i in range(4))
+
+    chunks, joiners = translator.pack_paragraphs(["짧은 문단.", paragraph], 40)
+
+    assert all(budget.count(chunk) <= 40 for chunk in chunks)
+    assert reassemble(chunks, joiners) == "짧은 문단.\n\n" + paragraph
@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+
+import ultimateTranslator as ut
+
+
+class EchoTranslator:
+    """Stands in for AzureDeepSeekTranslator - later chunks finish first"""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def translate_with_glossary(self, korean_text, glossary_terms="", context="", element_type="text", **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            index = int(korean_text.split()[-1])
+            time.sleep(0.05 - index * 0.005)
+            if index == self.fail_on:
+                raise ut.TranslationFailedException(f"chunk {index} failed")
+            return f"EN {index}"
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_chunks_come_back_in_order(translator):
+    translator.azure_translator = EchoTranslator()
+    translator.chunk_workers = 4
+    chunks = [f"문단 {i}" for i in range(8)]
+
+    assert translator.translate_chunks_concurrently(chunks, "", "") == [f"EN {i}" for i in range(8)]
+    assert 1 < translator.azure_translator.peak <= 4
+
+
+def test_one_worker_translates_in_sequence(translator):
+    translator.azure_translator = EchoTranslator()
+    translator.chunk_workers = 1
+
+    assert translator.translate_chunks_concurrently(["문단 0", "문단 1"], "", "") == ["EN 0", "EN 1"]
+    assert translator.azure_translator.peak == 1
+
+
+def test_failed_chunk_fails_the_document(translator):
+    translator.azure_translator = EchoTranslator(fail_on=3)
+    translator.chunk_workers = 4
+
+    with pytest.raises(ut.TranslationFailedException, match="chunk 3"):
+        translator.translate_chunks_concurrently([f"문단 {i}" for i in range(8)], "", "")
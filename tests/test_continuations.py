@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import pytest
+
+import ultimateTranslator as ut
+
+stitch = ut.AzureDeepSeekTranslator.stitch
+whole_words = ut.AzureDeepSeekTranslator.whole_words
+
+
+def response(content, finish_reason="stop"):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content),
+                                                    finish_reason=finish_reason)])
+
+
+@pytest.mark.parametrize("partial, continuation, stitched", [
+    ("He climbed the stairs", "climbed the stairs and rested.", "He climbed the stairs and rested."),
+    ("He climbed the stairs", "the stairs and rested.", "He climbed the stairs and rested."),
+    ("He climbed the stairs", "and rested.", "He climbed the stairs and rested."),
+    ("He climbed the stairs", ", then rested.", "He climbed the stairs, then rested."),
+    ("He climbed the stairs\n", "He rested.", "He climbed the stairs\nHe rested."),
+    ("", "He rested.", "He rested."),
+])
+def test_stitch(partial, continuation, stitched):
+    assert stitch(partial, continuation) == stitched
+
+
+def test_stitch_drops_only_the_shortest_repeat():
+    partial = "He ran. He ran. He ran"
+
+    assert stitch(partial, "He ran. He stopped.") == "He ran. He ran. He ran. He stopped."
+
+
+def test_stitch_ignores_repeats_inside_words():
+    assert stitch("the stairs", "airs of the tower") == "the stairs airs of the tower"
+
+
+def test_whole_words_drops_a_split_last_word():
+    assert whole_words("He climbed the sta") == "He climbed the"
+    assert whole_words("He climbed the stairs.") == "He climbed the stairs."
+    assert whole_words("Unbroken") == "Unbroken"
+
+
+@pytest.fixture
+def azure():
+    return ut.AzureDeepSeekTranslator("https://example.invalid/models", "x" * 40)
+
+
+def test_continued_reply_is_stitched(azure):
+    assert azure.extract_translation(response("stairs and rested."), "paragraph", "He climbed the") == \
+        "He climbed the stairs and rested."
+
+
+def test_cut_off_reply_is_truncated_then_incomplete(azure):
+    with pytest.raises(ut.TranslationOutputError) as raised:
+        azure.extract_translation(response("He climbed", "length"), "paragraph")
+    assert raised.value.error_class == ut.RetryPolicy.TRUNCATED
+
+    with pytest.raises(ut.TranslationOutputError) as raised:
+        azure.extract_translation(response("the stairs", "length"), "paragraph", "He climbed")
+    assert raised.value.error_class == ut.RetryPolicy.INCOMPLETE
+    assert ut.RetryPolicy().max_retries_for(ut.RetryPolicy.INCOMPLETE, 5) == 0
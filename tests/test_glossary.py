@@ -0,0 +1,75 @@
+import pytest
+
+import ultimateTranslator as ut
+
+
+def test_finds_every_term_leftmost_longest():
+    matcher = ut.GlossaryMatcher(["이시헌", "시헌", "검은 탑", "탑"])
+
+    assert matcher.find_all("이시헌은 검은 탑과 탑 사이에서 시헌을 불렀다") == [
+        (0, "이시헌"), (5, "검은 탑"), (11, "탑"), (18, "시헌")
+    ]
+
+
+def test_counts_occurrences():
+    matcher = ut.GlossaryMatcher(["마나", "마나석", "검"])
+
+    assert matcher.count("마나석에 마나를 담고 검을 들었다. 마나!") == {"마나석": 1, "마나": 2, "검": 1}
+
+
+def test_no_terms_and_no_matches():
+    assert ut.GlossaryMatcher([]).find_all("아무것도 없다") == []
+    assert ut.GlossaryMatcher(["이시헌"]).find_all("") == []
+    assert ut.GlossaryMatcher(["이시헌"]).find_all("이시 헌") == []
+
+
+def leftmost_longest(terms, text):
+    matches, position = [], 0
+    while position < len(text):
+        starting = [term for term in terms if text.startswith(term, position)]
+        if starting:
+            term = max(starting, key=len)
+            matches.append((position, term))
+            position += len(term)
+        else:
+            position += 1
+    return matches
+
+
+def test_agrees_with_a_brute_force_scan():
+    terms = ["가", "가나", "나다", "다라마", "라", "가나다라마바"]
+    text = "가나다라마바사 가나 나다라 다라마가 라가나다"
+
+    assert ut.GlossaryMatcher(terms).find_all(text) == leftmost_longest(terms, text)
+
+
+def test_rebuilt_from_arrays_matches_the_same():
+    matcher = ut.GlossaryMatcher(["이시헌", "검은 탑"])
+    arrays = matcher.arrays()
+    rebuilt = ut.GlossaryMatcher.from_arrays(matcher.terms, arrays["keys"], arrays["values"], arrays["fail"],
+                                             arrays["term_at"], arrays["output_link"])
+
+    assert rebuilt.find_all("검은 탑의 이시헌") == matcher.find_all("검은 탑의 이시헌")
+
+
+@pytest.fixture
+def azure():
+    return ut.AzureDeepSeekTranslator("https://example.invalid/models", "x" * 40)
+
+
+def test_placeholders_are_restored(azure):
+    placeholders = {"⟦A⟧": "Lee Si-heon", "⟦B⟧": "Black Tower"}
+
+    assert azure.restore_placeholders("⟦A⟧ climbed the ⟦B⟧. ⟦A⟧ rested.", placeholders) == \
+        "Lee Si-heon climbed the Black Tower. Lee Si-heon rested."
+    assert azure.restore_placeholders("No terms here.", None) == "No terms here."
+
+
+@pytest.mark.parametrize("english, problem", [
+    ("He climbed the ⟦B⟧.", "missing ⟦A⟧"),
+    ("⟦A⟧ climbed the ⟦B⟧ with ⟦C⟧.", "unknown ⟦C⟧"),
+])
+def test_dropped_or_invented_placeholders_are_rejected(azure, english, problem):
+    with pytest.raises(ut.PlaceholderMismatchError, match=problem) as raised:
+        azure.restore_placeholders(english, {"⟦A⟧": "Lee Si-heon", "⟦B⟧": "Black Tower"})
+    assert raised.value.error_class == ut.RetryPolicy.PLACEHOLDER_MISMATCH
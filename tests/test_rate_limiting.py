@@ -0,0 +1,47 @@
+import pytest
+
+import ultimateTranslator as ut
+
+
+def test_unlimited_never_waits():
+    limiter = ut.TokenBucketRateLimiter()
+
+    assert all(limiter.reserve(10000) == 0 for _ in range(100))
+    assert limiter.delayed_requests == 0
+
+
+def test_burst_then_paced_by_requests_per_minute():
+    # 60 RPM at full headroom: a 10-second burst of 10 requests, then one a second
+    limiter = ut.TokenBucketRateLimiter(requests_per_minute=60, headroom=1.0)
+
+    assert [limiter.reserve(1) for _ in range(10)] == [0] * 10
+    assert limiter.reserve(1) == pytest.approx(1.0, abs=0.05)
+    assert limiter.reserve(1) == pytest.approx(2.0, abs=0.05)
+    assert limiter.delayed_requests == 2
+
+
+def test_tokens_per_minute_paces_large_requests():
+    # 6000 TPM at 50% headroom: 500 tokens of burst, refilled at 50 a second
+    limiter = ut.TokenBucketRateLimiter(tokens_per_minute=6000, headroom=0.5)
+
+    assert limiter.reserve(500) == 0
+    assert limiter.reserve(100) == pytest.approx(2.0, abs=0.05)
+
+
+def test_try_reserve_never_borrows_and_refund_gives_back():
+    limiter = ut.TokenBucketRateLimiter(tokens_per_minute=600, headroom=1.0)  # 100-token burst
+
+    assert limiter.try_reserve(80)
+    assert not limiter.try_reserve(80)
+    limiter.refund(80)
+    assert limiter.try_reserve(80)
+    assert limiter.total_requests == 1
+
+
+def test_pause_holds_every_caller():
+    limiter = ut.TokenBucketRateLimiter()
+    limiter.pause(5)
+
+    assert limiter.paused
+    assert not limiter.try_reserve(1)
+    assert limiter.reserve(1) > 4.9
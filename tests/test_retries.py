@@ -0,0 +1,80 @@
+import time
+
+import pytest
+from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
+
+import ultimateTranslator as ut
+
+
+def http_error(status_code, message="request failed"):
+    error = HttpResponseError(message=message)
+    error.status_code = status_code
+    return error
+
+
+@pytest.mark.parametrize("error, error_class", [
+    (http_error(429), ut.RetryPolicy.THROTTLED),
+    (http_error(503), ut.RetryPolicy.THROTTLED),
+    (http_error(500), ut.RetryPolicy.TRANSIENT),
+    (http_error(408), ut.RetryPolicy.TRANSIENT),
+    (http_error(401), ut.RetryPolicy.AUTH_CONFIG),
+    (http_error(404), ut.RetryPolicy.AUTH_CONFIG),
+    (http_error(400), ut.RetryPolicy.REJECTED),
+    (http_error(400, "The response was filtered due to the content management policy"), ut.RetryPolicy.CONTENT_FILTERED),
+    (ClientAuthenticationError(message="bad key"), ut.RetryPolicy.AUTH_CONFIG),
+    (ConnectionError("reset by peer"), ut.RetryPolicy.TRANSIENT),
+    (TimeoutError(), ut.RetryPolicy.TRANSIENT),
+    (ut.TranslationOutputError("empty reply"), ut.RetryPolicy.MALFORMED_OUTPUT),
+])
+def test_classify(error, error_class):
+    assert ut.RetryPolicy().classify(error) == error_class
+
+
+def test_only_retryable_classes_get_retries():
+    policy = ut.RetryPolicy()
+
+    assert policy.max_retries_for(ut.RetryPolicy.TRANSIENT, 5) == 5
+    assert policy.max_retries_for(ut.RetryPolicy.THROTTLED, 5) == 8
+    assert policy.max_retries_for(ut.RetryPolicy.MALFORMED_OUTPUT, 5) == 2
+    for error_class in (ut.RetryPolicy.CONTENT_FILTERED, ut.RetryPolicy.REJECTED, ut.RetryPolicy.AUTH_CONFIG):
+        assert policy.max_retries_for(error_class, 5) == 0
+
+
+def test_circuit_opens_after_threshold_and_closes_on_success():
+    breaker = ut.CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == ut.CircuitBreaker.CLOSED
+    assert breaker.admit() == 0
+
+    breaker.record_failure()
+    assert breaker.state == ut.CircuitBreaker.OPEN
+    assert breaker.admit() > 0
+    assert breaker.open_count == 1
+
+    breaker.record_success()
+    assert breaker.state == ut.CircuitBreaker.CLOSED
+    assert breaker.admit() == 0
+
+
+def test_circuit_lets_one_probe_through_after_recovery_timeout():
+    breaker = ut.CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.admit() > 0
+
+    time.sleep(0.06)
+    assert breaker.admit() == 0
+    assert breaker.state == ut.CircuitBreaker.HALF_OPEN
+    assert breaker.admit() > 0  # Probe still in flight
+
+    breaker.record_failure()
+    assert breaker.state == ut.CircuitBreaker.OPEN
+    assert breaker.probe_count == 1
+
+
+def test_circuit_defers_once_open_too_long():
+    breaker = ut.CircuitBreaker(failure_threshold=1, recovery_timeout=60, max_open_time=0)
+    breaker.record_failure()
+
+    with pytest.raises(ut.TranslationDeferredException):
+        breaker.admit()
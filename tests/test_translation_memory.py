@@ -0,0 +1,85 @@
+import pytest
+
+import ultimateTranslator as ut
+
+GLOSSARY = "- 이시헌 → Lee Si-heon (character)\n- 검은 탑 → Black Tower (place)"
+MODEL = "DeepSeek-V3-0324"
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = ut.TranslationMemory(tmp_path / "memory.sqlite3")
+    yield memory
+    memory.close()
+
+
+def test_key_depends_only_on_glossary_terms_in_the_text(memory):
+    text = "이시헌은 고개를 들었다."
+    key = memory.key(text, GLOSSARY, "", "paragraph", MODEL)
+
+    assert key == memory.key(text, GLOSSARY + "\n- 마나 → mana (term)", "", "paragraph", MODEL)
+    assert key != memory.key(text, "- 이시헌 → Lee Siheon (character)", "", "paragraph", MODEL)
+    assert key != memory.key(text, GLOSSARY, "", "title", MODEL)
+    assert key != memory.key(text, GLOSSARY, "", "paragraph", "other-model")
+
+
+def test_lookup_hits_memory_then_disk(memory, tmp_path):
+    key = memory.key("이시헌은 고개를 들었다.", GLOSSARY, "", "paragraph", MODEL)
+    assert memory.get(key) is None
+
+    memory.put(key, "이시헌은 고개를 들었다.", "Lee Si-heon looked up.")
+    assert memory.get(key) == "Lee Si-heon looked up."
+    assert (memory.hot_hits, memory.disk_hits, memory.misses) == (1, 0, 1)
+
+    reopened = ut.TranslationMemory(tmp_path / "memory.sqlite3")
+    try:
+        assert reopened.get(key) == "Lee Si-heon looked up."
+        assert reopened.disk_hits == 1
+    finally:
+        reopened.close()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    memory = ut.TranslationMemory(tmp_path / "memory.sqlite3", max_entries=10, hot_entries=0)
+    try:
+        for i in range(12):
+            memory.put(f"key{i}", f"문단 {i}", f"paragraph {i}")
+
+        assert memory.entries <= 10
+        assert memory.get("key0") is None
+        assert memory.get("key11") == "paragraph 11"
+    finally:
+        memory.close()
+
+
+RECAP = "이시헌은 검은 탑의 {}층에서 마나석 {}개를 발견했다. 그는 조심스럽게 주머니에 넣었다."
+
+
+def store(memory, text, translation):
+    memory.put(memory.key(text, GLOSSARY, "", "paragraph", MODEL), text, translation)
+
+
+def test_near_duplicate_differing_in_numbers_is_reused(memory):
+    store(memory, RECAP.format(3, 12), "On floor 3 Lee Si-heon found 12 mana stones.")
+
+    match = memory.find_similar(RECAP.format(7, 40), GLOSSARY, "", "paragraph", MODEL)
+
+    assert match["reuse"] == "On floor 7 Lee Si-heon found 40 mana stones."
+    assert memory.fuzzy_reused == 1
+
+
+def test_near_duplicate_with_other_words_is_only_a_reference(memory):
+    store(memory, RECAP.format(3, 12), "On floor 3 Lee Si-heon found 12 mana stones.")
+
+    match = memory.find_similar(RECAP.format(3, 12).replace("조심스럽게", "재빨리"), GLOSSARY, "", "paragraph", MODEL)
+
+    assert match["reuse"] is None
+    assert match["similarity"] >= memory.fuzzy_threshold
+    assert match["translation"].startswith("On floor 3")
+
+
+def test_unrelated_and_short_texts_find_nothing(memory):
+    store(memory, RECAP.format(3, 12), "On floor 3 Lee Si-heon found 12 mana stones.")
+
+    assert memory.find_similar("완전히 다른 이야기가 여기서 시작되고 아무도 그것을 몰랐다.", GLOSSARY, "", "paragraph", MODEL) is None
+    assert memory.find_similar("3층", GLOSSARY, "", "paragraph", MODEL) is None
@@ -106,6 +106,12 @@ class TranslatorApp:
         self.context_entry.pack(pady=3, padx=8, fill="x")
         self.context_entry.insert("0.0", "Fantasy light novel")
         
+        # Parallelism
+        ctk.CTkLabel(self.lang_frame, text="Parallel Files:", font=ctk.CTkFont(size=12)).pack(pady=(8,2))
+        self.file_workers = ctk.CTkOptionMenu(self.lang_frame, values=["1", "2", "3", "4", "6", "8"], width=120)
+        self.file_workers.set(str(self.translator.file_workers))
+        self.file_workers.pack(pady=3)
+        
         # File info
         self.file_info_frame = ctk.CTkFrame(self.sidebar_frame)
         self.file_info_frame.pack(fill="x", padx=10, pady=8)
@@ -954,22 +960,31 @@ Supported formats:
             # Load glossaries if any were uploaded
             if self.glossary_files:
                 self.log_message("📚 Loading glossaries...")
+                loaded_glossaries = []
                 for glossary_path in self.glossary_files:
                     try:
                         result = self.translator.load_glossary_csv(str(glossary_path))
                         if "successfully" in result:
                             glossary_name = Path(glossary_path).stem
-                            self.translator.set_active_glossary(glossary_name)
+                            loaded_glossaries.append(glossary_name)
                             self.log_message(f"✅ Loaded glossary: {glossary_name}")
                         else:
                             self.log_message(f"❌ Failed to load glossary: {result}")
                     except Exception as e:
                         self.log_message(f"❌ Error loading glossary: {e}")
+                
+                # Several glossaries are layered in the order they were selected - later ones win
+                if len(loaded_glossaries) > 1:
+                    self.translator.set_glossary_stack(loaded_glossaries)
+                    self.log_message(f"📚 Glossary stack: {' → '.join(loaded_glossaries)} (later files win)")
+                elif loaded_glossaries:
+                    self.translator.set_active_glossary(loaded_glossaries[0])
             
             # Get settings from GUI
             source_lang = self.source_lang.get()
             target_lang = self.target_lang.get()
             context = self.context_entry.get("0.0", tk.END).strip()
+            self.translator.set_concurrency(file_workers=int(self.file_workers.get()))
             
             self.log_message(f"🔄 Translating {source_lang} → {target_lang}")
             if context:
@@ -1110,6 +1125,7 @@ Supported formats:
                 "processed_files": [],
                 "skipped_files": [],
                 "failed_files": [],
+                "deferred_files": [],
                 "total_time": 0,
                 "total_chars": 0,
                 "output_folder": output_folder,
@@ -1119,51 +1135,42 @@ Supported formats:
                 "target_lang": target_lang
             }
             
-            for i, doc_info in enumerate(sorted_documents):
-                doc_path = doc_info["path"]
+            def on_file_done(completed, total, doc_info, file_result):
                 doc_name = doc_info["name"]
                 
-                self.log_message(f"📄 Processing {i+1}/{len(sorted_documents)}: {doc_name}")
-                
-                try:
-                    # Process single document
-                    file_result = self.translator.process_single_document(
-                        doc_path, source_lang, target_lang, context, output_folder
-                    )
-                    
-                    if file_result["success"]:
-                        results["processed_files"].append(file_result)
-                        results["total_chars"] += file_result["char_count"]
-                        self.log_message(f"✅ Completed: {doc_name}")
-                    else:
-                        results["failed_files"].append({
-                            "file": doc_name,
-                            "error": file_result["error"]
-                        })
-                        self.log_message(f"❌ Failed: {doc_name} - {file_result['error']}")
-                    
-                except Exception as e:
-                    error_msg = str(e)
-                    results["failed_files"].append({
-                        "file": doc_name,
-                        "error": error_msg
-                    })
-                    self.log_message(f"❌ Error processing {doc_name}: {error_msg}")
+                if file_result["success"]:
+                    self.log_message(f"✅ Completed {completed}/{total}: {doc_name}")
+                elif file_result.get("deferred"):
+                    self.log_message(f"⏸️ Deferred: {doc_name} - {file_result['error']}")
+                elif file_result.get("timed_out"):
+                    self.log_message(f"⏰ Timed out: {doc_name} - {file_result['error']}")
+                else:
+                    self.log_message(f"❌ Failed: {doc_name} - {file_result['error']}")
                 
                 # Update progress
-                progress = 0.3 + (0.6 * (i + 1) / len(sorted_documents))
+                progress = 0.3 + (0.6 * completed / total)
                 self.progress_bar.set(progress)
             
+            # Process documents in parallel
+            self.translator.process_documents(
+                sorted_documents, source_lang, target_lang, context, output_folder, results, on_file_done
+            )
+            
             # Final summary
             total_time = time.time() - start_time
             results["total_time"] = total_time
             
-            self.log_message(f"🎉 Processing completed!")
+            if results.get("aborted"):
+                self.log_message(f"🛑 Run aborted: {results['aborted']}")
+            else:
+                self.log_message(f"🎉 Processing completed!")
             self.log_message(f"✅ Successfully processed: {len(results['processed_files'])} files")
             if results['failed_files']:
                 self.log_message(f"❌ Failed: {len(results['failed_files'])} files")
                 for failed in results['failed_files']:
                     self.log_message(f"   • {failed['file']}: {failed['error']}")
+            if results['deferred_files']:
+                self.log_message(f"⏸️ Deferred: {len(results['deferred_files'])} files (resume them from the deferred manifest in logs)")
             self.log_message(f"📊 Total characters: {results['total_chars']:,}")
             self.log_message(f"⏱️ Total time: {total_time:.2f} seconds")
             
@@ -1208,7 +1215,12 @@ Supported formats:
         if results['failed_files']:
             details_text += "\n❌ Failed Files:\n\n"
             for failed in results['failed_files']:
-                details_text += f"❌ {failed['file']}: {failed['error']}\n"
+                details_text += f"{'⏰' if failed.get('timed_out') else '❌'} {failed['file']}: {failed['error']}\n"
+        
+        if results.get('deferred_files'):
+            details_text += "\n⏸️ Deferred Files:\n\n"
+            for deferred in results['deferred_files']:
+                details_text += f"⏸️ {deferred['file']}: {deferred['reason']}\n"
                 
         self.results_textbox.insert("0.0", details_text)
         
@@ -1,9 +1,9 @@
 # DeepSeek-Only Automated Folder Translation System
 # With HTML support and interactive glossary updates
 
-import pandas as pd
 import os
 import re
+import csv
 from pathlib import Path
 import time
 import PyPDF2
@@ -14,15 +14,34 @@ from typing import List, Dict, Tuple
 import shutil
 from bs4 import BeautifulSoup, NavigableString
 import sys
+import threading
+import asyncio
+import random
+import math
+import sqlite3
+import hashlib
+import mmap
+import struct
+from array import array
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from collections import deque, OrderedDict, Counter
+from contextlib import contextmanager, asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as wait_futures
 
 # Azure AI DeepSeek imports
 from azure.ai.inference import ChatCompletionsClient
-from azure.ai.inference.models import SystemMessage, UserMessage
+from azure.ai.inference.aio import ChatCompletionsClient as AsyncChatCompletionsClient
+from azure.ai.inference.models import SystemMessage, UserMessage, AssistantMessage
 from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import HttpResponseError, ClientAuthenticationError
 
 # Azure AI DeepSeek Configuration
 AZURE_AI_MODEL = "DeepSeek-V3-0324"
 
+# Bump when build_messages / request_options change, so cached translations from the old prompt aren't reused
+PROMPT_VERSION = "1"
+
 def load_azure_config():
     """Load Azure configuration from config file or return defaults"""
     config_file = Path(__file__).parent / "azure_config.txt"
@@ -41,41 +60,1517 @@ def load_azure_config():
     # Return empty values if config file doesn't exist or is invalid
     return "", ""
 
+def load_azure_settings():
+    """Load optional KEY=VALUE settings (rate limits etc.) from the config file"""
+    config_file = Path(__file__).parent / "azure_config.txt"
+    settings = {}
+    
+    try:
+        if config_file.exists():
+            with open(config_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith('#') or '=' not in line:
+                        continue
+                    key, value = line.split('=', 1)
+                    settings[key.strip().upper()] = value.strip()
+    except Exception as e:
+        print(f"⚠️ Error reading config file: {e}")
+    
+    return settings
+
 def save_azure_config(endpoint, api_key):
-    """Save Azure configuration to config file"""
+    """Save Azure configuration to config file, keeping any extra settings"""
     config_file = Path(__file__).parent / "azure_config.txt"
+    extra_settings = {
+        key: value for key, value in load_azure_settings().items()
+        if key not in ('ENDPOINT', 'API_KEY')
+    }
     
     try:
         with open(config_file, 'w', encoding='utf-8') as f:
             f.write(f"ENDPOINT={endpoint}\n")
             f.write(f"API_KEY={api_key}\n")
+            for key, value in extra_settings.items():
+                f.write(f"{key}={value}\n")
         return True
     except Exception as e:
         print(f"❌ Error saving config file: {e}")
         return False
 
+def load_extra_azure_backends():
+    """Load additional deployments for load balancing - ENDPOINT_2 / API_KEY_2 / WEIGHT_2, and so on
+    
+    Read from the config file or AZURE_AI_ENDPOINT_2 / AZURE_AI_API_KEY_2 /
+    AZURE_AI_WEIGHT_2 environment variables. Entries without a key are skipped.
+    """
+    settings = load_azure_settings()
+    names = list(settings) + [name[len("AZURE_AI_"):] for name in os.environ if name.startswith("AZURE_AI_")]
+    suffixes = sorted({match.group(1) for match in map(re.compile(r'ENDPOINT(_\d+)$').match, names) if match},
+                      key=lambda suffix: int(suffix[1:]))
+    
+    backends = []
+    for suffix in suffixes:
+        endpoint = settings.get(f"ENDPOINT{suffix}") or os.getenv(f"AZURE_AI_ENDPOINT{suffix}", "")
+        api_key = settings.get(f"API_KEY{suffix}") or os.getenv(f"AZURE_AI_API_KEY{suffix}", "")
+        weight = settings.get(f"WEIGHT{suffix}") or os.getenv(f"AZURE_AI_WEIGHT{suffix}", "")
+        if not endpoint or not api_key:
+            print(f"⚠️ Skipping ENDPOINT{suffix} - endpoint or API key missing")
+            continue
+        try:
+            weight = float(weight) if weight else 1.0
+        except ValueError:
+            print(f"⚠️ Ignoring invalid WEIGHT{suffix} setting: {weight}")
+            weight = 1.0
+        backends.append({"endpoint": endpoint, "api_key": api_key, "weight": weight, "suffix": suffix})
+    
+    return backends
+
+# Glossary placeholders (⟦A⟧, ⟦B⟧, ...) - letters only, so number matching in the translation memory leaves them alone
+PLACEHOLDER_PATTERN = re.compile(r'⟦[A-Z]+⟧')
+
+# End of a sentence: 다. 요. ?! … and the like, with any closing quotes or brackets, before whitespace
+SENTENCE_END_PATTERN = re.compile(r'[.!?…。]+["\'”’」』)\]]*(?=\s)')
+
+def placeholder_token(index: int) -> str:
+    """The index-th glossary placeholder: ⟦A⟧ ... ⟦Z⟧, ⟦AA⟧, ⟦AB⟧ ..."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return f"⟦{letters}⟧"
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for rate limiting - Hangul/CJK cost about a token per character, other text about 4 characters per token"""
+    if not text:
+        return 0
+    wide_chars = len(re.findall(r'[\u1100-\u11ff\u3130-\u318f\uac00-\ud7af\u3040-\u30ff\u4e00-\u9fff]', text))
+    return wide_chars + (len(text) - wide_chars + 3) // 4
+
+class ChunkBudget:
+    """Sizes translation chunks in tokens rather than characters
+    
+    Hangul costs about a token per character while English and markup fit
+    about four characters in one, so a character limit under-fills some
+    requests and overruns others. Text is measured with `tokenizer` -
+    estimate_tokens unless another callable returning a token count is
+    plugged in (e.g. lambda text: len(encoding.encode(text))).
+    
+    Chunks are filled up to a target of source tokens, but never so far that
+    the expected output (output_ratio tokens per source token) passes
+    max_output_tokens, or prompt + chunk + output passes context_window.
+    """
+    
+    def __init__(self, text_tokens: int = 1800, html_tokens: int = 1500, max_output_tokens: int = 8192,
+                 context_window: int = 65536, output_ratio: float = 1.0, prompt_overhead: int = 1000,
+                 tokenizer=None):
+        self.text_tokens = text_tokens
+        self.html_tokens = html_tokens
+        self.max_output_tokens = max_output_tokens
+        self.context_window = context_window
+        self.output_ratio = output_ratio
+        self.prompt_overhead = prompt_overhead  # System prompt, instructions and glossary block
+        self.tokenizer = tokenizer or estimate_tokens
+    
+    def configure(self, text_tokens: int = None, html_tokens: int = None, max_output_tokens: int = None,
+                  context_window: int = None, tokenizer=None):
+        """Change the targets and limits - values left as None are kept"""
+        if text_tokens:
+            self.text_tokens = int(text_tokens)
+        if html_tokens:
+            self.html_tokens = int(html_tokens)
+        if max_output_tokens:
+            self.max_output_tokens = int(max_output_tokens)
+        if context_window:
+            self.context_window = int(context_window)
+        if tokenizer:
+            self.tokenizer = tokenizer
+    
+    def resize(self, text_tokens: int):
+        """Change the text target, scaling the HTML target with it"""
+        self.html_tokens = max(1, round(self.html_tokens * text_tokens / self.text_tokens))
+        self.text_tokens = text_tokens
+    
+    def count(self, text: str) -> int:
+        """Tokens in a piece of source text"""
+        return self.tokenizer(text)
+    
+    def limit(self, target: int) -> int:
+        """Most source tokens one chunk may hold when aiming for target"""
+        by_output = int(self.max_output_tokens / self.output_ratio)
+        by_context = int((self.context_window - self.prompt_overhead) / (1 + self.output_ratio))
+        return max(1, min(target, by_output, by_context))
+    
+    def describe(self) -> str:
+        """Short summary for logs"""
+        return (f"{self.limit(self.text_tokens):,} tokens per text chunk, {self.limit(self.html_tokens):,} per HTML chunk "
+                f"(output ≤ {self.max_output_tokens:,}, context {self.context_window:,})")
+
+class TokenBucketRateLimiter:
+    """Paces requests under a deployment's requests-per-minute and tokens-per-minute quotas
+    
+    Each quota is a token bucket refilled continuously. Callers reserve capacity
+    up front and sleep until the reservation is covered, so parallel workers
+    queue in arrival order instead of bursting into 429s together.
+    """
+    
+    BURST_SECONDS = 10  # Azure enforces quotas over short windows, not a whole minute
+    PAUSE_JITTER = 1.0  # Spread callers released together after a pause
+    
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0, headroom: float = 0.9):
+        self._lock = threading.Lock()
+        self._configured_rpm = 0
+        self._configured_tpm = 0
+        self.requests_per_minute = 0
+        self.tokens_per_minute = 0
+        self.headroom = headroom
+        self._request_level = 0.0
+        self._token_level = 0.0
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        
+        # Stats for the run log
+        self.total_requests = 0
+        self.delayed_requests = 0
+        self.total_wait = 0.0
+        
+        self.configure(requests_per_minute, tokens_per_minute, headroom)
+    
+    def configure(self, requests_per_minute: int = None, tokens_per_minute: int = None, headroom: float = None):
+        """Set quotas (0 = unlimited) - explicit settings win over limits learned from headers"""
+        with self._lock:
+            if requests_per_minute is not None:
+                self._configured_rpm = max(0, int(requests_per_minute))
+                self.requests_per_minute = self._configured_rpm
+            if tokens_per_minute is not None:
+                self._configured_tpm = max(0, int(tokens_per_minute))
+                self.tokens_per_minute = self._configured_tpm
+            if headroom is not None:
+                self.headroom = min(1.0, max(0.1, float(headroom)))
+            self._request_level = self._capacity(self.requests_per_minute)
+            self._token_level = self._capacity(self.tokens_per_minute)
+            self._last_refill = time.monotonic()
+    
+    def _capacity(self, per_minute: int) -> float:
+        return per_minute * self.headroom * self.BURST_SECONDS / 60
+    
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.requests_per_minute:
+            rate = self.requests_per_minute * self.headroom / 60
+            self._request_level = min(self._capacity(self.requests_per_minute), self._request_level + rate * elapsed)
+        if self.tokens_per_minute:
+            rate = self.tokens_per_minute * self.headroom / 60
+            self._token_level = min(self._capacity(self.tokens_per_minute), self._token_level + rate * elapsed)
+    
+    def reserve(self, tokens: int) -> float:
+        """Reserve one request and `tokens` tokens, returning seconds to wait before sending"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self._paused_until - now)
+            if wait > 0:
+                wait += random.uniform(0, self.PAUSE_JITTER)
+            
+            if self.requests_per_minute:
+                self._request_level -= 1
+                if self._request_level < 0:
+                    wait = max(wait, -self._request_level / (self.requests_per_minute * self.headroom / 60))
+            
+            if self.tokens_per_minute:
+                self._token_level -= tokens
+                if self._token_level < 0:
+                    wait = max(wait, -self._token_level / (self.tokens_per_minute * self.headroom / 60))
+            
+            self.total_requests += 1
+            if wait > 0:
+                self.delayed_requests += 1
+                self.total_wait += wait
+            return wait
+    
+    def try_reserve(self, tokens: int) -> bool:
+        """Reserve a request only if it fits the quotas right now - never waits or borrows"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._paused_until:
+                return False
+            if self.requests_per_minute and self._request_level < 1:
+                return False
+            if self.tokens_per_minute and self._token_level < tokens:
+                return False
+            
+            if self.requests_per_minute:
+                self._request_level -= 1
+            if self.tokens_per_minute:
+                self._token_level -= tokens
+            self.total_requests += 1
+            return True
+    
+    def refund(self, tokens: int):
+        """Give back a reservation that was never sent"""
+        with self._lock:
+            if self.requests_per_minute:
+                self._request_level = min(self._capacity(self.requests_per_minute), self._request_level + 1)
+            if self.tokens_per_minute:
+                self._token_level = min(self._capacity(self.tokens_per_minute), self._token_level + tokens)
+            self.total_requests -= 1
+    
+    def acquire(self, tokens: int):
+        """Block until a request of `tokens` tokens fits the quotas"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, tokens: int):
+        """Wait on the event loop until a request of `tokens` tokens fits the quotas"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    @property
+    def paused(self) -> bool:
+        """True while the service's Retry-After is holding callers"""
+        return time.monotonic() < self._paused_until
+    
+    def pause(self, seconds: float):
+        """Hold every caller for `seconds`, e.g. after the service asked us to back off"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def update_from_headers(self, headers):
+        """Align pacing with the x-ratelimit-* headers returned by the service
+        
+        Limits the service reports are adopted when none were configured, and a
+        lower remaining budget than ours (e.g. another process sharing the
+        quota) trims the local bucket. The bucket is never raised, so pacing
+        only ever becomes more careful.
+        """
+        def header_int(name):
+            value = headers.get(name)
+            try:
+                return int(float(value)) if value is not None else None
+            except (TypeError, ValueError):
+                return None
+        
+        limit_requests = header_int('x-ratelimit-limit-requests')
+        limit_tokens = header_int('x-ratelimit-limit-tokens')
+        remaining_requests = header_int('x-ratelimit-remaining-requests')
+        remaining_tokens = header_int('x-ratelimit-remaining-tokens')
+        
+        with self._lock:
+            self._refill(time.monotonic())
+            
+            # Learn the quota from the service when it wasn't configured
+            if limit_requests and not self._configured_rpm and limit_requests != self.requests_per_minute:
+                self.requests_per_minute = limit_requests
+                self._request_level = self._capacity(limit_requests)
+            if limit_tokens and not self._configured_tpm and limit_tokens != self.tokens_per_minute:
+                self.tokens_per_minute = limit_tokens
+                self._token_level = self._capacity(limit_tokens)
+            
+            # Follow the service down when it has less budget left than we think
+            
+            if remaining_requests is not None and self.requests_per_minute:
+                allowed = self._capacity(self.requests_per_minute) * remaining_requests / max(limit_requests or self.requests_per_minute, 1)
+                self._request_level = min(self._request_level, allowed)
+            if remaining_tokens is not None and self.tokens_per_minute:
+                allowed = self._capacity(self.tokens_per_minute) * remaining_tokens / max(limit_tokens or self.tokens_per_minute, 1)
+                self._token_level = min(self._token_level, allowed)
+    
+    def describe(self) -> str:
+        """One-line summary for the run log"""
+        rpm = f"{self.requests_per_minute:,} RPM" if self.requests_per_minute else "unlimited RPM"
+        tpm = f"{self.tokens_per_minute:,} TPM" if self.tokens_per_minute else "unlimited TPM"
+        return (f"{rpm} / {tpm} at {self.headroom:.0%} headroom - "
+                f"{self.delayed_requests}/{self.total_requests} requests paced, {self.total_wait:.1f}s waited")
+
+# One limiter per deployment, shared by every translator in the process
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(endpoint: str, model_name: str) -> TokenBucketRateLimiter:
+    """Return the process-wide rate limiter for a deployment"""
+    key = (endpoint.rstrip('/').lower(), model_name)
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = TokenBucketRateLimiter()
+        return _rate_limiters[key]
+
 class TranslationFailedException(Exception):
     """Exception raised when translation completely fails after all attempts"""
     pass
 
+class ContentFilteredException(TranslationFailedException):
+    """Exception raised when the service refuses the text under its content policy"""
+    pass
+
+class TranslationConfigurationError(TranslationFailedException):
+    """Exception raised for auth/deployment errors that no retry can fix - stops the whole run"""
+    pass
+
+class TranslationDeferredException(TranslationFailedException):
+    """Exception raised when work is put off because the endpoint is down or the run's retry budget is spent"""
+    pass
+
+class TranslationTimeoutError(TranslationFailedException):
+    """Exception raised when a file or run deadline passes before the translation finished"""
+    pass
+
+class GlossaryFormatError(ValueError):
+    """Exception raised when a glossary CSV is missing required columns"""
+    pass
+
+class TranslationOutputError(Exception):
+    """Raised when a response arrived but can't be used as a translation"""
+    
+    def __init__(self, message: str, error_class: str = "malformed_output"):
+        super().__init__(message)
+        self.error_class = error_class
+
+class PlaceholderMismatchError(TranslationOutputError):
+    """Raised when a translation dropped or invented glossary placeholders - never retried, the glossary is listed instead"""
+    
+    def __init__(self, message: str):
+        super().__init__(message, "placeholder_mismatch")
+
+class Deadline:
+    """A time by which work must finish, handed down from the run to each file and request
+    
+    A file deadline created under a run deadline expires at whichever comes
+    first. Deadline() with no seconds never expires.
+    """
+    
+    def __init__(self, seconds: float = None, label: str = "deadline", parent: "Deadline" = None):
+        self.seconds = seconds
+        self.label = label
+        self.expires_at = time.monotonic() + seconds if seconds else None
+        
+        if parent is not None and parent.expires_at is not None:
+            if self.expires_at is None or parent.expires_at < self.expires_at:
+                self.seconds, self.label, self.expires_at = parent.seconds, parent.label, parent.expires_at
+    
+    def remaining(self) -> float:
+        """Seconds left, or None if there is no deadline"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+    
+    def clamp(self, seconds: float, minimum: float = 1.0) -> float:
+        """Shorten a timeout so it ends with the deadline (but not below `minimum`)"""
+        remaining = self.remaining()
+        if remaining is None:
+            return seconds
+        return max(minimum, min(seconds, remaining))
+    
+    def error(self) -> TranslationTimeoutError:
+        return TranslationTimeoutError(f"Timed out - {self.label} of {self.seconds:g}s passed")
+    
+    def check(self):
+        """Raise TranslationTimeoutError if the deadline has passed"""
+        if self.expired:
+            raise self.error()
+
+class AdaptiveConcurrencyLimiter:
+    """Grows and shrinks the number of in-flight requests from what the endpoint tells us (AIMD)
+    
+    Each successful request adds 1/limit to the limit (about +1 per round of
+    requests). A 429/503 halves it, and latency climbing well above its
+    long-run average trims it by 10%. Decreases are rate limited so one burst
+    of throttles only counts once.
+    """
+    
+    THROTTLE_STATUS_CODES = {429, 503}
+    
+    def __init__(self, max_limit: int = 32, initial_limit: int = 4, min_limit: int = 1,
+                 latency_tolerance: float = 1.5, cooldown: float = 2.0):
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self.max_limit = max(min_limit, max_limit)
+        self.min_limit = min_limit
+        self.limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        self.in_flight = 0
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self._last_decrease = 0.0
+        self._short_latency = None  # Fast EWMA - what the endpoint is doing now
+        self._long_latency = None  # Slow EWMA - what is normal for it
+        self._samples = 0
+        
+        # Stats and recent events for the run log
+        self.peak_limit = self.limit
+        self.throttle_count = 0
+        self.events = deque(maxlen=50)
+        self._unreported_events = []
+    
+    def set_max_limit(self, max_limit: int):
+        """Change the ceiling without dropping requests already in flight"""
+        with self._lock:
+            self.max_limit = max(self.min_limit, max_limit)
+            self.limit = min(self.limit, self.max_limit)
+            self._available.notify_all()
+    
+    def _has_slot(self) -> bool:
+        return self.in_flight < max(self.min_limit, int(self.limit))
+    
+    def acquire(self):
+        """Block until a request slot is free"""
+        with self._available:
+            self._available.wait_for(self._has_slot)
+            self.in_flight += 1
+    
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now"""
+        with self._lock:
+            if not self._has_slot():
+                return False
+            self.in_flight += 1
+            return True
+    
+    def release(self, outcome: str, latency: float, slot: Dict = None):
+        """Free a slot and adapt the limit - outcome is 'success', 'throttled' or 'error'
+        
+        Pass the request's slot handle to skip the release if abandon() already freed it.
+        """
+        with self._available:
+            if slot is not None:
+                if not slot.get('held'):
+                    return
+                slot['held'] = False
+            self.in_flight -= 1
+            self._record(outcome, latency)
+            self._available.notify_all()
+    
+    def abandon(self, slot: Dict):
+        """Free a request's slot before it finishes, without recording its outcome
+        
+        For a sync request nobody waits on any more (a losing hedge) - the
+        client can't abort it, but the slot shouldn't stay taken until it ends.
+        """
+        with self._available:
+            if slot.get('held'):
+                slot['held'] = False
+                self.in_flight -= 1
+                self._available.notify_all()
+    
+    def outcome_for(self, error: BaseException) -> str:
+        """Classify an exception raised by a request"""
+        if isinstance(error, HttpResponseError) and error.status_code in self.THROTTLE_STATUS_CODES:
+            return 'throttled'
+        return 'error'
+    
+    @contextmanager
+    def request(self, acquired: bool = False, slot: Dict = None):
+        """Hold a slot for the duration of one request - pass acquired=True if try_acquire() already took it
+        
+        slot is an optional handle ({}) that abandon() can use to free the slot early.
+        """
+        if not acquired:
+            self.acquire()
+        slot = {} if slot is None else slot
+        slot['held'] = True
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self.release(self.outcome_for(e), time.monotonic() - started, slot)
+            raise
+        else:
+            self.release('success', time.monotonic() - started, slot)
+    
+    def _decrease(self, factor: float, reason: str):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        old_limit = self.limit
+        self.limit = max(float(self.min_limit), self.limit * factor)
+        self._log_event(f"⬇️ concurrency {int(old_limit)} → {int(self.limit)} ({reason})")
+    
+    def _record(self, outcome: str, latency: float):
+        if outcome == 'throttled':
+            self.throttle_count += 1
+            self._decrease(0.5, "endpoint throttled")
+            return
+        if outcome != 'success':
+            return
+        
+        # Track latency trend
+        self._samples += 1
+        if self._short_latency is None:
+            self._short_latency = self._long_latency = latency
+        else:
+            self._short_latency += 0.2 * (latency - self._short_latency)
+            self._long_latency += 0.02 * (latency - self._long_latency)
+        
+        if self._samples >= 10 and self._short_latency > self._long_latency * self.latency_tolerance:
+            self._decrease(0.9, f"latency {self._short_latency:.1f}s vs {self._long_latency:.1f}s normal")
+        elif self.limit < self.max_limit and self.in_flight + 1 >= int(self.limit):
+            # Only grow while the limit is what holds requests back
+            old_limit = int(self.limit)
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self.peak_limit = max(self.peak_limit, self.limit)
+            if int(self.limit) > old_limit:
+                self._log_event(f"⬆️ concurrency {old_limit} → {int(self.limit)}")
+    
+    def _log_event(self, message: str):
+        self.events.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        self._unreported_events.append(message)
+    
+    def drain_events(self) -> List[str]:
+        """Events since the last call, for incremental run logging"""
+        with self._lock:
+            events, self._unreported_events = self._unreported_events, []
+            return events
+    
+    def describe(self) -> str:
+        """One-line summary for the run log"""
+        return (f"{int(self.limit)} in flight (range {self.min_limit}-{self.max_limit}, peak {int(self.peak_limit)}), "
+                f"{self.throttle_count} throttled responses")
+
+class AsyncAdaptiveConcurrencyLimiter(AdaptiveConcurrencyLimiter):
+    """AdaptiveConcurrencyLimiter for the asyncio engine - waits on the event loop instead of blocking"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._async_available = asyncio.Condition()
+    
+    async def acquire(self):
+        async with self._async_available:
+            await self._async_available.wait_for(self._has_slot)
+            self.in_flight += 1
+    
+    async def release(self, outcome: str, latency: float):
+        async with self._async_available:
+            self.in_flight -= 1
+            with self._lock:
+                self._record(outcome, latency)
+            self._async_available.notify_all()
+    
+    def set_max_limit(self, max_limit: int):
+        """Change the ceiling - takes effect as requests complete"""
+        with self._lock:
+            self.max_limit = max(self.min_limit, max_limit)
+            self.limit = min(self.limit, self.max_limit)
+    
+    @asynccontextmanager
+    async def request(self, acquired: bool = False):
+        """Hold a slot for the duration of one request - pass acquired=True if try_acquire() already took it"""
+        if not acquired:
+            await self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            await self.release(self.outcome_for(e), time.monotonic() - started)
+            raise
+        else:
+            await self.release('success', time.monotonic() - started)
+
+class RetryPolicy:
+    """Exponential backoff with full jitter that honours Retry-After on throttled responses
+    
+    The random spread keeps parallel workers that failed together from
+    retrying in lockstep and hitting the same throttle again.
+    """
+    
+    # Error classes
+    TRANSIENT = "transient"  # Network errors, timeouts, 5xx - retry with backoff
+    THROTTLED = "throttled"  # 429/503 - retry, longer budget, honour Retry-After
+    MALFORMED_OUTPUT = "malformed_output"  # Empty or unusable response - a couple of retries
+    TRUNCATED = "truncated"  # Cut off at max_tokens - retried with a larger reservation
+    INCOMPLETE = "incomplete"  # Still cut off after every continuation - never retried, the chunk fails
+    PLACEHOLDER_MISMATCH = "placeholder_mismatch"  # Dropped/invented glossary placeholders - fall back to listing terms
+    CONTENT_FILTERED = "content_filtered"  # Refused by content policy - never retried
+    REJECTED = "rejected"  # Other 4xx for this request (e.g. too long) - never retried
+    AUTH_CONFIG = "auth_config"  # Bad key, missing deployment - stops the run
+    
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 60.0, max_retry_after: float = 120.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+    
+    def max_retries_for(self, error_class: str, max_retries: int) -> int:
+        """Retries allowed for an error class; max_retries is the transient budget"""
+        return {
+            self.TRANSIENT: max_retries,
+            self.THROTTLED: max_retries + 3,
+            self.MALFORMED_OUTPUT: min(max_retries, 2),
+            self.TRUNCATED: 2,
+        }.get(error_class, 0)
+    
+    def classify(self, error: BaseException) -> str:
+        """Sort a failed attempt into an error class"""
+        if isinstance(error, TranslationOutputError):
+            return error.error_class
+        if isinstance(error, ClientAuthenticationError):
+            return self.AUTH_CONFIG
+        
+        status_code = getattr(error, 'status_code', None)
+        if isinstance(error, HttpResponseError) and status_code:
+            if status_code in (429, 503):
+                return self.THROTTLED
+            if status_code in (401, 403, 404):
+                return self.AUTH_CONFIG
+            error_code = str(getattr(getattr(error, 'error', None), 'code', '') or '').lower()
+            message = str(error).lower()
+            if 'content_filter' in error_code or 'content_filter' in message or 'content management policy' in message:
+                return self.CONTENT_FILTERED
+            if 400 <= status_code < 500 and status_code != 408:
+                return self.REJECTED
+        
+        return self.TRANSIENT
+    
+    def retry_after(self, error: BaseException) -> float:
+        """Seconds the service asked us to wait, or None if it didn't say"""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+        headers = {name.lower(): value for name, value in headers.items()}
+        
+        for name in ('retry-after-ms', 'x-ms-retry-after-ms'):
+            value = headers.get(name)
+            if value:
+                try:
+                    return float(value) / 1000
+                except ValueError:
+                    pass
+        
+        value = headers.get('retry-after')
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                try:
+                    # HTTP-date form
+                    retry_at = parsedate_to_datetime(value)
+                    return max(0.0, (retry_at - datetime.now(retry_at.tzinfo)).total_seconds())
+                except (TypeError, ValueError):
+                    pass
+        return None
+    
+    def delay(self, attempt: int, error: BaseException = None) -> float:
+        """Seconds to wait before retry number `attempt + 1`"""
+        retry_after = self.retry_after(error) if error is not None else None
+        if retry_after is not None:
+            # Wait at least as long as asked, plus a little jitter to stagger workers
+            return min(retry_after, self.max_retry_after) + random.uniform(0, self.base_delay)
+        
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(self.base_delay / 2, max(ceiling, self.base_delay / 2))
+
+class CircuitBreaker:
+    """Stops sending requests to an endpoint that keeps failing and probes for recovery
+    
+    After `failure_threshold` transient failures in a row the breaker opens
+    and requests wait instead of hammering the endpoint. Every
+    `recovery_timeout` seconds one probe request is let through (half-open);
+    any answer from the service closes the breaker again. Once it has been
+    open for `max_open_time`, waiting requests are deferred instead so a
+    batch doesn't grind on against a dead endpoint.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 15.0, max_open_time: float = 120.0):
+        self._lock = threading.Lock()
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.max_open_time = max_open_time
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0  # When the current outage started
+        self._next_probe = 0.0
+        self._probe_started = 0.0
+        
+        # Stats and recent events for the run log
+        self.open_count = 0
+        self.probe_count = 0
+        self.deferred_count = 0
+        self.events = deque(maxlen=50)
+        self._unreported_events = []
+    
+    def reset(self):
+        """Give a new run a fresh start against the endpoint - it reopens quickly if still down"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+    
+    def admit(self) -> float:
+        """Return 0 if a request may go now, otherwise seconds to wait before asking again
+        
+        Raises TranslationDeferredException once the endpoint has been down
+        longer than max_open_time.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return 0.0
+            
+            now = time.monotonic()
+            probe_lost = self.state == self.HALF_OPEN and now - self._probe_started > self.recovery_timeout * 4
+            if (self.state == self.OPEN and now >= self._next_probe) or probe_lost:
+                self.state = self.HALF_OPEN
+                self._probe_started = now
+                self.probe_count += 1
+                return 0.0
+            
+            outage = now - self._opened_at
+            if outage >= self.max_open_time:
+                self.deferred_count += 1
+                raise TranslationDeferredException(f"Endpoint unavailable for {outage:.0f}s (circuit breaker open)")
+            
+            if self.state == self.OPEN:
+                return min(max(self._next_probe - now, 0.05), 1.0)
+            return 0.25  # Probe in flight - check back soon
+    
+    def record_success(self):
+        """The service answered - close the breaker"""
+        with self._lock:
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                self._log_event(f"🟢 circuit closed - endpoint recovered after {time.monotonic() - self._opened_at:.0f}s")
+    
+    def record_failure(self):
+        """A request failed in a way that points at the endpoint itself"""
+        with self._lock:
+            self.consecutive_failures += 1
+            now = time.monotonic()
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+                self._next_probe = now + self.recovery_timeout
+                self._log_event(f"🔴 recovery probe failed - circuit stays open")
+            elif self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = now
+                self._next_probe = now + self.recovery_timeout
+                self.open_count += 1
+                self._log_event(f"🔴 circuit opened after {self.consecutive_failures} failures in a row")
+    
+    def _log_event(self, message: str):
+        self.events.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        self._unreported_events.append(message)
+    
+    def drain_events(self) -> List[str]:
+        """Events since the last call, for incremental run logging"""
+        with self._lock:
+            events, self._unreported_events = self._unreported_events, []
+            return events
+    
+    def describe(self) -> str:
+        """One-line summary for the run log"""
+        return (f"{self.state}, opened {self.open_count} times, {self.probe_count} recovery probes, "
+                f"{self.deferred_count} requests deferred")
+
+class RetryBudget:
+    """Run-wide cap on retries as a share of first attempts
+    
+    Per-request retry limits still let a sick endpoint multiply the load by
+    the retry count. This allows `min_retries` plus `ratio` retries per
+    request across the whole run; beyond that, failing work is deferred.
+    """
+    
+    def __init__(self, ratio: float = 0.2, min_retries: int = 20):
+        self._lock = threading.Lock()
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.reset()
+    
+    def reset(self):
+        """Start a new run"""
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.exhausted_count = 0
+    
+    def allowed(self) -> int:
+        """Retries the run may use so far"""
+        return int(self.min_retries + self.ratio * self.requests)
+    
+    def record_request(self):
+        """Count a first attempt - each one earns `ratio` retries"""
+        with self._lock:
+            self.requests += 1
+    
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, or return False if none are left"""
+        with self._lock:
+            if self.retries >= self.allowed():
+                self.exhausted_count += 1
+                return False
+            self.retries += 1
+            return True
+    
+    def describe(self) -> str:
+        """One-line summary for the run log"""
+        return f"{self.retries}/{self.allowed()} retries used for {self.requests} requests"
+
+class HedgePolicy:
+    """Decides when a slow request gets a duplicate ("hedge") and keeps score
+    
+    Off until a latency percentile is configured. A request still running at
+    that percentile of recent latencies is sent again and the first good
+    answer wins. Hedges are capped at `max_hedge_ratio` of requests and only
+    go out when the rate and concurrency limiters have room right now, so
+    they never hold up first attempts.
+    """
+    
+    MIN_SAMPLES = 20  # Latencies needed before the percentile means anything
+    
+    def __init__(self, percentile: float = None, max_hedge_ratio: float = 0.1, window: int = 200):
+        self._lock = threading.Lock()
+        self.percentile = None
+        self.max_hedge_ratio = max_hedge_ratio
+        self._latencies = deque(maxlen=window)
+        
+        # Stats for the run log
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        self.losses = 0
+        
+        self.configure(percentile, max_hedge_ratio)
+    
+    def configure(self, percentile: float = None, max_hedge_ratio: float = None):
+        """Set the hedging percentile (0 turns hedging off) and the cap on hedged requests"""
+        with self._lock:
+            if percentile is not None:
+                self.percentile = min(99.9, float(percentile)) if percentile > 0 else None
+            if max_hedge_ratio is not None:
+                self.max_hedge_ratio = min(1.0, max(0.0, float(max_hedge_ratio)))
+    
+    @property
+    def enabled(self) -> bool:
+        return self.percentile is not None
+    
+    def record_latency(self, latency: float):
+        """Add the latency of a completed request"""
+        with self._lock:
+            self._latencies.append(latency)
+    
+    def hedge_delay(self) -> float:
+        """Seconds to wait before hedging, or None when hedging is off or not warmed up yet"""
+        with self._lock:
+            if self.percentile is None or len(self._latencies) < self.MIN_SAMPLES:
+                return None
+            latencies = sorted(self._latencies)
+            return latencies[min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))]
+    
+    def record_request(self):
+        """Count a request sent with hedging armed"""
+        with self._lock:
+            self.requests += 1
+    
+    def try_hedge(self) -> bool:
+        """Claim a hedge under the cap"""
+        with self._lock:
+            if self.hedges >= self.max_hedge_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+    
+    def cancel_hedge(self):
+        """Return a claimed hedge that couldn't be sent"""
+        with self._lock:
+            self.hedges -= 1
+    
+    def record_outcome(self, hedge_won: bool):
+        """Score a hedged race"""
+        with self._lock:
+            if hedge_won:
+                self.wins += 1
+            else:
+                self.losses += 1
+    
+    def describe(self) -> str:
+        """One-line summary for the run log"""
+        if self.percentile is None:
+            return "off"
+        return (f"p{self.percentile:g} - {self.hedges}/{self.requests} requests hedged "
+                f"(cap {self.max_hedge_ratio:.0%}), {self.wins} hedge wins, {self.losses} losses")
+
+class OutputTokenModel:
+    """Learns how long translations run, to size max_tokens per language pair and content type
+    
+    Every finished request records its output tokens per source token under
+    a key like "ko-en/paragraph". max_tokens is then the key's 95th-percentile
+    ratio times the chunk's source tokens, plus a safety margin - instead of
+    len(text) + 500, which over-reserves TPM quota on long chunks and runs
+    short on dialogue. Keys with too few samples keep the old reservation.
+    Ratios are saved as JSON so each run starts from what earlier runs saw.
+    """
+    
+    MIN_SAMPLES = 20  # Ratios needed before a key's percentile is trusted
+    PERCENTILE = 95
+    WINDOW = 500  # Most recent ratios kept per key
+    HEADROOM_TOKENS = 64  # Fixed extra on top of the margin, for very short chunks
+    
+    def __init__(self, path: Path = None, margin: float = 1.2, max_output_tokens: int = 8192):
+        self._lock = threading.Lock()
+        self.path = Path(path) if path else None
+        self.margin = margin
+        self.max_output_tokens = max_output_tokens
+        self._ratios = {}  # Key -> deque of output/source token ratios
+        
+        # Stats for the run log
+        self.requests = 0
+        self.reserved_tokens = 0
+        self.used_tokens = 0
+        self.truncated = 0
+        self.continued = 0
+        self.incomplete = 0
+        
+        self.load()
+    
+    @staticmethod
+    def key(language_pair: str, element_type: str) -> str:
+        return f"{language_pair}/{element_type}"
+    
+    def ratio(self, key: str) -> float:
+        """The key's high-percentile output/source ratio, or None while it has too few samples"""
+        with self._lock:
+            samples = self._ratios.get(key)
+            if not samples or len(samples) < self.MIN_SAMPLES:
+                return None
+            ratios = sorted(samples)
+        return ratios[min(len(ratios) - 1, int(len(ratios) * self.PERCENTILE / 100))]
+    
+    def max_tokens(self, korean_text: str, key: str) -> int:
+        """Completion tokens to reserve for translating a chunk"""
+        ratio = self.ratio(key)
+        if ratio is None:
+            reserve = len(korean_text) + 500
+        else:
+            reserve = int(estimate_tokens(korean_text) * ratio * self.margin) + self.HEADROOM_TOKENS
+        return min(reserve, self.max_output_tokens)
+    
+    def record_continuation(self):
+        """Count a reply that was cut off and continued"""
+        with self._lock:
+            self.continued += 1
+    
+    def record_incomplete(self):
+        """Count a reply still cut off after its last continuation"""
+        with self._lock:
+            self.incomplete += 1
+    
+    def enlarge(self, max_tokens: int) -> int:
+        """The reservation for retrying a truncated translation"""
+        with self._lock:
+            self.truncated += 1
+        return min(max_tokens * 2, self.max_output_tokens)
+    
+    def record(self, korean_text: str, key: str, output_tokens: int, max_tokens: int):
+        """Learn from a finished translation - output_tokens includes any continuations"""
+        ratio = output_tokens / max(1, estimate_tokens(korean_text))
+        with self._lock:
+            self._ratios.setdefault(key, deque(maxlen=self.WINDOW)).append(round(ratio, 4))
+            self.requests += 1
+            self.reserved_tokens += max_tokens
+            self.used_tokens += output_tokens
+    
+    def reset_stats(self):
+        """Zero the per-run counters (learned ratios are kept)"""
+        with self._lock:
+            self.requests = 0
+            self.reserved_tokens = 0
+            self.used_tokens = 0
+            self.truncated = 0
+            self.continued = 0
+            self.incomplete = 0
+    
+    def load(self):
+        """Read saved ratios, if any"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            with self._lock:
+                for key, ratios in saved.get("ratios", {}).items():
+                    self._ratios[key] = deque((float(ratio) for ratio in ratios), maxlen=self.WINDOW)
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"⚠️ Could not read output sizing history {self.path}: {e}")
+    
+    def save(self):
+        """Write the learned ratios next to the application"""
+        if not self.path:
+            return
+        with self._lock:
+            saved = {"ratios": {key: list(ratios) for key, ratios in self._ratios.items()}}
+        try:
+            temp_path = self.path.with_suffix('.json.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(saved, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save output sizing history {self.path}: {e}")
+    
+    def describe(self) -> str:
+        """Short summary for logs"""
+        with self._lock:
+            keys = sorted(self._ratios)
+            requests, reserved, used = self.requests, self.reserved_tokens, self.used_tokens
+            truncated, continued, incomplete = self.truncated, self.continued, self.incomplete
+        learned = []
+        for key in keys:
+            ratio = self.ratio(key)
+            learned.append(f"{key} ×{ratio:.2f}" if ratio is not None else f"{key} learning")
+        summary = ", ".join(learned) or "no history yet"
+        summary += f" (margin ×{self.margin:g})"
+        if requests:
+            summary += f" - reserved {reserved:,} / used {used:,} output tokens over {requests} requests"
+        if continued:
+            summary += f", {continued} cut-off replies continued"
+        if incomplete:
+            summary += f", {incomplete} still cut off after continuing"
+        if truncated:
+            summary += f", {truncated} truncated and retried larger"
+        return summary
+
+class ChunkSizeTuner:
+    """Picks the text chunk size that translates a run fastest on each set of deployments
+    
+    Bigger chunks spend less of each request on the prompt but time out and
+    get cut off more; smaller ones waste the prompt overhead but run more
+    requests side by side. So each size is scored by whole-run throughput:
+    the characters a run's text chunks delivered over the wall time any of
+    them was in flight (retries and continuations included, failed requests
+    delivering nothing). Per-request characters per second would ignore
+    concurrency and favour big chunks. Runs are filed under the deployments
+    that served them and the text chunk target they were planned with (as
+    the nearest SIZES step). At the start of a run choose() returns the step
+    with the best throughput, or first tries an untested step next to it -
+    so the size walks towards the best one a step per run. History is saved
+    as JSON between runs.
+    """
+    
+    SIZES = (400, 600, 900, 1200, 1500, 1800, 2400, 3000, 4000)  # Text chunk targets, in tokens
+    MIN_SAMPLES = 10  # Requests needed before a size's throughput is trusted
+    WINDOW = 20  # Most recent runs kept per deployment set and size
+    
+    def __init__(self, path: Path = None, size: int = 1800):
+        self._lock = threading.Lock()
+        self.path = Path(path) if path else None
+        self.size = size  # Text chunk target in force - set whenever the chunk budget changes
+        self._runs = {}  # Deployments -> size -> deque of [characters, seconds, requests, failed, cut off] per run
+        self._run = None  # (deployments, size, requests) of the run in progress
+        self.chosen = None  # (size, reason) from the last choose()
+        self.load()
+    
+    @staticmethod
+    def deployments(backends: List) -> str:
+        return "+".join(sorted(f"{backend.name}/{backend.model_name}" for backend in backends))
+    
+    def nearest_size(self, tokens: int) -> int:
+        return min(self.SIZES, key=lambda size: abs(math.log(max(1, tokens) / size)))
+    
+    def begin_run(self, backends: List):
+        """Start collecting the text chunk requests of a run on these deployments"""
+        with self._lock:
+            self._run = (self.deployments(backends), self.nearest_size(self.size), [])
+    
+    def record(self, korean_text: str, started: float, finished: float, succeeded: bool, cut_off: bool = False):
+        """Add one text chunk request of the current run - times are time.monotonic()"""
+        with self._lock:
+            if self._run is not None:
+                self._run[2].append((started, finished, len(korean_text) if succeeded else 0, succeeded, cut_off))
+    
+    def end_run(self):
+        """File the current run's throughput under its deployments and size"""
+        with self._lock:
+            run, self._run = self._run, None
+        if not run or not run[2]:
+            return
+        deployments, size, requests = run
+        
+        # Wall time with at least one request in flight
+        busy, busy_until = 0.0, None
+        for started, finished, *_ in sorted(requests):
+            if busy_until is None or started > busy_until:
+                busy += finished - started
+                busy_until = finished
+            elif finished > busy_until:
+                busy += finished - busy_until
+                busy_until = finished
+        
+        sample = [sum(request[2] for request in requests), round(busy, 3), len(requests),
+                  sum(not request[3] for request in requests), sum(bool(request[4]) for request in requests)]
+        with self._lock:
+            sizes = self._runs.setdefault(deployments, {})
+            sizes.setdefault(size, deque(maxlen=self.WINDOW)).append(sample)
+    
+    def size_stats(self, deployments: str) -> Dict[int, Dict]:
+        """Runs, requests, failures, cut-offs and characters per second per size on a deployment set"""
+        stats = {}
+        with self._lock:
+            for size, runs in self._runs.get(deployments, {}).items():
+                entry = stats[size] = {"runs": len(runs), "requests": 0, "characters": 0, "seconds": 0.0,
+                                       "failed": 0, "cut_off": 0}
+                for characters, seconds, requests, failed, cut_off in runs:
+                    entry["characters"] += characters
+                    entry["seconds"] += seconds
+                    entry["requests"] += requests
+                    entry["failed"] += failed
+                    entry["cut_off"] += cut_off
+        for entry in stats.values():
+            entry["rate"] = entry["characters"] / max(entry["seconds"], 0.001)
+        return stats
+    
+    def choose(self, backends: List, current: int, limit: int) -> int:
+        """Text chunk size for the next run - current until some size has enough history"""
+        stats = self.size_stats(self.deployments(backends))
+        sizes = [size for size in self.SIZES if size <= limit] or [min(self.SIZES)]
+        trusted = [size for size in sizes if stats.get(size, {}).get("requests", 0) >= self.MIN_SAMPLES]
+        
+        if not trusted:
+            size, reason = current, "learning"
+        else:
+            best = max(trusted, key=lambda size: stats[size]["rate"])
+            position = sizes.index(best)
+            # Larger first - fewer requests if it holds up
+            untested = [sizes[i] for i in (position + 1, position - 1)
+                        if 0 <= i < len(sizes) and sizes[i] not in trusted]
+            if untested:
+                size, reason = untested[0], f"trying next to {best:,} ({stats[best]['rate']:.0f} chars/s)"
+            else:
+                size, reason = best, f"best measured, {stats[best]['rate']:.0f} chars/s"
+        self.size = size
+        self.chosen = (size, reason)
+        return size
+    
+    def load(self):
+        """Read saved history, if any"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            with self._lock:
+                for deployments, sizes in saved.get("runs", {}).items():
+                    self._runs[deployments] = {
+                        int(size): deque(([float(characters), float(seconds), int(requests), int(failed), int(cut_off)]
+                                          for characters, seconds, requests, failed, cut_off in runs), maxlen=self.WINDOW)
+                        for size, runs in sizes.items()
+                    }
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"⚠️ Could not read chunk size history {self.path}: {e}")
+    
+    def save(self):
+        """Write the history next to the application"""
+        if not self.path:
+            return
+        with self._lock:
+            saved = {"runs": {deployments: {str(size): list(runs) for size, runs in sizes.items()}
+                              for deployments, sizes in self._runs.items()}}
+        try:
+            temp_path = self.path.with_suffix('.json.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(saved, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save chunk size history {self.path}: {e}")
+    
+    def describe(self, backends: List) -> str:
+        """Short summary for logs - the chosen size and what each measured size achieved"""
+        stats = self.size_stats(self.deployments(backends))
+        measured = []
+        for size in sorted(stats):
+            entry = stats[size]
+            measured.append(f"{size:,}: {entry['rate']:.0f} chars/s over {entry['runs']} runs, {entry['requests']} requests "
+                            f"({entry['failed']} failed, {entry['cut_off']} cut off)")
+        summary = f"{self.chosen[0]:,} tokens ({self.chosen[1]})" if self.chosen else "not chosen yet"
+        return summary + (" - " + "; ".join(measured) if measured else " - no history yet")
+
+class TranslationMemory:
+    """On-disk cache of finished chunk translations, with a hot in-memory LRU tier
+    
+    Entries are keyed by a hash of everything that shapes the translation:
+    the source text, the glossary entries that occur in it, the context,
+    element type, model and PROMPT_VERSION. Editing one glossary term only
+    invalidates the chunks that contain it. The SQLite file is capped at
+    `max_entries`; the least recently used entries are evicted first.
+    
+    A MinHash/LSH index over character bigrams (digits masked) finds near
+    duplicates - recaps and status windows that differ by a name or number.
+    A match that differs only in its numbers is reused with the numbers
+    swapped; other matches above `fuzzy_threshold` are given to the model as
+    a reference translation.
+    """
+    
+    NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)*')
+    SHINGLE_SIZE = 2  # Hangul syllables carry a lot each - bigrams keep small edits above the threshold
+    BANDS = 10
+    ROWS_PER_BAND = 3
+    MIN_SHINGLES = 8  # Titles and other short texts aren't worth a fuzzy lookup
+    MAX_CANDIDATES = 20
+    HASH_PRIME = (1 << 61) - 1
+    
+    def __init__(self, path, max_entries: int = 200000, hot_entries: int = 2000, fuzzy_threshold: float = 0.7):
+        self._lock = threading.Lock()
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.hot_entries = hot_entries
+        self._hot = OrderedDict()
+        self.fuzzy_threshold = fuzzy_threshold
+        
+        # Fixed seed - signatures are stored, so the permutations must be the same in every run
+        rng = random.Random(1)
+        self._permutations = [(rng.randrange(1, self.HASH_PRIME), rng.randrange(self.HASH_PRIME))
+                              for _ in range(self.BANDS * self.ROWS_PER_BAND)]
+        
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")  # Other runs can read while this one writes
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS memory ("
+            "key TEXT PRIMARY KEY, source TEXT NOT NULL, translation TEXT NOT NULL, "
+            "created REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS memory_last_used ON memory (last_used)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS memory_lsh (band INTEGER NOT NULL, bucket TEXT NOT NULL, key TEXT NOT NULL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS memory_lsh_bucket ON memory_lsh (band, bucket)")
+        self.entries = self._db.execute("SELECT COUNT(*) FROM memory").fetchone()[0]
+        self.reset_stats()
+    
+    def reset_stats(self):
+        """Start counting hits and misses for a new run"""
+        with self._lock:
+            self.hot_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.stores = 0
+            self.evicted = 0
+            self.chars_saved = 0
+            self.fuzzy_reused = 0
+            self.fuzzy_references = 0
+    
+    @staticmethod
+    def relevant_glossary(korean_text: str, glossary_terms: str) -> List[str]:
+        """The "- korean → english (type)" glossary lines whose Korean term occurs in the text"""
+        relevant = []
+        for line in glossary_terms.splitlines():
+            korean_term = line[2:].split(" → ", 1)[0] if line.startswith("- ") else line
+            if korean_term and korean_term in korean_text:
+                relevant.append(line)
+        return sorted(relevant)
+    
+    def key(self, korean_text: str, glossary_terms: str, context: str, element_type: str, model_name: str) -> str:
+        """Hash of everything that shapes a chunk's translation"""
+        parts = [PROMPT_VERSION, model_name, element_type, context or "", korean_text,
+                 *self.relevant_glossary(korean_text, glossary_terms or "")]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> str:
+        """Cached translation for a key, or None"""
+        with self._lock:
+            entry = self._hot.get(key)
+            if entry is not None:
+                self._hot.move_to_end(key)
+                self.hot_hits += 1
+            else:
+                entry = self._db.execute(
+                    "SELECT translation, length(source) FROM memory WHERE key = ?", (key,)
+                ).fetchone()
+                if entry is None:
+                    self.misses += 1
+                    return None
+                self._db.execute("UPDATE memory SET last_used = ? WHERE key = ?", (time.time(), key))
+                self._remember_hot(key, entry)
+                self.disk_hits += 1
+            
+            translation, source_chars = entry
+            self.chars_saved += source_chars
+            return translation
+    
+    def put(self, key: str, korean_text: str, translation: str):
+        """Store a finished translation, evicting the least recently used entries over the cap"""
+        now = time.time()
+        shingles = self.shingles(korean_text)
+        bands = self.bands(shingles) if self.fuzzy_threshold and len(shingles) >= self.MIN_SHINGLES else []
+        
+        with self._lock:
+            inserted = self._db.execute(
+                "INSERT OR IGNORE INTO memory (key, source, translation, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, korean_text, translation, now, now)
+            ).rowcount
+            if inserted:
+                self._db.executemany("INSERT INTO memory_lsh (band, bucket, key) VALUES (?, ?, ?)",
+                                     [(band, bucket, key) for band, bucket in bands])
+            else:
+                self._db.execute("UPDATE memory SET translation = ?, last_used = ? WHERE key = ?",
+                                 (translation, now, key))
+            self.entries += inserted
+            self.stores += 1
+            self._remember_hot(key, (translation, len(korean_text)))
+            
+            if self.entries > self.max_entries:
+                # Evict a tenth at a time so the DELETE isn't run on every store
+                excess = self.entries - int(self.max_entries * 0.9)
+                self._db.execute(
+                    "DELETE FROM memory WHERE key IN (SELECT key FROM memory ORDER BY last_used LIMIT ?)", (excess,)
+                )
+                self._db.execute("DELETE FROM memory_lsh WHERE key NOT IN (SELECT key FROM memory)")
+                self.entries = self._db.execute("SELECT COUNT(*) FROM memory").fetchone()[0]
+                self.evicted += excess
+                self._hot.clear()
+    
+    def shingles(self, text: str) -> set:
+        """Character bigrams of the text with whitespace dropped and every number masked"""
+        text = re.sub(r'\s+', '', self.NUMBER_PATTERN.sub("0", text))
+        size = self.SHINGLE_SIZE
+        return {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+    
+    def bands(self, shingles: set) -> List[Tuple[int, str]]:
+        """LSH buckets of the MinHash signature - texts sharing any bucket are candidates"""
+        values = [int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+                  for shingle in shingles]
+        prime = self.HASH_PRIME
+        signature = [min((a * value + b) % prime for value in values) for a, b in self._permutations]
+        
+        rows = self.ROWS_PER_BAND
+        return [(band, hashlib.blake2b(repr(signature[band * rows:(band + 1) * rows]).encode(), digest_size=8).hexdigest())
+                for band in range(self.BANDS)]
+    
+    def find_similar(self, korean_text: str, glossary_terms: str, context: str, element_type: str,
+                     model_name: str) -> Dict:
+        """Closest earlier translation above the similarity threshold, or None
+        
+        "reuse" holds a ready translation when the texts differ only in their
+        numbers and were translated with the same settings; otherwise the
+        entry is only good as a reference.
+        """
+        if not self.fuzzy_threshold:
+            return None
+        shingles = self.shingles(korean_text)
+        if len(shingles) < self.MIN_SHINGLES:
+            return None
+        bands = self.bands(shingles)
+        
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT m.key, m.source, m.translation FROM memory_lsh l JOIN memory m ON m.key = l.key WHERE " +
+                " OR ".join(["(l.band = ? AND l.bucket = ?)"] * len(bands)) +
+                " GROUP BY m.key ORDER BY COUNT(*) DESC LIMIT ?",
+                [value for band in bands for value in band] + [self.MAX_CANDIDATES]
+            ).fetchall()
+        
+        best = None
+        for key, source, translation in rows:
+            candidate = self.shingles(source)
+            similarity = len(shingles & candidate) / len(shingles | candidate)
+            if similarity >= self.fuzzy_threshold and (best is None or similarity > best["similarity"]):
+                best = {"key": key, "source": source, "translation": translation, "similarity": similarity}
+        if best is None:
+            return None
+        
+        best["reuse"] = None
+        if (self.NUMBER_PATTERN.sub("0", best["source"]) == self.NUMBER_PATTERN.sub("0", korean_text)
+                and self.key(best["source"], glossary_terms, context, element_type, model_name) == best["key"]):
+            best["reuse"] = self.replace_numbers(best["translation"], best["source"], korean_text)
+        
+        with self._lock:
+            if best["reuse"] is not None:
+                self.fuzzy_reused += 1
+                self.chars_saved += len(korean_text)
+            else:
+                self.fuzzy_references += 1
+        return best
+    
+    def replace_numbers(self, translation: str, old_source: str, new_source: str) -> str:
+        """Swap the old source's numbers for the new ones, or None if the translation doesn't carry them over as-is"""
+        old_numbers = self.NUMBER_PATTERN.findall(old_source)
+        if self.NUMBER_PATTERN.findall(translation) != old_numbers:
+            return None
+        new_numbers = iter(self.NUMBER_PATTERN.findall(new_source))
+        return self.NUMBER_PATTERN.sub(lambda match: next(new_numbers), translation)
+    
+    def _remember_hot(self, key: str, entry: Tuple[str, int]):
+        self._hot[key] = entry
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_entries:
+            self._hot.popitem(last=False)
+    
+    def close(self):
+        with self._lock:
+            self._db.close()
+    
+    def describe(self) -> str:
+        """One-line summary for the run log"""
+        hits = self.hot_hits + self.disk_hits
+        return (f"{hits} hits ({self.hot_hits} in memory), {self.misses} misses, {self.stores} stored, "
+                f"{self.fuzzy_reused} near-duplicates reused, {self.fuzzy_references} sent with a reference, "
+                f"{self.chars_saved:,} characters not re-sent - {self.entries:,}/{self.max_entries:,} entries "
+                f"in {self.path.name}" + (f", {self.evicted} evicted" if self.evicted else ""))
+
 class AzureDeepSeekTranslator:
     """Azure AI DeepSeek for direct Korean-to-English translation with glossary support"""
     
-    def __init__(self, endpoint: str, api_key: str):
+    # A reply cut off at max_tokens is continued this many times before the request is retried with more room
+    MAX_CONTINUATIONS = 3
+    CONTINUE_PROMPT = ("Your translation was cut off. Continue it exactly where it stopped - output only the rest "
+                       "of the English translation, without repeating anything already written.")
+    
+    def __init__(self, endpoint: str, api_key: str, max_in_flight: int = 32):
         """Initialize Azure AI DeepSeek client"""
         self.endpoint = endpoint
         self.api_key = api_key
         self.model_name = AZURE_AI_MODEL
         self.working = False
         
+        # Adaptive cap on concurrent requests shared by every file and chunk worker
+        self.max_in_flight = max(1, max_in_flight)
+        self.concurrency_limiter = self.create_concurrency_limiter(self.max_in_flight)
+        
+        # RPM/TPM pacing shared with every other translator on this deployment
+        self.rate_limiter = get_rate_limiter(self.endpoint, self.model_name)
+        self.retry_policy = RetryPolicy()
+        
+        # Stop calling an endpoint that is down, and cap retries across the whole run
+        self.circuit_breaker = CircuitBreaker()
+        self.retry_budget = RetryBudget()
+        
+        # Optional duplicate requests for the slow tail
+        self.hedge_policy = HedgePolicy()
+        self._hedge_executor = None
+        
+        # Per-request network timeouts in seconds - a stalled connection must not hang a worker
+        self.connect_timeout = 10.0
+        self.read_timeout = 180.0  # Covers generating a full chunk before the first byte arrives
+        
+        # Routing data when this translator is one backend of an AzureDeepSeekPool
+        self.name = urlparse(endpoint).netloc or endpoint
+        self.weight = 1.0
+        self.config_suffix = ""  # "_2" for the ENDPOINT_2 / API_KEY_2 settings, etc.
+        self.latency_ewma = None
+        self.requests_sent = 0
+        
+        # Set once an auth/config error proves no request can succeed
+        self.fatal_error = None
+        
+        # Optional TranslationMemory checked before any request is sent
+        self.translation_memory = None
+        
+        # Optional OutputTokenModel sizing max_tokens, keyed by language pair and element type
+        self.output_sizing = None
+        self.language_pair = "ko-en"
+        
+        # Optional ChunkSizeTuner timing every request against its chunk size
+        self.chunk_tuning = None
+        
         try:
             print("🔧 Setting up Azure AI DeepSeek client...")
             
-            self.client = ChatCompletionsClient(
-                endpoint=self.endpoint,
-                credential=AzureKeyCredential(self.api_key),
-                api_version="2024-05-01-preview"
-            )
+            self.client = self.create_client()
             
             # Only validate credentials format, don't test connection
             if endpoint and api_key and len(api_key) > 20:
@@ -87,6 +1582,19 @@ class AzureDeepSeekTranslator:
         except Exception as e:
             print(f"❌ Azure AI DeepSeek setup failed: {e}")
     
+    def create_client(self):
+        """Create the Azure AI inference client"""
+        return ChatCompletionsClient(
+            endpoint=self.endpoint,
+            credential=AzureKeyCredential(self.api_key),
+            api_version="2024-05-01-preview",
+            retry_total=0  # Retries are ours, so throttling reaches the concurrency limiter
+        )
+    
+    def create_concurrency_limiter(self, max_limit: int):
+        """Create the adaptive limiter that caps concurrent requests"""
+        return AdaptiveConcurrencyLimiter(max_limit)
+    
     def test_connection(self):
         """Test if Azure AI DeepSeek is working - ONLY call this when explicitly needed"""
         try:
@@ -102,7 +1610,9 @@ class AzureDeepSeekTranslator:
                 top_p=0.95,
                 presence_penalty=0.0,
                 frequency_penalty=0.0,
-                model=self.model_name
+                model=self.model_name,
+                connection_timeout=self.connect_timeout,
+                read_timeout=self.read_timeout
             )
             
             if response.choices and len(response.choices) > 0:
@@ -120,21 +1630,18 @@ class AzureDeepSeekTranslator:
             self.working = False
             return False, str(e)
     
-    def translate_with_glossary(self, korean_text: str, glossary_terms: str = "", context: str = "", element_type: str = "text", max_retries: int = 5) -> str:
-        """Translate Korean text directly to English using DeepSeek with glossary support and better error handling"""
+    def build_messages(self, korean_text: str, glossary_terms: str = "", context: str = "", element_type: str = "text",
+                       reference: Dict = None, placeholders: bool = False) -> List:
+        """Build the system and user messages for a translation request
         
-        if not self.working:
-            print(f"      ❌ Azure AI DeepSeek not available")
-            raise TranslationFailedException("Azure AI DeepSeek not available")
-        
-        # Skip very short or empty chunks
-        if not korean_text.strip() or len(korean_text.strip()) < 3:
-            return korean_text
+        reference is a similar earlier translation from the translation memory
+        ({"source": ..., "translation": ...}) whose wording should be kept.
+        With placeholders, glossary_terms is the placeholder legend rather
+        than a list of translations.
+        """
         
-        for attempt in range(max_retries + 1):
-            try:
-                # Build comprehensive prompt for direct translation
-                system_prompt = """You are an expert Korean-to-English translator specializing in novels and literature. 
+        # Build comprehensive prompt for direct translation
+        system_prompt = """You are an expert Korean-to-English translator specializing in novels and literature. 
                 You are translating Korean fiction/literature to English.
                 This is creative content from published novels and stories.
                 The content includes fictional scenarios, fantasy elements, and dramatic situations.
@@ -154,87 +1661,497 @@ class AzureDeepSeekTranslator:
                 - Do not mention the translation process
                 - Just provide the clean English text"""
 
-                # Build user prompt with element context
-                element_context = {
-                    "title": "page title",
-                    "heading": "section heading", 
-                    "paragraph": "story content",
-                    "text": "general text"
-                }
-                
-                user_prompt = f"""Translate this Korean {element_context.get(element_type, 'text')} to natural, fluent English.
+        # Build user prompt with element context
+        element_context = {
+            "title": "page title",
+            "heading": "section heading", 
+            "paragraph": "story content",
+            "text": "general text"
+        }
+        
+        user_prompt = f"""Translate this Korean {element_context.get(element_type, 'text')} to natural, fluent English.
 
 Context: {context if context else "Korean novel/literature"}"""
 
-                if glossary_terms:
-                    user_prompt += f"""
+        if glossary_terms and placeholders:
+            user_prompt += f"""
+
+IMPORTANT - Names and terms are written as placeholders like ⟦A⟧. Copy each placeholder unchanged into the English where that name or term belongs:
+{glossary_terms}"""
+        elif glossary_terms:
+            user_prompt += f"""
 
 IMPORTANT - Use these specific translations for character names and terms:
 {glossary_terms}
 
 Make sure to use these exact English names/terms when they appear in the text."""
 
-                user_prompt += f"""
+        if reference:
+            user_prompt += f"""
+
+A very similar passage was translated before. Reuse its wording wherever the Korean is the same, and translate only what differs:
+Korean: {reference["source"]}
+English: {reference["translation"]}"""
+
+        user_prompt += f"""
 
 Korean {element_type} to translate:
 {korean_text}
 
 English translation:"""
 
-                response = self.client.complete(
-                    messages=[
-                        SystemMessage(content=system_prompt),
-                        UserMessage(content=user_prompt)
-                    ],
-                    max_tokens=len(korean_text) + 500,  # Allow for expansion
-                    temperature=0.1,  # Low temperature for consistent translation
-                    top_p=0.95,
-                    presence_penalty=0.0,
-                    frequency_penalty=0.0,
-                    model=self.model_name
-                )
-                
-                if response.choices and len(response.choices) > 0:
-                    english_text = response.choices[0].message.content
-                    
-                    # Check if response is None or empty
-                    if english_text is None:
-                        print(f"      ⚠️ Received None response from Azure AI DeepSeek (attempt {attempt + 1})")
-                        if attempt < max_retries:
-                            time.sleep(2)
-                            continue
-                        else:
-                            break
-                    
-                    english_text = english_text.strip()
-                    
-                    # Clean up any meta-commentary
-                    english_text = self.clean_output(english_text)
-                    
-                    # Validate that we got a reasonable translation
-                    if english_text and len(english_text) > 5 and not english_text.startswith("Translation"):
-                        print(f"      ✅ Azure AI DeepSeek translated {element_type} successfully")
-                        return english_text
-                    else:
-                        print(f"      ⚠️ Received poor translation quality, retrying... (attempt {attempt + 1})")
-                        if attempt < max_retries:
-                            time.sleep(1)
-                            continue
-                else:
-                    print(f"      ⚠️ Azure AI DeepSeek returned no response (attempt {attempt + 1})")
-                    if attempt < max_retries:
-                        time.sleep(2)
-                        continue
-                    
-            except Exception as e:
-                print(f"      ⚠️ Azure AI DeepSeek error (attempt {attempt + 1}): {e}")
-                if attempt < max_retries:
-                    time.sleep(2)
-                    continue
+        return [
+            SystemMessage(content=system_prompt),
+            UserMessage(content=user_prompt)
+        ]
+    
+    def request_options(self, korean_text: str, element_type: str = "text") -> Dict:
+        """Sampling options sent with every translation request"""
+        if self.output_sizing:
+            max_tokens = self.output_sizing.max_tokens(korean_text, self.output_key(element_type))
+        else:
+            max_tokens = len(korean_text) + 500  # Allow for expansion
+        return {
+            "max_tokens": max_tokens,
+            "temperature": 0.1,  # Low temperature for consistent translation
+            "top_p": 0.95,
+            "presence_penalty": 0.0,
+            "frequency_penalty": 0.0,
+            "model": self.model_name
+        }
+    
+    def request_timeouts(self, deadline: Deadline) -> Dict:
+        """Connect/read timeouts for the next attempt, cut short by the deadline"""
+        return {
+            "connection_timeout": deadline.clamp(self.connect_timeout),
+            "read_timeout": deadline.clamp(self.read_timeout)
+        }
+    
+    def output_key(self, element_type: str) -> str:
+        """Output sizing history this request belongs to"""
+        return OutputTokenModel.key(self.language_pair, element_type)
+    
+    def enlarge_request(self, messages: List, options: Dict) -> Tuple[Dict, int]:
+        """Options and quota cost for retrying a truncated translation with more room"""
+        if self.output_sizing:
+            max_tokens = self.output_sizing.enlarge(options["max_tokens"])
+        else:
+            max_tokens = options["max_tokens"] * 2
+        print(f"      📏 Retrying with max_tokens {max_tokens}")
+        options = {**options, "max_tokens": max_tokens}
+        return options, self.estimate_request_tokens(messages, options)
+    
+    def record_output(self, korean_text: str, element_type: str, response, options: Dict, earlier_tokens: int = 0):
+        """Feed a finished translation's length - with any parts before a continuation - into the output sizing history"""
+        if self.output_sizing:
+            output_tokens = earlier_tokens + self.completion_tokens(response)
+            self.output_sizing.record(korean_text, self.output_key(element_type), output_tokens, options["max_tokens"])
+    
+    def record_timing(self, korean_text: str, started: float, succeeded: bool, cut_off: bool):
+        """Feed a text chunk's wall time and outcome into the run's chunk size history"""
+        if self.chunk_tuning:
+            self.chunk_tuning.record(korean_text, started, time.monotonic(), succeeded, cut_off)
+    
+    @staticmethod
+    def completion_tokens(response) -> int:
+        """Output tokens of a response, as reported by the service or estimated from the text"""
+        usage = getattr(response, 'usage', None)
+        reported = getattr(usage, 'completion_tokens', None)
+        if reported:
+            return reported
+        return estimate_tokens(response.choices[0].message.content or "") if response.choices else 0
+    
+    @staticmethod
+    def is_cut_off(response) -> bool:
+        """Whether a reply stopped at max_tokens with text worth continuing"""
+        if not response.choices:
+            return False
+        choice = response.choices[0]
+        return getattr(choice, 'finish_reason', None) == "length" and bool(choice.message.content)
+    
+    def continuation_messages(self, messages: List, partial_text: str) -> List:
+        """The original request plus the reply so far, asking for the rest"""
+        return messages + [
+            AssistantMessage(content=partial_text),
+            UserMessage(content=self.CONTINUE_PROMPT)
+        ]
+    
+    @staticmethod
+    def stitch(partial_text: str, continuation: str) -> str:
+        """Append a continuation to the reply so far, dropping whole words it repeats from the end
+        
+        partial_text must end on a word boundary (see whole_words), so a seam
+        with no whitespace on either side gets a space.
+        """
+        if not partial_text or not continuation:
+            return partial_text + continuation
+        
+        # Shortest match first - repetitive prose would otherwise trim whole sentences
+        for size in range(2, min(len(partial_text), len(continuation), 200) + 1):
+            repeated = continuation[:size]
+            start = len(partial_text) - size
+            if (partial_text.endswith(repeated) and any(char.isalnum() for char in repeated)
+                    and not repeated[0].isspace()
+                    and (start == 0 or not partial_text[start - 1].isalnum())
+                    and (size == len(continuation) or not continuation[size].isalnum())):
+                return partial_text + continuation[size:]
+        
+        if (partial_text[-1].isspace() or continuation[0].isspace()
+                or continuation[0] in '.,!?;:…)]}"”’\'' or partial_text[-1] in '([{“‘-—/'):
+            return partial_text + continuation
+        return partial_text + ' ' + continuation
+    
+    @staticmethod
+    def whole_words(partial_text: str) -> str:
+        """Drop a word the cut may have split - the continuation writes it again in full"""
+        trimmed = partial_text.rstrip()
+        if trimmed and trimmed[-1].isalnum():
+            cut = max(trimmed.rfind(' '), trimmed.rfind('\n'))
+            if cut > 0:
+                trimmed = trimmed[:cut].rstrip()
+        return trimmed or partial_text
+    
+    def continue_truncated(self, backend: "AzureDeepSeekTranslator", messages: List, options: Dict,
+                           response, deadline: Deadline) -> Tuple:
+        """Ask for the rest of a reply cut off at max_tokens
+        
+        Returns (last response, text of the parts before it, their output
+        tokens). Stops after MAX_CONTINUATIONS; a reply still cut off then is
+        rejected by extract_translation, failing the chunk.
+        """
+        partial_text, earlier_tokens = "", 0
+        for _ in range(self.MAX_CONTINUATIONS):
+            if not self.is_cut_off(response):
+                break
+            partial_text = self.whole_words(self.stitch(partial_text, response.choices[0].message.content or ""))
+            earlier_tokens += self.completion_tokens(response)
+            if self.output_sizing:
+                self.output_sizing.record_continuation()
+            print(f"      ⏩ Reply hit max_tokens after {len(partial_text)} characters - asking for the rest")
+            continuation = self.continuation_messages(messages, partial_text)
+            response = backend.send_attempt(continuation, options, self.estimate_request_tokens(continuation, options),
+                                            deadline)
+        return response, partial_text, earlier_tokens
+    
+    def estimate_request_tokens(self, messages: List, options: Dict) -> int:
+        """Tokens a request counts against the TPM quota - prompt plus reserved completion"""
+        return sum(estimate_tokens(message.content) for message in messages) + options.get("max_tokens", 0)
+    
+    def on_raw_response(self, pipeline_response):
+        """Feed rate-limit headers from every response back into the limiter"""
+        try:
+            self.rate_limiter.update_from_headers(pipeline_response.http_response.headers)
+        except Exception:
+            pass
+    
+    def extract_translation(self, response, element_type: str, partial_text: str = "") -> str:
+        """Return the cleaned translation from a response, raising TranslationOutputError if it's unusable
+        
+        partial_text is the reply so far when the response is a continuation.
+        """
+        if not response.choices or len(response.choices) == 0:
+            raise TranslationOutputError("Azure AI DeepSeek returned no response")
+        
+        choice = response.choices[0]
+        english_text = choice.message.content
+        if partial_text:
+            english_text = self.stitch(partial_text, english_text or "")
+        
+        if getattr(choice, 'finish_reason', None) == "content_filter":
+            raise TranslationOutputError("Response blocked by content filter", RetryPolicy.CONTENT_FILTERED)
+        if getattr(choice, 'finish_reason', None) == "length":
+            if not partial_text:
+                raise TranslationOutputError("Translation cut off at max_tokens", RetryPolicy.TRUNCATED)
+            # Out of continuations - fail the chunk rather than lose its tail or retranslate it all
+            if self.output_sizing:
+                self.output_sizing.record_incomplete()
+            raise TranslationOutputError(
+                f"Translation still cut off after {self.MAX_CONTINUATIONS} continuations "
+                f"({len(english_text)} characters written)", RetryPolicy.INCOMPLETE
+            )
+        
+        # Check if response is None or empty
+        if english_text is None:
+            raise TranslationOutputError("Received None response from Azure AI DeepSeek")
+        
+        english_text = english_text.strip()
+        
+        # Clean up any meta-commentary
+        english_text = self.clean_output(english_text)
+        
+        # Validate that we got a reasonable translation
+        if english_text and len(english_text) > 5 and not english_text.startswith("Translation"):
+            print(f"      ✅ Azure AI DeepSeek translated {element_type} successfully")
+            return english_text
+        
+        raise TranslationOutputError("Received poor translation quality")
+    
+    def restore_placeholders(self, english_text: str, placeholders: Dict[str, str]) -> str:
+        """Put the English glossary terms back in place of their placeholders
+        
+        Every placeholder sent must come back and no unknown ones may appear -
+        a dropped one would make a named character vanish from the English.
+        Otherwise PlaceholderMismatchError is raised, and the caller retries
+        the chunk once with the glossary listed instead.
+        A term repeated in the source may come back once (e.g. as "he" later).
+        """
+        if not placeholders:
+            return english_text
+        
+        found = set(PLACEHOLDER_PATTERN.findall(english_text))
+        missing = [token for token in placeholders if token not in found]
+        unknown = sorted(found - placeholders.keys())
+        if missing or unknown:
+            problems = []
+            if missing:
+                problems.append(f"missing {' '.join(missing)}")
+            if unknown:
+                problems.append(f"unknown {' '.join(unknown)}")
+            raise PlaceholderMismatchError(f"Glossary placeholders not preserved ({', '.join(problems)})")
+        
+        return PLACEHOLDER_PATTERN.sub(lambda match: placeholders[match.group(0)], english_text)
+    
+    @property
+    def backends(self) -> List["AzureDeepSeekTranslator"]:
+        """Endpoints this translator sends to - just itself; an AzureDeepSeekPool has several"""
+        return [self]
+    
+    def choose_backend(self, avoid: "AzureDeepSeekTranslator" = None) -> "AzureDeepSeekTranslator":
+        """Endpoint for the next attempt - `avoid` is the one that just failed"""
+        return self
+    
+    def is_healthy(self) -> bool:
+        """True if a request sent here now is likely to go straight through"""
+        return (self.working and self.fatal_error is None
+                and self.circuit_breaker.state == CircuitBreaker.CLOSED and not self.rate_limiter.paused)
+    
+    def record_latency(self, latency: float):
+        """Track how quickly this endpoint answers"""
+        self.hedge_policy.record_latency(latency)
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += 0.2 * (latency - self.latency_ewma)
+    
+    def call_endpoint(self, messages: List, options: Dict, slot_acquired: bool = False, slot: Dict = None):
+        """Send one request while holding a concurrency slot, recording its latency"""
+        with self.concurrency_limiter.request(slot_acquired, slot):
+            started = time.monotonic()
+            response = self.client.complete(
+                messages=messages, raw_response_hook=self.on_raw_response, **options
+            )
+        self.record_latency(time.monotonic() - started)
+        return response
+    
+    def send_attempt(self, messages: List, options: Dict, request_tokens: int, deadline: Deadline):
+        """One attempt against this endpoint - waits out its circuit breaker and quota, then sends"""
+        # Raises once the outage is too long
+        wait = self.circuit_breaker.admit()
+        while wait > 0:
+            deadline.check()
+            time.sleep(wait)
+            wait = self.circuit_breaker.admit()
+        
+        self.rate_limiter.acquire(request_tokens)
+        self.requests_sent += 1
+        response = self.complete_with_hedge(
+            messages, {**options, **self.request_timeouts(deadline)}, request_tokens
+        )
+        self.circuit_breaker.record_success()
+        return response
+    
+    def reserve_hedge(self, request_tokens: int) -> bool:
+        """Claim a hedge plus rate and concurrency capacity for it, without waiting for any of them"""
+        if not self.hedge_policy.try_hedge():
+            return False
+        if not self.rate_limiter.try_reserve(request_tokens):
+            self.hedge_policy.cancel_hedge()
+            return False
+        if not self.concurrency_limiter.try_acquire():
+            self.rate_limiter.refund(request_tokens)
+            self.hedge_policy.cancel_hedge()
+            return False
+        return True
+    
+    def complete_with_hedge(self, messages: List, options: Dict, request_tokens: int):
+        """Send a request, duplicating it if it runs past the hedge latency - first good answer wins
+        
+        The sync client can't abort a request mid-flight, so the losing copy
+        finishes in the background and its answer is discarded - its
+        concurrency slot is freed as soon as the winner returns.
+        """
+        delay = self.hedge_policy.hedge_delay()
+        if delay is None:
+            return self.call_endpoint(messages, options)
+        
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(max_workers=self.max_in_flight * 2, thread_name_prefix="hedge")
+        
+        self.hedge_policy.record_request()
+        primary_slot, hedge_slot = {}, {}
+        primary = self._hedge_executor.submit(self.call_endpoint, messages, options, False, primary_slot)
+        done, _ = wait_futures([primary], timeout=delay)
+        if done or not self.reserve_hedge(request_tokens):
+            return primary.result()
+        
+        hedge = self._hedge_executor.submit(self.call_endpoint, messages, options, True, hedge_slot)
+        for future in as_completed([primary, hedge]):
+            if future.exception() is None:
+                self.hedge_policy.record_outcome(hedge_won=future is hedge)
+                self.concurrency_limiter.abandon(primary_slot if future is hedge else hedge_slot)
+                return future.result()
+        raise primary.exception()
+    
+    def check_available(self):
+        """Raise before sending anything if this translator can't work"""
+        if self.fatal_error is not None:
+            raise TranslationConfigurationError(f"Azure AI DeepSeek configuration error: {self.fatal_error}")
+        if not self.working:
+            print(f"      ❌ Azure AI DeepSeek not available")
+            raise TranslationFailedException("Azure AI DeepSeek not available")
+    
+    def retry_delay(self, error: BaseException, failures: Dict, max_retries: int,
+                    deadline: Deadline = None, backend: "AzureDeepSeekTranslator" = None) -> float:
+        """Classify a failed attempt and return the backoff before the next one
+        
+        Raises instead when the error class has no retries left. Auth/config
+        errors also disable this translator so every other chunk in the run
+        fails immediately instead of repeating the same doomed request. Work
+        that runs out of retries while the endpoint is down, or when the run's
+        retry budget is spent, is deferred rather than failed.
+        """
+        backend = backend or self
+        if isinstance(error, TranslationFailedException):
+            # Deferred or timed out while waiting on the endpoint - already a final answer
+            raise error
+        if deadline is not None and deadline.expired:
+            # Cut off by our own deadline - says nothing about the endpoint
+            raise deadline.error() from error
+        
+        error_class = self.retry_policy.classify(error)
+        if error_class == RetryPolicy.TRANSIENT:
+            backend.circuit_breaker.record_failure()
+        else:
+            # The service answered, so the endpoint itself is up
+            backend.circuit_breaker.record_success()
+        
+        failures[error_class] = failures.get(error_class, 0) + 1
+        attempts = sum(failures.values())
+        print(f"      ⚠️ Azure AI DeepSeek {error_class.replace('_', ' ')} error (attempt {attempts}): {error}")
+        
+        if error_class == RetryPolicy.AUTH_CONFIG:
+            self.fatal_error = error
+            print(f"      ❌ Not retrying - check the endpoint, API key and deployment name")
+            raise TranslationConfigurationError(f"Azure AI DeepSeek configuration error: {error}") from error
+        if error_class == RetryPolicy.CONTENT_FILTERED:
+            raise ContentFilteredException(f"Translation refused by content filter: {error}") from error
+        if error_class == RetryPolicy.PLACEHOLDER_MISMATCH:
+            # The same prompt would likely fail the same way - the caller retries with the terms listed
+            raise TranslationFailedException(str(error)) from error
+        if failures[error_class] > self.retry_policy.max_retries_for(error_class, max_retries):
+            if backend.circuit_breaker.state != CircuitBreaker.CLOSED:
+                print(f"      ⏸️ Endpoint down - deferring after {attempts} attempts")
+                raise TranslationDeferredException(f"Endpoint down after {attempts} attempts: {error}") from error
+            print(f"      ❌ Translation failed after {attempts} attempts")
+            raise TranslationFailedException(f"Translation failed after {attempts} attempts ({error_class}): {error}") from error
+        if not self.retry_budget.try_spend():
+            print(f"      ⏸️ Run retry budget exhausted - deferring")
+            raise TranslationDeferredException(f"Retry budget exhausted ({self.retry_budget.describe()}): {error}") from error
+        
+        delay = self.retry_policy.delay(failures[error_class] - 1, error)
+        if deadline is not None and deadline.remaining() is not None and delay >= deadline.remaining():
+            print(f"      ⏰ {deadline.label.capitalize()} reached - not retrying")
+            raise deadline.error() from error
+        if self.retry_policy.retry_after(error) is not None:
+            # Hold every other worker on this deployment too
+            backend.rate_limiter.pause(delay)
+        return delay
+    
+    def recall(self, korean_text: str, glossary_terms: str, context: str, element_type: str) -> Tuple[str, str, Dict]:
+        """Check the translation memory for a chunk
+        
+        Returns (memory key, finished translation or None, similar entry to
+        pass as a reference or None). The key is None when there's no memory.
+        """
+        memory = self.translation_memory
+        if memory is None:
+            return None, None, None
         
-        # If all attempts failed, raise exception instead of returning original text
-        print(f"      ❌ Translation failed after {max_retries + 1} attempts")
-        raise TranslationFailedException(f"Translation failed after {max_retries + 1} attempts")
+        memory_key = memory.key(korean_text, glossary_terms, context, element_type, self.model_name)
+        cached = memory.get(memory_key)
+        if cached is not None:
+            return memory_key, cached, None
+        
+        similar = memory.find_similar(korean_text, glossary_terms, context, element_type, self.model_name)
+        if similar and similar["reuse"] is not None:
+            print(f"      ♻️ Reused a near-duplicate {element_type} from the translation memory")
+            memory.put(memory_key, korean_text, similar["reuse"])
+            return memory_key, similar["reuse"], None
+        return memory_key, None, similar
+    
+    def translate_with_glossary(self, korean_text: str, glossary_terms: str = "", context: str = "", element_type: str = "text", max_retries: int = 5,
+                                deadline: Deadline = None, placeholders: Dict[str, str] = None, tuned: bool = False) -> str:
+        """Translate Korean text directly to English using DeepSeek with glossary support and better error handling
+        
+        placeholders maps the glossary placeholders in korean_text to their
+        English terms; they are restored (and checked) in the translation.
+        tuned marks text chunks planned with the tuned chunk size, whose
+        timing feeds the chunk size history.
+        """
+        
+        self.check_available()
+        deadline = deadline or Deadline()
+        
+        # Skip very short or empty chunks
+        if not korean_text.strip() or len(korean_text.strip()) < 3:
+            return self.restore_placeholders(korean_text, placeholders)
+        
+        # Unchanged chunks come straight from the translation memory, near-duplicates give a reference
+        # (with placeholders the memory holds the translation before restoring, so glossary edits still apply)
+        memory_key, cached, reference = self.recall(korean_text, glossary_terms, context, element_type)
+        if cached is not None:
+            return self.restore_placeholders(cached, placeholders)
+        
+        messages = self.build_messages(korean_text, glossary_terms, context, element_type, reference, bool(placeholders))
+        options = self.request_options(korean_text, element_type)
+        request_tokens = self.estimate_request_tokens(messages, options)
+        failures = {}  # Failed attempts per error class
+        self.retry_budget.record_request()
+        
+        backend = None
+        started = time.monotonic()
+        cut_off = False
+        try:
+            while True:
+                self.check_available()
+                deadline.check()
+                backend = self.choose_backend(avoid=backend)
+                
+                try:
+                    response = backend.send_attempt(messages, options, request_tokens, deadline)
+                    response, partial_text, earlier_tokens = self.continue_truncated(
+                        backend, messages, options, response, deadline
+                    )
+                    cut_off = cut_off or bool(partial_text)
+                    english_text = self.extract_translation(response, element_type, partial_text)
+                    restored_text = self.restore_placeholders(english_text, placeholders)
+                    self.record_output(korean_text, element_type, response, options, earlier_tokens)
+                    if tuned:
+                        self.record_timing(korean_text, started, True, cut_off)
+                    if memory_key:
+                        self.translation_memory.put(memory_key, korean_text, english_text)
+                    return restored_text
+                        
+                except Exception as e:
+                    if isinstance(e, TranslationOutputError) and e.error_class == RetryPolicy.TRUNCATED:
+                        cut_off = True
+                        options, request_tokens = self.enlarge_request(messages, options)
+                    # Raises when this kind of error shouldn't be retried any more
+                    time.sleep(self.retry_delay(e, failures, max_retries, deadline, backend))
+        except TranslationFailedException:
+            if tuned:
+                self.record_timing(korean_text, started, False, cut_off)
+            raise
     
     def clean_output(self, text: str) -> str:
         """Clean up DeepSeek output to remove meta-commentary"""
@@ -259,20 +2176,636 @@ English translation:"""
             
             cleaned_lines.append(line)
         
-        result = '\n'.join(cleaned_lines)
+        result = '\n'.join(cleaned_lines)
+        
+        # Additional cleaning for common artifacts
+        result = re.sub(r'^[Tt]ranslation:\s*', '', result)
+        result = re.sub(r'^[Ee]nglish:\s*', '', result)
+        result = re.sub(r'^[Tt]ranslated:\s*', '', result)
+        
+        return result.strip()
+
+class AsyncAzureDeepSeekTranslator(AzureDeepSeekTranslator):
+    """asyncio variant of AzureDeepSeekTranslator built on the async Azure inference client
+    
+    Use it as an async context manager so the underlying HTTP session is closed:
+    
+        async with AsyncAzureDeepSeekTranslator(endpoint, api_key) as translator:
+            english = await translator.translate_with_glossary(korean)
+    """
+    
+    def __init__(self, endpoint: str, api_key: str, max_in_flight: int = 128):
+        """Initialize async Azure AI DeepSeek client"""
+        super().__init__(endpoint, api_key, max_in_flight)
+    
+    def create_client(self):
+        """Create the async Azure AI inference client (requires aiohttp)"""
+        return AsyncChatCompletionsClient(
+            endpoint=self.endpoint,
+            credential=AzureKeyCredential(self.api_key),
+            api_version="2024-05-01-preview",
+            retry_total=0  # Retries are ours, so throttling reaches the concurrency limiter
+        )
+    
+    def create_concurrency_limiter(self, max_limit: int):
+        """Create the asyncio-aware adaptive limiter that caps concurrent requests"""
+        return AsyncAdaptiveConcurrencyLimiter(max_limit)
+    
+    async def close(self):
+        """Close the async client and its HTTP session"""
+        if getattr(self, 'client', None) is not None:
+            await self.client.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def test_connection(self):
+        """Test if Azure AI DeepSeek is working - ONLY call this when explicitly needed"""
+        try:
+            print("🧪 Testing Azure AI DeepSeek connection (async)...")
+            
+            response = await self.client.complete(
+                messages=[
+                    SystemMessage(content="You are a Korean-to-English translator."),
+                    UserMessage(content="Translate this Korean to English: '안녕하세요. 저는 학생입니다.' Be natural and fluent.")
+                ],
+                max_tokens=100,
+                temperature=0.1,
+                top_p=0.95,
+                presence_penalty=0.0,
+                frequency_penalty=0.0,
+                model=self.model_name,
+                connection_timeout=self.connect_timeout,
+                read_timeout=self.read_timeout
+            )
+            
+            if response.choices and len(response.choices) > 0:
+                self.working = True
+                result = response.choices[0].message.content
+                print(f"✅ Azure AI DeepSeek test successful: {result}")
+                return True, result
+            else:
+                print("❌ Azure AI DeepSeek test failed - no response")
+                self.working = False
+                return False, "No response received"
+                
+        except Exception as e:
+            print(f"❌ Azure AI DeepSeek test error: {e}")
+            self.working = False
+            return False, str(e)
+    
+    async def call_endpoint(self, messages: List, options: Dict, slot_acquired: bool = False):
+        """Send one request while holding a concurrency slot, recording its latency"""
+        async with self.concurrency_limiter.request(slot_acquired):
+            started = time.monotonic()
+            response = await self.client.complete(
+                messages=messages, raw_response_hook=self.on_raw_response, **options
+            )
+        self.record_latency(time.monotonic() - started)
+        return response
+    
+    async def send_attempt(self, messages: List, options: Dict, request_tokens: int, deadline: Deadline):
+        """One attempt against this endpoint - waits out its circuit breaker and quota, then sends"""
+        # Raises once the outage is too long
+        wait = self.circuit_breaker.admit()
+        while wait > 0:
+            deadline.check()
+            await asyncio.sleep(wait)
+            wait = self.circuit_breaker.admit()
+        
+        await self.rate_limiter.acquire_async(request_tokens)
+        self.requests_sent += 1
+        response = await self.complete_with_hedge(
+            messages, {**options, **self.request_timeouts(deadline)}, request_tokens
+        )
+        self.circuit_breaker.record_success()
+        return response
+    
+    async def complete_with_hedge(self, messages: List, options: Dict, request_tokens: int):
+        """Send a request, duplicating it if it runs past the hedge latency - the losing copy is cancelled"""
+        delay = self.hedge_policy.hedge_delay()
+        if delay is None:
+            return await self.call_endpoint(messages, options)
+        
+        self.hedge_policy.record_request()
+        primary = asyncio.ensure_future(self.call_endpoint(messages, options))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self.reserve_hedge(request_tokens):
+                return await primary
+            
+            hedge = asyncio.ensure_future(self.call_endpoint(messages, options, True))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.hedge_policy.record_outcome(hedge_won=task is hedge)
+                        return task.result()
+            raise primary.exception()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+    
+    async def continue_truncated(self, backend: "AsyncAzureDeepSeekTranslator", messages: List, options: Dict,
+                                 response, deadline: Deadline) -> Tuple:
+        """Ask for the rest of a reply cut off at max_tokens, without blocking the event loop"""
+        partial_text, earlier_tokens = "", 0
+        for _ in range(self.MAX_CONTINUATIONS):
+            if not self.is_cut_off(response):
+                break
+            partial_text = self.whole_words(self.stitch(partial_text, response.choices[0].message.content or ""))
+            earlier_tokens += self.completion_tokens(response)
+            if self.output_sizing:
+                self.output_sizing.record_continuation()
+            print(f"      ⏩ Reply hit max_tokens after {len(partial_text)} characters - asking for the rest")
+            continuation = self.continuation_messages(messages, partial_text)
+            response = await asyncio.wait_for(
+                backend.send_attempt(continuation, options, self.estimate_request_tokens(continuation, options), deadline),
+                timeout=deadline.remaining()
+            )
+        return response, partial_text, earlier_tokens
+    
+    async def translate_with_glossary(self, korean_text: str, glossary_terms: str = "", context: str = "", element_type: str = "text", max_retries: int = 5,
+                                      deadline: Deadline = None, placeholders: Dict[str, str] = None, tuned: bool = False) -> str:
+        """Translate Korean text directly to English without blocking the event loop"""
+        
+        self.check_available()
+        deadline = deadline or Deadline()
+        
+        # Skip very short or empty chunks
+        if not korean_text.strip() or len(korean_text.strip()) < 3:
+            return self.restore_placeholders(korean_text, placeholders)
+        
+        # Unchanged chunks come straight from the translation memory, near-duplicates give a reference
+        # (with placeholders the memory holds the translation before restoring, so glossary edits still apply)
+        memory_key, cached, reference = self.recall(korean_text, glossary_terms, context, element_type)
+        if cached is not None:
+            return self.restore_placeholders(cached, placeholders)
+        
+        messages = self.build_messages(korean_text, glossary_terms, context, element_type, reference, bool(placeholders))
+        options = self.request_options(korean_text, element_type)
+        request_tokens = self.estimate_request_tokens(messages, options)
+        failures = {}  # Failed attempts per error class
+        self.retry_budget.record_request()
+        
+        backend = None
+        started = time.monotonic()
+        cut_off = False
+        try:
+            while True:
+                self.check_available()
+                deadline.check()
+                backend = self.choose_backend(avoid=backend)
+                
+                try:
+                    # The event loop can cancel a request outright when the deadline passes
+                    response = await asyncio.wait_for(
+                        backend.send_attempt(messages, options, request_tokens, deadline),
+                        timeout=deadline.remaining()
+                    )
+                    response, partial_text, earlier_tokens = await self.continue_truncated(
+                        backend, messages, options, response, deadline
+                    )
+                    cut_off = cut_off or bool(partial_text)
+                    
+                    english_text = self.extract_translation(response, element_type, partial_text)
+                    restored_text = self.restore_placeholders(english_text, placeholders)
+                    self.record_output(korean_text, element_type, response, options, earlier_tokens)
+                    if tuned:
+                        self.record_timing(korean_text, started, True, cut_off)
+                    if memory_key:
+                        self.translation_memory.put(memory_key, korean_text, english_text)
+                    return restored_text
+                        
+                except Exception as e:
+                    if isinstance(e, TranslationOutputError) and e.error_class == RetryPolicy.TRUNCATED:
+                        cut_off = True
+                        options, request_tokens = self.enlarge_request(messages, options)
+                    # Raises when this kind of error shouldn't be retried any more
+                    await asyncio.sleep(self.retry_delay(e, failures, max_retries, deadline, backend))
+        except TranslationFailedException:
+            if tuned:
+                self.record_timing(korean_text, started, False, cut_off)
+            raise
+
+class AzureDeepSeekPool(AzureDeepSeekTranslator):
+    """Several Azure AI DeepSeek deployments used as one translator
+    
+    Each attempt goes to one backend, picked by weight ("weighted") or by
+    lowest expected latency ("least-latency") among the healthy ones. Every
+    backend keeps its own rate limiter, adaptive concurrency limit and circuit
+    breaker, so throughput is the sum of their quotas. A retry after a
+    throttle or failure goes straight to another healthy backend instead of
+    waiting, and bad credentials only take their own backend out of the pool.
+    """
+    
+    ROUTING_MODES = ("weighted", "least-latency")
+    
+    def __init__(self, members: List[AzureDeepSeekTranslator], routing: str = "weighted"):
+        """Pool already-created translators - the first one is the primary"""
+        primary = members[0]
+        self.members = members
+        self.routing = routing if routing in self.ROUTING_MODES else "weighted"
+        self.endpoint = primary.endpoint
+        self.api_key = primary.api_key
+        self.model_name = primary.model_name
+        self.name = f"pool of {len(members)}"
+        self.max_in_flight = primary.max_in_flight
+        self.retry_policy = RetryPolicy()
+        self.retry_budget = RetryBudget()
+        self.fatal_error = None
+        self.failover_count = 0
+        self.translation_memory = None
+        self.output_sizing = None
+        self.chunk_tuning = None
+        self.language_pair = primary.language_pair
+    
+    @property
+    def working(self) -> bool:
+        return any(member.working for member in self.members)
+    
+    @property
+    def backends(self) -> List[AzureDeepSeekTranslator]:
+        return self.members
+    
+    def available_backends(self) -> List[AzureDeepSeekTranslator]:
+        """Backends that haven't been ruled out by an auth/config error"""
+        return [member for member in self.members if member.working and member.fatal_error is None]
+    
+    def check_available(self):
+        """Raise before sending anything if no backend can work"""
+        if self.fatal_error is not None:
+            raise TranslationConfigurationError(f"Azure AI DeepSeek configuration error: {self.fatal_error}")
+        if not self.available_backends():
+            print(f"      ❌ No Azure AI DeepSeek endpoint available")
+            raise TranslationFailedException("No Azure AI DeepSeek endpoint available")
+    
+    def expected_latency(self, member: AzureDeepSeekTranslator) -> float:
+        """Recent latency scaled by how busy the backend is - untried backends come first"""
+        limiter = member.concurrency_limiter
+        return (member.latency_ewma or 0.0) * (limiter.in_flight + 1) / max(1, int(limiter.limit))
+    
+    def choose_backend(self, avoid: AzureDeepSeekTranslator = None) -> AzureDeepSeekTranslator:
+        """Pick a healthy backend by weight or expected latency, avoiding the one that just failed"""
+        candidates = self.available_backends()
+        healthy = [member for member in candidates if member.is_healthy() and member is not avoid]
+        choices = healthy or candidates
+        
+        if self.routing == "least-latency":
+            return min(choices, key=self.expected_latency)
+        return random.choices(choices, weights=[max(member.weight, 0.01) for member in choices])[0]
+    
+    def retry_delay(self, error: BaseException, failures: Dict, max_retries: int,
+                    deadline: Deadline = None, backend: AzureDeepSeekTranslator = None) -> float:
+        """Like the single-endpoint version, but retry at once on another backend when one is healthy"""
+        if backend is not None and not isinstance(error, TranslationFailedException):
+            if self.retry_policy.classify(error) == RetryPolicy.AUTH_CONFIG:
+                backend.fatal_error = error
+                print(f"      ⚠️ {backend.name} rejected the request setup - removed from the pool: {error}")
+                if self.available_backends():
+                    self.failover_count += 1
+                    return 0.0
+        
+        delay = super().retry_delay(error, failures, max_retries, deadline, backend)
+        if any(member.is_healthy() and member is not backend for member in self.available_backends()):
+            self.failover_count += 1
+            print(f"      🔀 Failing over from {backend.name}")
+            return 0.0
+        return delay
+    
+    def describe_routing(self) -> str:
+        """One-line summary for the run log"""
+        usage = ", ".join(
+            f"{member.name}: {member.requests_sent} requests (weight {member.weight:g})" +
+            (" - disabled" if member.fatal_error is not None else "")
+            for member in self.members
+        )
+        return f"{self.routing} routing over {len(self.members)} endpoints, {self.failover_count} failovers - {usage}"
+
+class AsyncAzureDeepSeekPool(AzureDeepSeekPool, AsyncAzureDeepSeekTranslator):
+    """AzureDeepSeekPool over AsyncAzureDeepSeekTranslator backends - use with 'async with'"""
+    
+    async def close(self):
+        """Close every backend's async client"""
+        for member in self.members:
+            await member.close()
+
+class GlossaryMatcher:
+    """Aho-Corasick automaton over a glossary's Korean terms
+    
+    Built once per glossary, it finds every term in a text in one pass
+    instead of one substring scan per term. Overlapping matches resolve to
+    the leftmost-longest term, so 이시헌 counts as 이시헌 and not also as 시헌.
+    
+    Transitions live in a flat open-addressing table rather than per-node
+    dicts, so a compiled matcher can be saved in a .glossidx file and used
+    straight from a memory map (see load_glossary_index).
+    """
+    
+    HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+    MAX_MEMO = 1000000  # Looked-up transitions kept in a dict for speed
+    
+    def __init__(self, terms):
+        self.terms = [term for term in terms if term]
+        goto = [{}]
+        term_at = [-1]  # Index of the term ending at each node, or -1
+        
+        for index, term in enumerate(self.terms):
+            node = 0
+            for char in term:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    term_at.append(-1)
+                node = next_node
+            term_at[node] = index
+        
+        fail = [0] * len(goto)
+        output_link = [0] * len(goto)  # Nearest node on the fail chain that ends a term (0 = none)
+        
+        # Breadth-first so every fail target is finished before it's used
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                target = fail[node]
+                while target and char not in goto[target]:
+                    target = fail[target]
+                # Children of the root fail back to the root
+                target = goto[target].get(char, 0) if node else 0
+                fail[child] = target
+                output_link[child] = target if term_at[target] >= 0 else output_link[target]
+                queue.append(child)
+        
+        # Flatten the transitions into a hash table keyed by (node, character)
+        edges = [(node, char, child) for node, children in enumerate(goto) for char, child in children.items()]
+        size = 8
+        while size < 2 * len(edges):
+            size *= 2
+        keys = array('Q', bytes(8 * size))
+        values = array('I', bytes(4 * size))
+        shift = 64 - (size - 1).bit_length()
+        for node, char, child in edges:
+            key = (node << 21 | ord(char)) + 1
+            slot = ((key * self.HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> shift
+            while keys[slot]:
+                slot = (slot + 1) & (size - 1)
+            keys[slot] = key
+            values[slot] = child
+        
+        self._use_arrays(keys, values, array('I', fail), array('i', term_at), array('I', output_link))
+    
+    @classmethod
+    def from_arrays(cls, terms: List[str], keys, values, fail, term_at, output_link) -> "GlossaryMatcher":
+        """Rebuild a matcher from saved arrays - any indexable sequences, e.g. memoryviews cast to the item type"""
+        matcher = cls.__new__(cls)
+        matcher.terms = terms
+        matcher._use_arrays(keys, values, fail, term_at, output_link)
+        return matcher
+    
+    def _use_arrays(self, keys, values, fail, term_at, output_link):
+        self._keys = keys
+        self._values = values
+        self._fail = fail
+        self._term_at = term_at
+        self._output_link = output_link
+        self._mask = len(keys) - 1
+        self._shift = 64 - self._mask.bit_length()
+        self._memo = {}
+    
+    def arrays(self) -> Dict:
+        """The compiled automaton, by name, for save_glossary_index"""
+        return {"keys": self._keys, "values": self._values, "fail": self._fail,
+                "term_at": self._term_at, "output_link": self._output_link}
+    
+    def _lookup(self, key: int) -> int:
+        """Child node for a transition key, or 0 when there is no such edge"""
+        keys, mask = self._keys, self._mask
+        slot = ((key * self.HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+        while True:
+            stored = keys[slot]
+            if stored == key:
+                child = self._values[slot]
+                break
+            if not stored:
+                child = 0
+                break
+            slot = (slot + 1) & mask
+        
+        if len(self._memo) >= self.MAX_MEMO:
+            self._memo.clear()
+        self._memo[key] = child
+        return child
+    
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """(start, term) for each match, leftmost-longest and non-overlapping"""
+        longest = {}  # Start position -> longest term starting there
+        memo, lookup = self._memo, self._lookup
+        fail, term_at, output_link, terms = self._fail, self._term_at, self._output_link, self.terms
+        node = 0
+        for position, char in enumerate(text):
+            code = ord(char)
+            while True:
+                key = (node << 21 | code) + 1
+                child = memo.get(key)
+                if child is None:
+                    child = lookup(key)
+                if child or not node:
+                    break
+                node = fail[node]
+            node = child
+            
+            match = node if term_at[node] >= 0 else output_link[node]
+            while match:
+                term = terms[term_at[match]]
+                start = position - len(term) + 1
+                if len(term) > len(longest.get(start, "")):
+                    longest[start] = term
+                match = output_link[match]
+        
+        matches = []
+        covered_until = 0
+        for start in sorted(longest):
+            if start >= covered_until:
+                matches.append((start, longest[start]))
+                covered_until = start + len(longest[start])
+        return matches
+    
+    def count(self, text: str) -> Dict[str, int]:
+        """How often each term occurs in the text"""
+        return Counter(term for _, term in self.find_all(text))
+
+GLOSSARY_INDEX_MAGIC = b"GLOSSIDX"
+GLOSSARY_INDEX_VERSION = 1
+
+def glossary_index_path(csv_path) -> Path:
+    """Where the compiled index for a glossary CSV lives - next to it, as <name>.glossidx"""
+    return Path(csv_path).with_suffix('.glossidx')
+
+def file_sha256(path) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def save_glossary_index(csv_path, rows: List, skipped_rows: int, matcher: GlossaryMatcher) -> bool:
+    """Save parsed glossary rows and the compiled matcher next to the CSV
+    
+    rows are [korean, english, type, gender] lists in glossary order. The
+    index is keyed by the CSV's size, mtime and SHA-256; a stale one is
+    simply rewritten on the next load.
+    """
+    index_path = glossary_index_path(csv_path)
+    try:
+        stat = os.stat(csv_path)
+        sections = {"rows": json.dumps(rows, ensure_ascii=False).encode('utf-8')}
+        sections.update({name: values.tobytes() for name, values in matcher.arrays().items()})
+        
+        # Offsets are relative to the 8-byte-aligned start of the data after the header
+        layout = {}
+        offset = 0
+        for name, data in sections.items():
+            layout[name] = [offset, len(data)]
+            offset += (len(data) + 7) // 8 * 8
+        header = json.dumps({
+            "csv_size": stat.st_size,
+            "csv_mtime_ns": stat.st_mtime_ns,
+            "csv_sha256": file_sha256(csv_path),
+            "byteorder": sys.byteorder,
+            "skipped_rows": skipped_rows,
+            "sections": layout
+        }).encode('utf-8')
         
-        # Additional cleaning for common artifacts
-        result = re.sub(r'^[Tt]ranslation:\s*', '', result)
-        result = re.sub(r'^[Ee]nglish:\s*', '', result)
-        result = re.sub(r'^[Tt]ranslated:\s*', '', result)
+        temp_path = index_path.with_suffix('.glossidx.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(GLOSSARY_INDEX_MAGIC + struct.pack('<II', GLOSSARY_INDEX_VERSION, len(header)) + header)
+            f.write(bytes(-f.tell() % 8))
+            for data in sections.values():
+                f.write(data + bytes(-len(data) % 8))
+        os.replace(temp_path, index_path)
+        return True
+    except OSError as e:
+        print(f"   ⚠️ Could not save glossary index {index_path.name}: {e}")
+        return False
+
+def load_glossary_index(csv_path):
+    """Load the compiled index saved next to a glossary CSV
+    
+    Returns (rows, skipped_rows, matcher), or None when there is no index or
+    the CSV has changed since it was written. The arrays are copied out of
+    the memory-mapped file in one block each and the mapping is closed
+    before returning - an open mapping would stop save_glossary_index from
+    replacing the file on Windows.
+    """
+    index_path = glossary_index_path(csv_path)
+    try:
+        stat = os.stat(csv_path)
+        with open(index_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    
+    try:
+        if mapped[:len(GLOSSARY_INDEX_MAGIC)] != GLOSSARY_INDEX_MAGIC:
+            raise ValueError("not a glossary index")
+        version, header_length = struct.unpack_from('<II', mapped, len(GLOSSARY_INDEX_MAGIC))
+        header_start = len(GLOSSARY_INDEX_MAGIC) + 8
+        header = json.loads(mapped[header_start:header_start + header_length].decode('utf-8'))
+        if version != GLOSSARY_INDEX_VERSION or header["byteorder"] != sys.byteorder:
+            raise ValueError("index from another version or platform")
         
-        return result.strip()
+        # Size and mtime match in the common case; a copied or touched file is checked by content
+        if (header["csv_size"], header["csv_mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+            if header["csv_sha256"] != file_sha256(csv_path):
+                raise ValueError("CSV changed since the index was saved")
+        
+        data_start = (header_start + header_length + 7) // 8 * 8
+        # Slicing an mmap copies, so nothing below holds on to the mapping
+        sections = {name: memoryview(mapped[data_start + offset:data_start + offset + length])
+                    for name, (offset, length) in header["sections"].items()}
+        
+        rows = json.loads(bytes(sections["rows"]).decode('utf-8'))
+        matcher = GlossaryMatcher.from_arrays(
+            [row[0] for row in rows], sections["keys"].cast('Q'), sections["values"].cast('I'),
+            sections["fail"].cast('I'), sections["term_at"].cast('i'), sections["output_link"].cast('I')
+        )
+        return rows, header["skipped_rows"], matcher
+    
+    except (ValueError, KeyError, TypeError, struct.error) as e:
+        print(f"   🔄 Rebuilding glossary index {index_path.name} ({e})")
+        return None
+    finally:
+        mapped.close()
+
+class GlossaryStack:
+    """Ordered glossary layers resolved as one glossary - later layers override earlier ones
+    
+    The merged view holds the layers' own entry dicts rather than copies, so
+    usage counts recorded through the stack land in the layer that supplied
+    the term. It is compiled once per combination of layers, not per run.
+    """
+    
+    def __init__(self, layers: List[Tuple[str, Dict]], matcher: GlossaryMatcher = None):
+        self.layers = layers
+        self.names = [name for name, _ in layers]
+        self.signature = tuple((name, id(glossary), len(glossary)) for name, glossary in layers)
+        
+        if len(layers) == 1:
+            self.entries = layers[0][1]
+        else:
+            self.entries = {}
+            for _, glossary in layers:
+                self.entries.update(glossary)
+        self.matcher = matcher or GlossaryMatcher(self.entries)
+        self._conflicts = None
+    
+    def source_of(self, korean_term: str) -> str:
+        """Name of the layer whose entry is used for a term"""
+        for name, glossary in reversed(self.layers):
+            if korean_term in glossary:
+                return name
+        return None
+    
+    def conflicts(self) -> List[Dict]:
+        """Terms that layers translate differently, with the entry that wins and the ones it hides"""
+        if self._conflicts is None:
+            conflicts = []
+            if len(self.layers) > 1:
+                for korean_term, entry in self.entries.items():
+                    definitions = [(name, glossary[korean_term]) for name, glossary in self.layers if korean_term in glossary]
+                    if len({(data['translation'], data['type']) for _, data in definitions}) > 1:
+                        conflicts.append({
+                            "term": korean_term,
+                            "used": (definitions[-1][0], entry['translation']),
+                            "overridden": [(name, data['translation']) for name, data in definitions[:-1]]
+                        })
+            self._conflicts = conflicts
+        return self._conflicts
+    
+    def describe(self) -> str:
+        """Short summary for logs"""
+        if len(self.layers) == 1:
+            return self.names[0]
+        return f"{' → '.join(self.names)} (later layers win)"
 
 class DeepSeekOnlyTranslator:
     def __init__(self):
         # Initialize settings without heavy ML dependencies
         self.glossaries = {}
+        self.glossary_matchers = {}  # Glossary name -> (glossary dict, term count, GlossaryMatcher)
         self.active_glossary = None
+        self.glossary_stack = []  # Layered glossary names, lowest precedence first - empty means just active_glossary
+        self._resolved_glossary = None  # GlossaryStack for the current layers
         self.glossary_usage = {}  # Track which terms are used
         self.new_terms_found = {}  # Track potential new terms
         
@@ -285,6 +2818,40 @@ class DeepSeekOnlyTranslator:
         # Glossary update settings - removed auto_update_glossary
         self.process_html_files = True
         
+        # Each request lists only the glossary terms found in its chunk, most frequent first
+        self.glossary_per_chunk = True
+        self.max_glossary_terms = None  # Cap on terms per request (None = all that occur)
+        self.glossary_placeholders = False  # Swap glossary terms for ⟦A⟧-style placeholders instead of listing them
+        
+        # Chunk sizes in tokens (see configure_chunking)
+        self.chunk_budget = ChunkBudget()
+        
+        # Concurrency settings
+        self.chunk_workers = 8  # Chunks of one document translated in parallel
+        self.file_workers = 4  # Documents translated in parallel
+        self.max_in_flight_requests = 32  # Ceiling for the adaptive in-flight request limit
+        self.async_max_in_flight = 128  # Ceiling for the asyncio engine (no thread per request)
+        self.async_file_workers = 16  # Documents open at once in process_folder_async
+        
+        # Deadlines in seconds (None = no limit) - expired work is reported as timed out
+        self.file_timeout = None
+        self.run_timeout = None
+        self._glossary_lock = threading.Lock()
+        
+        # Cache of finished chunk translations shared by every run (see configure_translation_memory)
+        self.translation_memory = None
+        
+        # Learned output length per language pair, used to size max_tokens (see configure_output_sizing)
+        self.output_sizing = None
+        
+        # Chunk size picked per run from each deployment's throughput (see configure_chunk_tuning)
+        self.chunk_tuning = None
+        
+        # Paragraphs repeated across the files of a run are translated once up front
+        self.deduplicate_batches = True
+        self.min_shared_paragraph_chars = 10  # Shorter repeats (scene breaks etc.) stay inline in their chunk
+        self.shared_translations = {}  # Korean paragraph/element text -> English, for the current run
+        
         # Log tracking for saving
         self.translation_logs = []
         
@@ -314,8 +2881,17 @@ class DeepSeekOnlyTranslator:
             
             # Check if we have valid credentials
             if endpoint and api_key and len(api_key) > 20:
-                self.azure_translator = AzureDeepSeekTranslator(endpoint, api_key)
+                self.azure_translator = self.create_azure_translator(
+                    AzureDeepSeekTranslator(endpoint, api_key, self.max_in_flight_requests)
+                )
                 self.use_azure_deepseek = self.azure_translator.working
+                self.configure_rate_limits()
+                self.configure_hedging()
+                self.configure_timeouts()
+                self.configure_translation_memory()
+                self.configure_output_sizing()
+                self.configure_chunking()
+                self.configure_chunk_tuning()
                 
                 if self.use_azure_deepseek:
                     print("🚀 Azure AI DeepSeek ready for translation!")
@@ -338,16 +2914,23 @@ class DeepSeekOnlyTranslator:
             self.azure_api_key = api_key
             
             # Create test translator and actually test the connection
-            test_translator = AzureDeepSeekTranslator(endpoint, api_key)
+            test_translator = AzureDeepSeekTranslator(endpoint, api_key, self.max_in_flight_requests)
             success, result = test_translator.test_connection()
             
             if success:
                 # Save to config file for future use
                 save_azure_config(endpoint, api_key)
                 
-                # Update current translator
-                self.azure_translator = test_translator
+                # Update current translator (pooled with any extra endpoints from the config)
+                self.azure_translator = self.create_azure_translator(test_translator)
                 self.use_azure_deepseek = True
+                self.configure_rate_limits()
+                self.configure_hedging()
+                self.configure_timeouts()
+                self.configure_translation_memory()
+                self.configure_output_sizing()
+                self.configure_chunking()
+                self.configure_chunk_tuning()
                 
                 return True, "Azure AI DeepSeek configured and tested successfully!"
             else:
@@ -356,6 +2939,232 @@ class DeepSeekOnlyTranslator:
         except Exception as e:
             return False, f"Error configuring Azure: {e}"
     
+    def create_azure_translator(self, primary: AzureDeepSeekTranslator) -> AzureDeepSeekTranslator:
+        """Pool the primary translator with any extra deployments from the config, or return it alone
+        
+        ROUTING (or AZURE_AI_ROUTING) picks "weighted" (default) or
+        "least-latency", and WEIGHT sets the primary's share.
+        """
+        primary.weight = self.config_setting(None, 'WEIGHT', 'AZURE_AI_WEIGHT', float) or 1.0
+        extra_backends = load_extra_azure_backends()
+        if not extra_backends:
+            return primary
+        
+        members = [primary]
+        for backend in extra_backends:
+            member = AzureDeepSeekTranslator(backend["endpoint"], backend["api_key"], self.max_in_flight_requests)
+            member.weight = backend["weight"]
+            member.config_suffix = backend["suffix"]
+            members.append(member)
+        
+        routing = (self.config_setting(None, 'ROUTING', 'AZURE_AI_ROUTING', str) or "weighted").lower()
+        pool = AzureDeepSeekPool(members, routing)
+        print(f"🔀 Load balancing over {len(members)} Azure AI DeepSeek endpoints ({pool.routing} routing)")
+        return pool
+    
+    def configure_rate_limits(self, requests_per_minute: int = None, tokens_per_minute: int = None,
+                              headroom: float = None):
+        """Apply each deployment's RPM/TPM quotas to its shared rate limiter
+        
+        Values passed apply to every endpoint. Otherwise they come from RPM /
+        TPM / RATE_LIMIT_HEADROOM in azure_config.txt (RPM_2 / TPM_2 for
+        ENDPOINT_2, and so on) or the matching AZURE_AI_* environment
+        variables. Quotas left unset are learned from response headers.
+        """
+        if not self.azure_translator:
+            return
+        
+        for backend in self.azure_translator.backends:
+            suffix = backend.config_suffix
+            backend.rate_limiter.configure(
+                self.config_setting(requests_per_minute, f'RPM{suffix}', f'AZURE_AI_RPM{suffix}', int),
+                self.config_setting(tokens_per_minute, f'TPM{suffix}', f'AZURE_AI_TPM{suffix}', int),
+                self.config_setting(headroom, 'RATE_LIMIT_HEADROOM', 'AZURE_AI_RATE_LIMIT_HEADROOM', float)
+            )
+    
+    def configure_hedging(self, percentile: float = None, max_hedge_ratio: float = None):
+        """Turn on hedged requests for the slow tail (percentile 0 turns them off)
+        
+        Values not passed come from HEDGE_PERCENTILE / HEDGE_MAX_RATIO in
+        azure_config.txt or the AZURE_AI_HEDGE_PERCENTILE /
+        AZURE_AI_HEDGE_MAX_RATIO environment variables. Hedging is off by default.
+        """
+        if not self.azure_translator:
+            return
+        
+        percentile = self.config_setting(percentile, 'HEDGE_PERCENTILE', 'AZURE_AI_HEDGE_PERCENTILE', float)
+        max_hedge_ratio = self.config_setting(max_hedge_ratio, 'HEDGE_MAX_RATIO', 'AZURE_AI_HEDGE_MAX_RATIO', float)
+        
+        for backend in self.azure_translator.backends:
+            backend.hedge_policy.configure(percentile, max_hedge_ratio)
+    
+    def configure_timeouts(self, connect_timeout: float = None, read_timeout: float = None,
+                           file_timeout: float = None, run_timeout: float = None):
+        """Set per-request network timeouts and the per-file / per-run deadlines, in seconds
+        
+        Values not passed come from CONNECT_TIMEOUT / READ_TIMEOUT /
+        FILE_TIMEOUT / RUN_TIMEOUT in azure_config.txt or the matching
+        AZURE_AI_* environment variables. A file or run timeout of 0 means no limit.
+        """
+        file_timeout = self.config_setting(file_timeout, 'FILE_TIMEOUT', 'AZURE_AI_FILE_TIMEOUT', float)
+        run_timeout = self.config_setting(run_timeout, 'RUN_TIMEOUT', 'AZURE_AI_RUN_TIMEOUT', float)
+        if file_timeout is not None:
+            self.file_timeout = file_timeout or None
+        if run_timeout is not None:
+            self.run_timeout = run_timeout or None
+        
+        if not self.azure_translator:
+            return
+        
+        connect_timeout = self.config_setting(connect_timeout, 'CONNECT_TIMEOUT', 'AZURE_AI_CONNECT_TIMEOUT', float)
+        read_timeout = self.config_setting(read_timeout, 'READ_TIMEOUT', 'AZURE_AI_READ_TIMEOUT', float)
+        for backend in self.azure_translator.backends:
+            if connect_timeout:
+                backend.connect_timeout = connect_timeout
+            if read_timeout:
+                backend.read_timeout = read_timeout
+    
+    def configure_chunking(self, text_tokens: int = None, html_tokens: int = None, max_output_tokens: int = None,
+                           context_window: int = None, tokenizer=None):
+        """Set how many tokens of source text go into one request
+        
+        Values not passed come from CHUNK_TOKENS / HTML_CHUNK_TOKENS /
+        MAX_OUTPUT_TOKENS / CONTEXT_WINDOW in azure_config.txt or the matching
+        AZURE_AI_* environment variables. tokenizer replaces the built-in
+        estimate with any callable returning a string's token count.
+        """
+        self.chunk_budget.configure(
+            self.config_setting(text_tokens, 'CHUNK_TOKENS', 'AZURE_AI_CHUNK_TOKENS', int),
+            self.config_setting(html_tokens, 'HTML_CHUNK_TOKENS', 'AZURE_AI_HTML_CHUNK_TOKENS', int),
+            self.config_setting(max_output_tokens, 'MAX_OUTPUT_TOKENS', 'AZURE_AI_MAX_OUTPUT_TOKENS', int),
+            self.config_setting(context_window, 'CONTEXT_WINDOW', 'AZURE_AI_CONTEXT_WINDOW', int),
+            tokenizer
+        )
+        if self.output_sizing:
+            self.output_sizing.max_output_tokens = self.chunk_budget.max_output_tokens
+        if self.chunk_tuning:
+            self.chunk_tuning.size = self.chunk_budget.text_tokens
+    
+    def configure_translation_memory(self, path: str = None, max_entries: int = None, fuzzy_threshold: float = None):
+        """Open the translation memory so unchanged chunks are never sent twice
+        
+        Values not passed come from TRANSLATION_MEMORY (a file path, or "off"),
+        TM_MAX_ENTRIES and TM_FUZZY_THRESHOLD in azure_config.txt or the
+        matching AZURE_AI_* environment variables. The default is
+        translation_memory.sqlite3 next to the application, capped at 200,000
+        entries, with near-duplicate matching at 0.7 similarity (0 turns it off).
+        """
+        path = self.config_setting(path, 'TRANSLATION_MEMORY', 'AZURE_AI_TRANSLATION_MEMORY', str)
+        max_entries = self.config_setting(max_entries, 'TM_MAX_ENTRIES', 'AZURE_AI_TM_MAX_ENTRIES', int) or 200000
+        fuzzy_threshold = self.config_setting(fuzzy_threshold, 'TM_FUZZY_THRESHOLD', 'AZURE_AI_TM_FUZZY_THRESHOLD', float)
+        
+        if self.translation_memory is not None:
+            self.translation_memory.close()
+            self.translation_memory = None
+        
+        if path is None or path.lower() != "off":
+            path = Path(path) if path else self.get_application_directory() / "translation_memory.sqlite3"
+            try:
+                self.translation_memory = TranslationMemory(
+                    path, max_entries, fuzzy_threshold=0.7 if fuzzy_threshold is None else fuzzy_threshold
+                )
+                print(f"🧠 Translation memory: {self.translation_memory.entries:,} cached chunks in {path}")
+            except sqlite3.Error as e:
+                print(f"⚠️ Translation memory unavailable ({path}): {e}")
+        
+        if self.azure_translator:
+            self.azure_translator.translation_memory = self.translation_memory
+    
+    def configure_output_sizing(self, path: str = None, margin: float = None):
+        """Size max_tokens from the output/source token ratios seen in earlier runs
+        
+        Values not passed come from OUTPUT_SIZING (a JSON file path, or "off"
+        for the fixed len(text) + 500 reservation) and MAX_TOKENS_MARGIN in
+        azure_config.txt or the matching AZURE_AI_* environment variables. The
+        default is output_sizing.json next to the application, margin 1.2.
+        """
+        path = self.config_setting(path, 'OUTPUT_SIZING', 'AZURE_AI_OUTPUT_SIZING', str)
+        margin = self.config_setting(margin, 'MAX_TOKENS_MARGIN', 'AZURE_AI_MAX_TOKENS_MARGIN', float) or 1.2
+        
+        if self.output_sizing is not None:
+            self.output_sizing.save()
+        self.output_sizing = None
+        if path is None or path.lower() != "off":
+            path = Path(path) if path else self.get_application_directory() / "output_sizing.json"
+            self.output_sizing = OutputTokenModel(path, margin, self.chunk_budget.max_output_tokens)
+        
+        if self.azure_translator:
+            self.azure_translator.output_sizing = self.output_sizing
+    
+    def configure_chunk_tuning(self, path: str = None):
+        """Pick each run's chunk size from the throughput earlier runs measured per size
+        
+        path comes from CHUNK_TUNING (a JSON file path, or "off" to always use
+        CHUNK_TOKENS / HTML_CHUNK_TOKENS) in azure_config.txt or the
+        AZURE_AI_CHUNK_TUNING environment variable. The default is
+        chunk_tuning.json next to the application. Until a size has enough
+        history the configured sizes are used.
+        """
+        path = self.config_setting(path, 'CHUNK_TUNING', 'AZURE_AI_CHUNK_TUNING', str)
+        
+        if self.chunk_tuning is not None:
+            self.chunk_tuning.save()
+        self.chunk_tuning = None
+        if path is None or path.lower() != "off":
+            path = Path(path) if path else self.get_application_directory() / "chunk_tuning.json"
+            self.chunk_tuning = ChunkSizeTuner(path, self.chunk_budget.text_tokens)
+        
+        if self.azure_translator:
+            self.azure_translator.chunk_tuning = self.chunk_tuning
+    
+    def tune_chunk_size(self, translator: AzureDeepSeekTranslator):
+        """Set this run's chunk sizes from the tuner's history for the translator's deployments"""
+        if not self.chunk_tuning or translator is None:
+            return
+        budget = self.chunk_budget
+        size = self.chunk_tuning.choose(translator.backends, budget.text_tokens, budget.limit(max(ChunkSizeTuner.SIZES)))
+        if size != budget.text_tokens:
+            budget.resize(size)
+        self.chunk_tuning.begin_run(translator.backends)
+        self.log_translation_message(f"📐 Chunk size: {self.chunk_tuning.describe(translator.backends)}")
+    
+    def describe_timeouts(self) -> str:
+        """One-line summary of timeouts and deadlines for the run log"""
+        def limit(seconds):
+            return f"{seconds:g}s" if seconds else "none"
+        
+        summary = f"file deadline {limit(self.file_timeout)}, run deadline {limit(self.run_timeout)}"
+        if self.azure_translator:
+            backend = self.azure_translator.backends[0]
+            summary = (f"connect {limit(backend.connect_timeout)} / "
+                       f"read {limit(backend.read_timeout)} per request, {summary}")
+        return summary
+    
+    def config_setting(self, value, key: str, env_var: str, convert):
+        """Return value if given, else the azure_config.txt setting or environment variable, converted"""
+        if value is not None:
+            return value
+        raw = load_azure_settings().get(key) or os.getenv(env_var, "")
+        try:
+            return convert(raw) if raw else None
+        except ValueError:
+            print(f"⚠️ Ignoring invalid {key} setting: {raw}")
+            return None
+    
+    def set_concurrency(self, chunk_workers: int = None, file_workers: int = None, max_in_flight: int = None):
+        """Adjust parallelism for the next run"""
+        if chunk_workers:
+            self.chunk_workers = chunk_workers
+        if file_workers:
+            self.file_workers = file_workers
+        if max_in_flight and max_in_flight != self.max_in_flight_requests:
+            self.max_in_flight_requests = max_in_flight
+            if self.azure_translator:
+                self.azure_translator.max_in_flight = max_in_flight
+                for backend in self.azure_translator.backends:
+                    backend.max_in_flight = max_in_flight
+                    backend.concurrency_limiter.set_max_limit(max_in_flight)
+    
     def get_application_directory(self):
         """Get the directory where the application is running from"""
         if getattr(sys, 'frozen', False):
@@ -453,90 +3262,184 @@ class DeepSeekOnlyTranslator:
     # ========== GLOSSARY SYSTEM ==========
     
     def load_glossary_csv(self, csv_path: str, glossary_name: str = None) -> str:
-        """Load glossary from CSV file"""
+        """Load glossary from CSV file - or from its compiled .glossidx index when that is up to date"""
         try:
-            # Read CSV with proper handling of missing values
-            df = pd.read_csv(csv_path, encoding='utf-8', keep_default_na=False, na_values=[''])
-            
-            # Validate CSV format
-            required_columns = ['type', 'raw_name', 'translated_name']
-            if not all(col in df.columns for col in required_columns):
-                return f"❌ CSV must have columns: {required_columns}. Found: {list(df.columns)}"
-            
-            # Convert to glossary dictionary
-            glossary = {}
-            skipped_rows = 0
-            
-            for index, row in df.iterrows():
-                try:
-                    # Handle potential NaN/float values safely
-                    raw_name = row['raw_name']
-                    translated_name = row['translated_name']
-                    term_type = row['type']
-                    
-                    # Skip rows with missing essential data
-                    if pd.isna(raw_name) or pd.isna(translated_name) or pd.isna(term_type):
-                        skipped_rows += 1
-                        continue
-                    
-                    # Convert to string and strip whitespace
-                    korean_term = str(raw_name).strip()
-                    english_term = str(translated_name).strip()
-                    term_type_clean = str(term_type).strip()
-                    
-                    # Handle gender field (optional)
-                    gender = row.get('gender', '')
-                    if pd.isna(gender):
-                        gender = ''
-                    else:
-                        gender = str(gender).strip()
-                    
-                    # Skip empty terms
-                    if not korean_term or not english_term or not term_type_clean:
-                        skipped_rows += 1
-                        continue
-                    
-                    glossary[korean_term] = {
-                        'translation': english_term,
-                        'type': term_type_clean,
-                        'gender': gender,
-                        'usage_count': 0,
-                        'last_used': None
-                    }
-                    
-                except Exception as e:
-                    print(f"   ⚠️ Skipping row {index + 1}: {e}")
-                    skipped_rows += 1
-                    continue
+            glossary, skipped_rows, matcher = self.read_glossary_file(csv_path)
             
             # Store glossary
             if not glossary_name:
                 glossary_name = Path(csv_path).stem
                 
-            self.glossaries[glossary_name] = glossary
+            self.store_glossary(glossary_name, glossary, matcher)
             
             success_msg = f"✅ Loaded glossary '{glossary_name}' with {len(glossary)} terms"
             if skipped_rows > 0:
                 success_msg += f" (skipped {skipped_rows} invalid rows)"
             
             print(success_msg)
-            
-            # Show sample terms
-            print(f"   📋 Sample terms:")
-            for i, (korean, data) in enumerate(list(glossary.items())[:3]):
-                print(f"      • {korean} → {data['translation']} ({data['type']})")
-                if i >= 2:  # Show max 3 samples
-                    break
+            self.print_sample_terms(glossary)
             
             return f"Glossary '{glossary_name}' loaded successfully"
             
+        except GlossaryFormatError as e:
+            return f"❌ {e}"
         except Exception as e:
             return f"❌ Error loading glossary: {e}"
     
+    def load_glossary_csvs(self, csv_paths: List[str], glossary_name: str = None, workers: int = None) -> str:
+        """Load several glossary CSVs in parallel and merge them into one glossary
+        
+        Later files take precedence: when two files define the same Korean
+        term, the entry from the file listed last wins.
+        """
+        csv_paths = [str(path) for path in csv_paths]
+        if not csv_paths:
+            return "❌ No glossary files given"
+        if len(csv_paths) == 1:
+            return self.load_glossary_csv(csv_paths[0], glossary_name)
+        
+        workers = workers or min(len(csv_paths), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="glossary") as executor:
+            futures = [executor.submit(self.read_glossary_file, path) for path in csv_paths]
+            loaded = []
+            for path, future in zip(csv_paths, futures):
+                try:
+                    loaded.append((path, future.result()))
+                except GlossaryFormatError as e:
+                    print(f"   ⚠️ Skipping {Path(path).name}: {e}")
+                except Exception as e:
+                    print(f"   ⚠️ Skipping {Path(path).name}: Error loading glossary: {e}")
+        
+        if not loaded:
+            return "❌ None of the glossary files could be loaded"
+        
+        # Merge in list order so the last file's entry is the one that stays
+        glossary = {}
+        skipped_rows = 0
+        overridden = 0
+        for path, (file_glossary, file_skipped, _) in loaded:
+            skipped_rows += file_skipped
+            for korean_term, entry in file_glossary.items():
+                if korean_term in glossary:
+                    overridden += 1
+                glossary[korean_term] = entry
+        
+        if not glossary_name:
+            glossary_name = "+".join(Path(path).stem for path, _ in loaded)
+        
+        self.store_glossary(glossary_name, glossary, GlossaryMatcher(glossary))
+        
+        success_msg = f"✅ Merged {len(loaded)} glossaries into '{glossary_name}' with {len(glossary)} terms"
+        if overridden > 0:
+            success_msg += f" ({overridden} overridden by later files)"
+        if skipped_rows > 0:
+            success_msg += f" (skipped {skipped_rows} invalid rows)"
+        
+        print(success_msg)
+        self.print_sample_terms(glossary)
+        
+        return f"Glossary '{glossary_name}' loaded successfully"
+    
+    def store_glossary(self, glossary_name: str, glossary: Dict, matcher: GlossaryMatcher):
+        """Register a loaded glossary along with its compiled matcher"""
+        self.glossaries[glossary_name] = glossary
+        with self._glossary_lock:
+            self.glossary_matchers[glossary_name] = (glossary, len(glossary), matcher)
+    
+    def print_sample_terms(self, glossary: Dict):
+        """Show the first few terms of a freshly loaded glossary"""
+        print(f"   📋 Sample terms:")
+        for korean, data in list(glossary.items())[:3]:
+            print(f"      • {korean} → {data['translation']} ({data['type']})")
+    
+    def read_glossary_file(self, csv_path: str) -> Tuple[Dict, int, GlossaryMatcher]:
+        """Parse one glossary CSV - returns (glossary, skipped_rows, matcher)
+        
+        Uses the compiled .glossidx index when it is up to date, otherwise
+        parses the CSV and saves a fresh index. Raises GlossaryFormatError
+        when the CSV is missing required columns.
+        """
+        index = load_glossary_index(csv_path)
+        if index:
+            rows, skipped_rows, matcher = index
+            glossary = {korean_term: self.new_glossary_entry(english_term, term_type, gender)
+                        for korean_term, english_term, term_type, gender in rows}
+            print(f"   ⚡ Loaded compiled index {glossary_index_path(csv_path).name}")
+            return glossary, skipped_rows, matcher
+        
+        glossary, skipped_rows = self.read_glossary_rows(csv_path)
+        
+        # Compile once and save, so the next load skips parsing and building
+        matcher = GlossaryMatcher(glossary)
+        rows = [[korean_term, data['translation'], data['type'], data['gender']]
+                for korean_term, data in glossary.items()]
+        save_glossary_index(csv_path, rows, skipped_rows, matcher)
+        return glossary, skipped_rows, matcher
+    
+    def new_glossary_entry(self, english_term: str, term_type: str, gender: str = '') -> Dict:
+        """A glossary entry with fresh usage stats"""
+        return {
+            'translation': english_term,
+            'type': term_type,
+            'gender': gender,
+            'usage_count': 0,
+            'last_used': None
+        }
+    
+    def read_glossary_rows(self, csv_path: str) -> Tuple[Dict, int]:
+        """Stream glossary CSV rows into a glossary dictionary - returns (glossary, skipped_rows)
+        
+        Rows missing a type, raw_name or translated_name are skipped and
+        counted; gender is optional. Values are kept as written, so a term
+        like 007 is not turned into a number.
+        """
+        glossary = {}
+        skipped_rows = 0
+        
+        # utf-8-sig drops the BOM Excel puts at the start of exported CSVs
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            header = [column.strip() for column in next(reader, [])]
+            
+            # Validate CSV format
+            required_columns = ['type', 'raw_name', 'translated_name']
+            if not all(col in header for col in required_columns):
+                raise GlossaryFormatError(f"CSV must have columns: {required_columns}. Found: {header}")
+            
+            type_at = header.index('type')
+            raw_name_at = header.index('raw_name')
+            translated_name_at = header.index('translated_name')
+            gender_at = header.index('gender') if 'gender' in header else None
+            
+            for index, row in enumerate(reader):
+                if not row:
+                    continue  # Blank line
+                try:
+                    # Short rows are missing their trailing fields
+                    korean_term = row[raw_name_at].strip() if raw_name_at < len(row) else ''
+                    english_term = row[translated_name_at].strip() if translated_name_at < len(row) else ''
+                    term_type = row[type_at].strip() if type_at < len(row) else ''
+                    gender = row[gender_at].strip() if gender_at is not None and gender_at < len(row) else ''
+                    
+                    # Skip empty terms
+                    if not korean_term or not english_term or not term_type:
+                        skipped_rows += 1
+                        continue
+                    
+                    glossary[korean_term] = self.new_glossary_entry(english_term, term_type, gender)
+                    
+                except Exception as e:
+                    print(f"   ⚠️ Skipping row {index + 1}: {e}")
+                    skipped_rows += 1
+                    continue
+        
+        return glossary, skipped_rows
+    
     def set_active_glossary(self, glossary_name: str) -> bool:
         """Set which glossary to use for translation"""
         if glossary_name in self.glossaries:
             self.active_glossary = glossary_name
+            self.glossary_stack = []
             print(f"✅ Active glossary set to: {glossary_name}")
             # Initialize usage tracking for this glossary
             self.glossary_usage = {}
@@ -545,55 +3448,197 @@ class DeepSeekOnlyTranslator:
             print(f"❌ Glossary '{glossary_name}' not found")
             return False
     
-    def prepare_glossary_for_translation(self) -> str:
-        """Prepare glossary terms as a string for DeepSeek"""
-        if not self.active_glossary:
+    def set_glossary_stack(self, glossary_names: List[str]) -> bool:
+        """Use several loaded glossaries at once, lowest precedence first (e.g. global, world, series)
+        
+        A term defined in more than one layer takes the entry from the last
+        layer listed. Terms the layers disagree on are reported.
+        """
+        missing = [name for name in glossary_names if name not in self.glossaries]
+        if missing or not glossary_names:
+            print(f"❌ Glossaries not found: {missing}" if missing else "❌ No glossaries given")
+            return False
+        
+        self.glossary_stack = list(glossary_names)
+        self.active_glossary = glossary_names[-1]
+        self.glossary_usage = {}
+        
+        stack = self.get_glossary_stack()
+        print(f"✅ Glossary stack set to: {stack.describe()} - {len(stack.entries)} terms")
+        conflicts = stack.conflicts()
+        if conflicts:
+            print(f"   ⚠️ {len(conflicts)} terms differ between layers:")
+            for conflict in conflicts[:5]:
+                print(f"      • {self.describe_glossary_conflict(conflict)}")
+            if len(conflicts) > 5:
+                print(f"      • ... and {len(conflicts) - 5} more")
+        return True
+    
+    def active_glossary_names(self) -> List[str]:
+        """Glossaries in effect, lowest precedence first"""
+        if self.glossary_stack:
+            return [name for name in self.glossary_stack if name in self.glossaries]
+        return [self.active_glossary] if self.active_glossary in self.glossaries else []
+    
+    def get_glossary_stack(self) -> GlossaryStack:
+        """The resolved view over the active glossaries, or None when there are none
+        
+        Rebuilt only when the layers change - a different glossary, a reload,
+        or terms added or removed.
+        """
+        names = self.active_glossary_names()
+        if not names:
+            return None
+        
+        # A single glossary resolves to itself and keeps its own (possibly mmapped) matcher
+        matcher = self.get_glossary_matcher(names[0]) if len(names) == 1 else None
+        layers = [(name, self.glossaries[name]) for name in names]
+        signature = tuple((name, id(glossary), len(glossary)) for name, glossary in layers)
+        with self._glossary_lock:
+            stack = self._resolved_glossary
+            if stack is None or stack.signature != signature or (matcher and stack.matcher is not matcher):
+                stack = GlossaryStack(layers, matcher)
+                self._resolved_glossary = stack
+            return stack
+    
+    def describe_glossary_conflict(self, conflict: Dict) -> str:
+        """One line for the conflict report"""
+        used_layer, used_translation = conflict["used"]
+        overridden = ", ".join(f"{translation} ({layer})" for layer, translation in conflict["overridden"])
+        return f"{conflict['term']} → {used_translation} ({used_layer}), overrides {overridden}"
+    
+    def prepare_glossary_for_translation(self, text: str = None) -> str:
+        """Prepare glossary terms as a string for DeepSeek
+        
+        With text, only the terms that occur in it are listed - the most
+        frequent (then longest) first, up to max_glossary_terms when set.
+        """
+        stack = self.get_glossary_stack()
+        if not stack:
             return ""
         
-        glossary = self.glossaries[self.active_glossary]
+        glossary = stack.entries
+        
+        if text is None:
+            korean_terms = list(glossary)
+        else:
+            counts = stack.matcher.count(text)
+            korean_terms = sorted(counts, key=lambda term: (-counts[term], -len(term)))
+            if self.max_glossary_terms:
+                korean_terms = korean_terms[:self.max_glossary_terms]
         
         glossary_text = []
-        for korean_term, data in glossary.items():
+        for korean_term in korean_terms:
+            data = glossary[korean_term]
             english_term = data['translation']
             term_type = data['type']
             glossary_text.append(f"- {korean_term} → {english_term} ({term_type})")
         
         return '\n'.join(glossary_text)
     
-    def track_glossary_usage(self, korean_text: str, english_text: str):
+    def get_glossary_matcher(self, glossary_name: str) -> GlossaryMatcher:
+        """The compiled matcher for a glossary, rebuilt when the glossary has been reloaded or changed size"""
+        glossary = self.glossaries[glossary_name]
+        with self._glossary_lock:
+            cached = self.glossary_matchers.get(glossary_name)
+            if cached is None or cached[0] is not glossary or cached[1] != len(glossary):
+                cached = (glossary, len(glossary), GlossaryMatcher(glossary))
+                self.glossary_matchers[glossary_name] = cached
+            return cached[2]
+    
+    def find_glossary_terms(self, text: str) -> Dict[str, int]:
+        """Active glossary terms that occur in the text, with how often they occur"""
+        stack = self.get_glossary_stack()
+        return stack.matcher.count(text) if stack else {}
+    
+    def chunk_glossary(self, chunk: str, glossary_terms: str) -> str:
+        """Glossary block for one request - just the chunk's own terms unless per-chunk filtering is off"""
+        if self.glossary_per_chunk and self.active_glossary_names():
+            return self.prepare_glossary_for_translation(chunk)
+        return glossary_terms
+    
+    def substitute_glossary_placeholders(self, chunk: str) -> Tuple[str, str, Dict[str, str]]:
+        """Swap the chunk's glossary terms for placeholders - returns (text, legend, placeholders)
+        
+        Each distinct term gets one placeholder, in order of first appearance.
+        The legend gives the model each placeholder's type and gender, and
+        placeholders maps them back to the English terms.
+        """
+        stack = self.get_glossary_stack()
+        if not stack or PLACEHOLDER_PATTERN.search(chunk):
+            return chunk, "", {}
+        
+        tokens = {}
+        legend = []
+        parts = []
+        position = 0
+        for start, korean_term in stack.matcher.find_all(chunk):
+            if korean_term not in tokens:
+                tokens[korean_term] = placeholder_token(len(tokens))
+                data = stack.entries[korean_term]
+                gender = f", {data['gender']}" if data.get('gender') else ""
+                legend.append(f"- {tokens[korean_term]} → {data['type']}{gender}")
+            parts.append(chunk[position:start])
+            parts.append(tokens[korean_term])
+            position = start + len(korean_term)
+        parts.append(chunk[position:])
+        
+        placeholders = {token: stack.entries[korean_term]['translation'] for korean_term, token in tokens.items()}
+        return ''.join(parts), '\n'.join(legend), placeholders
+    
+    def prepare_chunk_request(self, chunk: str, glossary_terms: str) -> Tuple[str, str, Dict[str, str]]:
+        """Text, glossary block and placeholders to send for one chunk
+        
+        A chunk that already contains ⟦…⟧ can't use placeholders, so its
+        glossary terms are listed instead.
+        """
+        if self.glossary_placeholders and not PLACEHOLDER_PATTERN.search(chunk):
+            return self.substitute_glossary_placeholders(chunk)
+        return chunk, self.chunk_glossary(chunk, glossary_terms), None
+    
+    def track_glossary_usage(self, korean_text: str, english_text: str, usage: Dict = None):
         """Track which glossary terms were used in translation"""
-        if not self.active_glossary:
+        stack = self.get_glossary_stack()
+        if not stack:
             return
         
-        glossary = self.glossaries[self.active_glossary]
+        # Each document keeps its own counts so parallel files don't mix them
+        if usage is None:
+            usage = self.glossary_usage
+        
+        glossary = stack.entries
         
-        for korean_term, data in glossary.items():
-            if korean_term in korean_text:
-                # Term was in the source text
-                english_term = data['translation']
-                if english_term in english_text:
-                    # Term was translated correctly
-                    if korean_term not in self.glossary_usage:
-                        self.glossary_usage[korean_term] = 0
-                    self.glossary_usage[korean_term] += 1
+        # Every occurrence of a term in the source text counts
+        for korean_term, occurrences in stack.matcher.count(korean_text).items():
+            english_term = glossary[korean_term]['translation']
+            if english_term in english_text:
+                # Term was translated correctly
+                if korean_term not in usage:
+                    usage[korean_term] = 0
+                usage[korean_term] += occurrences
     
-    def update_glossary_after_file(self, file_name: str):
+    def update_glossary_after_file(self, file_name: str, usage: Dict = None):
         """Update glossary usage counts after processing a file"""
-        if not self.active_glossary or not self.glossary_usage:
+        if usage is None:
+            usage = self.glossary_usage
+        
+        stack = self.get_glossary_stack()
+        if not stack or not usage:
             return
         
         print(f"\n📚 Updating glossary usage for {file_name}...")
         
-        # Update usage counts
-        glossary = self.glossaries[self.active_glossary]
+        # Update usage counts - the entries belong to whichever layer supplied the term
+        glossary = stack.entries
         updated_terms = []
         
-        for korean_term, usage_count in self.glossary_usage.items():
-            if korean_term in glossary:
-                glossary[korean_term]['usage_count'] += usage_count
-                glossary[korean_term]['last_used'] = datetime.now().strftime('%Y-%m-%d')
-                english_term = glossary[korean_term]['translation']
-                updated_terms.append(f"{korean_term} → {english_term} (used {usage_count} times)")
+        with self._glossary_lock:
+            for korean_term, usage_count in usage.items():
+                if korean_term in glossary:
+                    glossary[korean_term]['usage_count'] += usage_count
+                    glossary[korean_term]['last_used'] = datetime.now().strftime('%Y-%m-%d')
+                    english_term = glossary[korean_term]['translation']
+                    updated_terms.append(f"{korean_term} → {english_term} (used {usage_count} times)")
         
         if updated_terms:
             print(f"   ✅ Updated usage for {len(updated_terms)} terms")
@@ -603,39 +3648,44 @@ class DeepSeekOnlyTranslator:
                 print(f"      • ... and {len(updated_terms) - 5} more")
         
         # Reset usage tracking for next file
-        self.glossary_usage = {}
+        usage.clear()
     
     def save_updated_glossary(self, output_folder: Path):
-        """Save the updated glossary to the glossary folder - KEEP ORIGINAL 4-column format"""
-        if not self.active_glossary:
-            return
-
-        try:
-            glossary_name = self.active_glossary
-            glossary = self.glossaries[glossary_name]
+        """Save the updated glossary to the glossary folder - KEEP ORIGINAL 4-column format
+        
+        With a glossary stack, each layer is saved to its own file.
+        """
+        for glossary_name in self.active_glossary_names():
+            try:
+                glossary = self.glossaries[glossary_name]
 
-            # Create glossary output file
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            glossary_file = output_folder / "glossaries" / f"{glossary_name}_updated_{timestamp}.csv"
+                # Create glossary output file
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                glossary_file = output_folder / "glossaries" / f"{glossary_name}_updated_{timestamp}.csv"
 
-            # Create CSV content with ORIGINAL 4-column format
-            csv_content = "type,raw_name,translated_name,gender\n"
-            for korean_term, info in glossary.items():
-                # Keep only the original 4 columns
-                csv_content += f"{info.get('type', '')},{korean_term},{info.get('translation', '')},{info.get('gender', '')}\n"
+                # Create CSV content with ORIGINAL 4-column format
+                csv_content = "type,raw_name,translated_name,gender\n"
+                for korean_term, info in glossary.items():
+                    # Keep only the original 4 columns
+                    csv_content += f"{info.get('type', '')},{korean_term},{info.get('translation', '')},{info.get('gender', '')}\n"
 
-            # Save to file
-            with open(glossary_file, 'w', encoding='utf-8') as f:
-                f.write(csv_content)
+                # Save to file
+                with open(glossary_file, 'w', encoding='utf-8') as f:
+                    f.write(csv_content)
 
-            print(f"💾 Glossary saved to: {glossary_file}")
-            print(f"   📋 Format: type,raw_name,translated_name,gender (4 columns)")
+                print(f"💾 Glossary saved to: {glossary_file}")
+                print(f"   📋 Format: type,raw_name,translated_name,gender (4 columns)")
 
-        except Exception as e:
-            print(f"❌ Error saving glossary: {e}")
+            except Exception as e:
+                print(f"❌ Error saving glossary: {e}")
 
-    def save_translation_logs(self, output_folder: Path, results: Dict):
-        """Save translation logs to the logs folder"""
+    def save_translation_logs(self, output_folder: Path, results: Dict, translator: "AzureDeepSeekTranslator" = None):
+        """Save translation logs to the logs folder
+        
+        translator is the engine that ran the files (the async one for
+        process_folder_async); its limiters, breakers and budget are logged.
+        """
+        translator = translator or self.azure_translator
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             log_file = output_folder / "logs" / f"translation_log_{timestamp}.txt"
@@ -648,6 +3698,10 @@ class DeepSeekOnlyTranslator:
             log_content += f"🧠 Method: {results.get('method', 'Azure AI DeepSeek')}\n"
             log_content += f"📊 Total time: {results.get('total_time', 0):.2f} seconds\n"
             log_content += f"📝 Total characters: {results.get('total_chars', 0):,}\n"
+            if results.get('aborted'):
+                log_content += f"🛑 Run aborted: {results['aborted']}\n"
+            if results.get('dedup'):
+                log_content += f"♻️ Batch dedup: {self.describe_dedup(results['dedup'])}\n"
             log_content += f"=" * 60 + "\n\n"
             
             # Processed files
@@ -667,23 +3721,74 @@ class DeepSeekOnlyTranslator:
                 log_content += f"-" * 50 + "\n"
                 for failed_info in results['failed_files']:
                     log_content += f"📄 {failed_info['file']}\n"
-                    log_content += f"   ❌ Error: {failed_info['error']}\n\n"
+                    if failed_info.get('timed_out'):
+                        log_content += f"   ⏰ Timed out: {failed_info['error']}\n\n"
+                    else:
+                        log_content += f"   ❌ Error: {failed_info['error']}\n\n"
+            
+            # Deferred files
+            if results.get('deferred_files'):
+                log_content += f"⏸️ DEFERRED FILES ({len(results['deferred_files'])}) - resume with the deferred manifest:\n"
+                log_content += f"-" * 50 + "\n"
+                for deferred_info in results['deferred_files']:
+                    log_content += f"📄 {deferred_info['file']}\n"
+                    log_content += f"   ⏸️ Reason: {deferred_info['reason']}\n\n"
             
             # Glossary usage
-            if self.active_glossary and self.glossaries:
+            stack = self.get_glossary_stack()
+            if stack:
                 log_content += f"📚 GLOSSARY USAGE:\n"
                 log_content += f"-" * 50 + "\n"
-                log_content += f"Active glossary: {self.active_glossary}\n"
+                if len(stack.layers) > 1:
+                    log_content += f"Glossary stack: {stack.describe()}\n"
+                else:
+                    log_content += f"Active glossary: {stack.names[0]}\n"
                 
-                glossary = self.glossaries[self.active_glossary]
+                glossary = stack.entries
                 used_terms = [(k, v) for k, v in glossary.items() if v.get('usage_count', 0) > 0]
                 
                 if used_terms:
                     log_content += f"Used terms ({len(used_terms)}):\n"
                     for korean, data in sorted(used_terms, key=lambda x: x[1]['usage_count'], reverse=True):
-                        log_content += f"   • {korean} → {data['translation']} (used {data['usage_count']} times)\n"
+                        source = f" [{stack.source_of(korean)}]" if len(stack.layers) > 1 else ""
+                        log_content += f"   • {korean} → {data['translation']}{source} (used {data['usage_count']} times)\n"
                 else:
                     log_content += f"No glossary terms were used in this translation.\n"
+                
+                conflicts = stack.conflicts()
+                if conflicts:
+                    log_content += f"Layer conflicts ({len(conflicts)}):\n"
+                    for conflict in conflicts:
+                        log_content += f"   • {self.describe_glossary_conflict(conflict)}\n"
+                log_content += "\n"
+            
+            # Adaptive concurrency and backoff
+            if translator:
+                backends = translator.backends
+                log_content += f"⚡ CONCURRENCY:\n"
+                log_content += f"-" * 50 + "\n"
+                if len(backends) > 1:
+                    log_content += f"Load balancing: {translator.describe_routing()}\n"
+                for backend in backends:
+                    if len(backends) > 1:
+                        log_content += f"🔀 {backend.name}:\n"
+                    log_content += f"{backend.concurrency_limiter.describe()}\n"
+                    log_content += f"{backend.rate_limiter.describe()}\n"
+                    log_content += f"Circuit breaker: {backend.circuit_breaker.describe()}\n"
+                    log_content += f"Hedged requests: {backend.hedge_policy.describe()}\n"
+                    events = sorted(list(backend.concurrency_limiter.events) + list(backend.circuit_breaker.events))
+                    if events:
+                        log_content += f"Recent adjustments:\n"
+                        for event in events:
+                            log_content += f"   • {event}\n"
+                log_content += f"Retry budget: {translator.retry_budget.describe()}\n"
+                log_content += f"Timeouts: {self.describe_timeouts()}\n"
+                if self.translation_memory:
+                    log_content += f"Translation memory: {self.translation_memory.describe()}\n"
+                if self.output_sizing:
+                    log_content += f"Output sizing: {self.output_sizing.describe()}\n"
+                if self.chunk_tuning:
+                    log_content += f"Chunk size: {self.chunk_tuning.describe(backends)}\n"
                 log_content += "\n"
             
             # Additional logs from translation process
@@ -699,9 +3804,48 @@ class DeepSeekOnlyTranslator:
             
             print(f"📋 Translation log saved to: {log_file}")
             
+            if results.get('deferred_files'):
+                self.save_deferred_manifest(output_folder, results)
+            
         except Exception as e:
             print(f"❌ Error saving translation log: {e}")
     
+    def save_deferred_manifest(self, output_folder: Path, results: Dict) -> Path:
+        """Save the deferred files of a run so resume_deferred() can pick them up later"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        manifest_file = output_folder / "logs" / f"deferred_{timestamp}.json"
+        
+        manifest = {
+            "created": datetime.now().isoformat(timespec='seconds'),
+            "source_lang": results.get('source_lang', 'ko'),
+            "target_lang": results.get('target_lang', 'en'),
+            "context": results.get('context', ''),
+            "output_folder": str(output_folder),
+            "files": results['deferred_files']
+        }
+        
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        
+        print(f"⏸️ Deferred manifest saved to: {manifest_file}")
+        return manifest_file
+    
+    def log_concurrency_status(self, translator: "AzureDeepSeekTranslator" = None):
+        """Log adaptive concurrency changes since the last call and the current limit"""
+        translator = translator or self.azure_translator
+        if not translator:
+            return
+        
+        backends = translator.backends
+        for backend in backends:
+            prefix = f"[{backend.name}] " if len(backends) > 1 else ""
+            limiter = backend.concurrency_limiter
+            for event in limiter.drain_events():
+                self.log_translation_message(f"⚡ {prefix}{event}")
+            for event in backend.circuit_breaker.drain_events():
+                self.log_translation_message(f"🔌 {prefix}{event}")
+            self.log_translation_message(f"⚡ {prefix}Concurrency: {int(limiter.limit)} (in flight now: {limiter.in_flight})")
+    
     def log_translation_message(self, message: str):
         """Add a message to the translation log"""
         timestamp = datetime.now().strftime('%H:%M:%S')
@@ -866,7 +4010,8 @@ class DeepSeekOnlyTranslator:
         
         return translatable_elements
     
-    def translate_html_document(self, html_content: str, context: str = "") -> str:
+    def translate_html_document(self, html_content: str, context: str = "", usage: Dict = None,
+                                deadline: Deadline = None) -> str:
         """Translate HTML document preserving structure"""
         
         if not self.use_azure_deepseek:
@@ -875,73 +4020,106 @@ class DeepSeekOnlyTranslator:
         print(f"🌐 Translating HTML document with structure preservation...")
         
         try:
-            # Parse HTML
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup, element_chunks, combined_texts, shared_elements = self.prepare_html_chunks(html_content)
             
-            # Extract translatable elements
-            translatable_elements = self.extract_translatable_elements(soup)
-            
-            if not translatable_elements:
-                print("   ⚠️ No translatable content found in HTML")
+            if not element_chunks and not shared_elements:
                 return html_content
             
-            print(f"   📦 Found {len(translatable_elements)} translatable elements")
-            
             # Prepare glossary terms
             glossary_terms = self.prepare_glossary_for_translation()
             
-            # Group elements for batch translation (similar to paragraph chunking)
-            element_chunks = self.group_elements_for_translation(translatable_elements)
+            # Translate all chunks - this can now raise TranslationFailedException
+            translated_texts = self.translate_chunks_concurrently(
+                combined_texts, glossary_terms, context, "paragraph", deadline
+            )
             
-            # Translate each chunk
-            for chunk_num, chunk in enumerate(element_chunks):
-                print(f"   🔄 Translating chunk {chunk_num + 1}/{len(element_chunks)}...")
-                
-                # Combine texts for this chunk
-                combined_text = '\n'.join([elem['original_text'] for elem in chunk])
-                
-                # Translate the combined text - this can now raise TranslationFailedException
-                translated_text = self.azure_translator.translate_with_glossary(
-                    combined_text, glossary_terms, context, "paragraph"
-                )
-                
-                # Track glossary usage
-                self.track_glossary_usage(combined_text, translated_text)
-                
-                # Split translated text back to individual elements
-                translated_parts = translated_text.split('\n')
-                
-                # Map translations back to elements
-                for i, elem_info in enumerate(chunk):
-                    if i < len(translated_parts):
-                        new_text = translated_parts[i].strip()
-                        if new_text:
-                            # Update the element's text content
-                            elem_info['element'].string = new_text
+            self.apply_html_translations(element_chunks, combined_texts, translated_texts, usage, shared_elements)
             
             # Return the modified HTML
             return str(soup)
             
+        except TranslationFailedException as e:
+            print(f"   ❌ HTML translation error: {e}")
+            raise
         except Exception as e:
             print(f"   ❌ HTML translation error: {e}")
             raise TranslationFailedException(f"HTML translation failed: {e}")
     
-    def group_elements_for_translation(self, elements, max_chunk_size=1500):
-        """Group HTML elements into chunks for efficient translation"""
+    def prepare_html_chunks(self, html_content: str) -> Tuple:
+        """Parse HTML and group its translatable elements into chunks
+        
+        Returns (soup, element_chunks, combined_texts, shared_elements).
+        Elements already translated for the whole batch go in shared_elements
+        instead of a chunk; both lists are empty when there's nothing to translate.
+        """
+        # Parse HTML
+        soup = BeautifulSoup(html_content, 'html.parser')
+        
+        # Extract translatable elements
+        translatable_elements = self.extract_translatable_elements(soup)
+        
+        if not translatable_elements:
+            print("   ⚠️ No translatable content found in HTML")
+            return soup, [], [], []
+        
+        print(f"   📦 Found {len(translatable_elements)} translatable elements")
+        
+        shared_elements = [elem for elem in translatable_elements if elem['original_text'] in self.shared_translations]
+        if shared_elements:
+            print(f"   ♻️ {len(shared_elements)} elements already translated for this batch")
+            translatable_elements = [elem for elem in translatable_elements
+                                     if elem['original_text'] not in self.shared_translations]
+        
+        # Group elements for batch translation (similar to paragraph chunking)
+        element_chunks = self.group_elements_for_translation(translatable_elements)
+        
+        # Combine texts for each chunk
+        combined_texts = ['\n'.join([elem['original_text'] for elem in chunk]) for chunk in element_chunks]
+        
+        return soup, element_chunks, combined_texts, shared_elements
+    
+    def apply_html_translations(self, element_chunks: List, combined_texts: List[str],
+                                translated_texts: List[str], usage: Dict = None, shared_elements: List = None):
+        """Write translated chunks, and elements shared across the batch, back into their HTML elements"""
+        for elem_info in shared_elements or []:
+            translated_text = self.shared_translations[elem_info['original_text']]
+            self.track_glossary_usage(elem_info['original_text'], translated_text, usage)
+            elem_info['element'].string = ' '.join(line.strip() for line in translated_text.splitlines() if line.strip())
+        
+        for chunk, combined_text, translated_text in zip(element_chunks, combined_texts, translated_texts):
+            # Track glossary usage
+            self.track_glossary_usage(combined_text, translated_text, usage)
+            
+            # Split translated text back to individual elements
+            translated_parts = translated_text.split('\n')
+            
+            # Map translations back to elements
+            for i, elem_info in enumerate(chunk):
+                if i < len(translated_parts):
+                    new_text = translated_parts[i].strip()
+                    if new_text:
+                        # Update the element's text content
+                        elem_info['element'].string = new_text
+    
+    def group_elements_for_translation(self, elements, max_chunk_tokens: int = None):
+        """Group HTML elements into chunks of up to max_chunk_tokens tokens (the HTML chunk budget by default)"""
+        budget = self.chunk_budget
+        limit = budget.limit(max_chunk_tokens or budget.html_tokens)
+        separator_tokens = budget.count('\n')
         chunks = []
         current_chunk = []
         current_size = 0
         
         for element in elements:
-            text_size = len(element['original_text'])
+            text_size = budget.count(element['original_text'])
             
-            if current_size + text_size > max_chunk_size and current_chunk:
+            if current_size + text_size > limit and current_chunk:
                 chunks.append(current_chunk)
                 current_chunk = [element]
-                current_size = text_size
+                current_size = text_size + separator_tokens
             else:
                 current_chunk.append(element)
-                current_size += text_size
+                current_size += text_size + separator_tokens
         
         if current_chunk:
             chunks.append(current_chunk)
@@ -950,41 +4128,239 @@ class DeepSeekOnlyTranslator:
     
     # ========== DIRECT TRANSLATION WITH DEEPSEEK ==========
     
-    def split_text_for_translation(self, text, max_chunk_size=1800):
+    def split_text_for_translation(self, text, max_chunk_tokens: int = None):
         """Split text into optimal chunks for DeepSeek translation"""
         
         paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        chunks = self.chunk_paragraphs(paragraphs, max_chunk_tokens)
+        
+        print(f"   📦 Split text into {len(chunks)} chunks for translation")
+        return chunks
+    
+    def chunk_paragraphs(self, paragraphs: List[str], max_chunk_tokens: int = None) -> List[str]:
+        """Pack consecutive paragraphs into chunks of up to max_chunk_tokens tokens (the text chunk budget by default)"""
+        return self.pack_paragraphs(paragraphs, max_chunk_tokens)[0]
+    
+    def pack_paragraphs(self, paragraphs: List[str], max_chunk_tokens: int = None) -> Tuple[List[str], List[str]]:
+        """Pack consecutive paragraphs into chunks - returns (chunks, joiners)
+        
+        Paragraphs over the budget are cut into pieces first (see
+        split_oversized_paragraph), so every chunk fits. joiners[i] is what
+        separated chunk i from the one before: a blank line when it starts a
+        new paragraph, otherwise the line break or space it was cut at.
+        """
+        budget = self.chunk_budget
+        limit = budget.limit(max_chunk_tokens or budget.text_tokens)
+        
+        units = []
+        for paragraph in paragraphs:
+            if budget.count(paragraph) > limit:
+                units.extend(self.split_oversized_paragraph(paragraph, limit))
+            else:
+                units.append(('\n\n', paragraph))
+        
         chunks = []
+        joiners = []
         current_chunk = []
         current_size = 0
         
+        for separator, unit in units:
+            # Measured with its separator - a lone space or line break rounds up to a whole token
+            joined_size = budget.count(separator + unit)
+            
+            # Summing pieces rounds each one up (a word-split chunk would fill about 60%), so check
+            # the joined text before closing the chunk; the next pieces add on to the exact size
+            if current_chunk and current_size + joined_size > limit:
+                exact_size = budget.count(''.join(current_chunk) + separator + unit)
+                if exact_size <= limit:
+                    current_chunk += [separator, unit]
+                    current_size = exact_size
+                    continue
+            
+            # If adding this piece would exceed limit, start new chunk
+            if current_chunk and current_size + joined_size > limit:
+                chunks.append(''.join(current_chunk))
+                current_chunk = []
+            
+            if current_chunk:
+                current_chunk += [separator, unit]
+                current_size += joined_size
+            else:
+                joiners.append(separator)
+                current_chunk = [unit]
+                current_size = budget.count(unit)
+        
+        # Add the last chunk
+        if current_chunk:
+            chunks.append(''.join(current_chunk))
+        
+        return chunks, joiners
+    
+    def split_oversized_paragraph(self, paragraph: str, limit: int) -> List[Tuple[str, str]]:
+        """Cut a paragraph that is over the chunk budget into (separator, piece) pairs that each fit
+        
+        Cuts at line breaks first - scraped chapters often have no blank
+        lines - then at Korean sentence ends (다. 요. ?! … and closing quotes),
+        then between words, and only as a last resort inside a word.
+        """
+        count = self.chunk_budget.count
+        
+        def sentences(text: str) -> List[str]:
+            parts, start = [], 0
+            for match in SENTENCE_END_PATTERN.finditer(text):
+                parts.append(text[start:match.end()])
+                start = match.end()
+            parts.append(text[start:])
+            return parts
+        
+        def hard_cut(text: str) -> List[str]:
+            parts = []
+            while text:
+                size = min(len(text), limit)
+                while size > 1 and count(text[:size]) > limit:
+                    size //= 2
+                parts.append(text[:size])
+                text = text[size:]
+            return parts
+        
+        levels = [
+            ('\n', lambda text: text.split('\n')),
+            (' ', sentences),
+            (' ', lambda text: text.split()),
+            ('', hard_cut)
+        ]
+        
+        def split(text: str, separator: str, level: int) -> List[Tuple[str, str]]:
+            if count(text) <= limit or level == len(levels):
+                return [(separator, text)]
+            level_separator, cut = levels[level]
+            pieces = []
+            for part in (part.strip() for part in cut(text)):
+                if part:
+                    pieces.extend(split(part, level_separator if pieces else separator, level + 1))
+            return pieces
+        
+        return split(paragraph, '\n\n', 0)
+    
+    def plan_text_chunks(self, text, max_chunk_tokens: int = None) -> Tuple[List[str], List]:
+        """Split text into chunks, leaving out paragraphs already translated for the whole batch
+        
+        Returns (chunks, layout); layout lists the document in order, each item
+        either the index of a chunk, the text of a shared paragraph, or
+        (index, separator) for a chunk that continues a paragraph cut to fit.
+        Shared paragraphs stay inline when taking them out would split the
+        text into more chunks than it needs without them.
+        """
+        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        chunks, layout = self.plan_paragraphs(paragraphs, self.shared_translations, max_chunk_tokens)
+        shared = len(layout) - len(chunks)
+        inline = 0
+        if shared:
+            plain_chunks, plain_layout = self.plan_paragraphs(paragraphs, (), max_chunk_tokens)
+            if len(plain_chunks) < len(chunks):
+                chunks, layout, inline, shared = plain_chunks, plain_layout, shared, 0
+        
+        continued = sum(1 for item in layout if isinstance(item, tuple))
+        message = f"   📦 Split text into {len(chunks)} chunks for translation"
+        if shared:
+            message += f" ({shared} shared paragraphs already translated)"
+        if inline:
+            message += f" ({inline} shared paragraphs left inline - taking them out would add requests)"
+        if continued:
+            message += f" ({continued} cut mid-paragraph to fit the token budget)"
+        print(message)
+        return chunks, layout
+    
+    def plan_paragraphs(self, paragraphs: List[str], shared, max_chunk_tokens: int = None) -> Tuple[List[str], List]:
+        """Pack paragraphs into chunks, breaking the runs at paragraphs found in shared - returns (chunks, layout)"""
+        chunks, layout, run = [], [], []
+        
+        def flush_run():
+            run_chunks, joiners = self.pack_paragraphs(run, max_chunk_tokens)
+            for chunk, joiner in zip(run_chunks, joiners):
+                layout.append(len(chunks) if joiner == '\n\n' else (len(chunks), joiner))
+                chunks.append(chunk)
+            run.clear()
+        
         for paragraph in paragraphs:
-            para_size = len(paragraph)
-            
-            # If adding this paragraph would exceed limit, start new chunk
-            if current_size + para_size > max_chunk_size and current_chunk:
-                chunks.append('\n\n'.join(current_chunk))
-                current_chunk = [paragraph]
-                current_size = para_size
+            if paragraph in shared:
+                flush_run()
+                layout.append(paragraph)
+            else:
+                run.append(paragraph)
+        flush_run()
+        return chunks, layout
+    
+    def assemble_text_translation(self, layout: List, chunks: List[str], translated_chunks: List[str],
+                                  usage: Dict = None) -> str:
+        """Join translated chunks and shared paragraphs back in document order, tracking glossary usage"""
+        parts = []
+        for item in layout:
+            joiner = '\n\n'
+            if isinstance(item, tuple):
+                item, joiner = item
+            if isinstance(item, int):
+                source, translation = chunks[item], translated_chunks[item]
             else:
-                current_chunk.append(paragraph)
-                current_size += para_size + 2
+                source, translation = item, self.shared_translations[item]
+            self.track_glossary_usage(source, translation, usage)
+            if parts:
+                parts.append(joiner)
+            parts.append(translation)
+        return ''.join(parts)
+    
+    def translate_chunks_concurrently(self, chunks: List[str], glossary_terms: str, context: str,
+                                      element_type: str = "paragraph", deadline: Deadline = None,
+                                      tuned: bool = False) -> List[str]:
+        """Translate chunks with a bounded worker pool, returning results in the original order
         
-        # Add the last chunk
-        if current_chunk:
-            chunks.append('\n\n'.join(current_chunk))
+        tuned marks text chunks planned with the tuned chunk size (see ChunkSizeTuner).
+        """
         
-        print(f"   📦 Split text into {len(chunks)} chunks for translation")
-        return chunks
+        def translate_chunk(index: int) -> str:
+            chunk = chunks[index]
+            text, chunk_terms, placeholders = self.prepare_chunk_request(chunk, glossary_terms)
+            print(f"   🔄 Translating chunk {index + 1}/{len(chunks)} ({len(chunk)} chars, "
+                  f"{len(chunk_terms.splitlines())} glossary {'placeholders' if placeholders else 'terms'})...")
+            try:
+                return self.azure_translator.translate_with_glossary(
+                    text, chunk_terms, context, element_type, deadline=deadline, placeholders=placeholders, tuned=tuned
+                )
+            except TranslationFailedException as e:
+                if not isinstance(e.__cause__, PlaceholderMismatchError):
+                    raise
+                # The model dropped or invented placeholders - list the terms instead (one request, no retries of the same prompt)
+                print(f"   ↩️ Chunk {index + 1}: placeholders not preserved - retrying with the glossary listed")
+                return self.azure_translator.translate_with_glossary(
+                    chunk, self.chunk_glossary(chunk, glossary_terms), context, element_type, deadline=deadline, tuned=tuned
+                )
+        
+        workers = max(1, min(self.chunk_workers, len(chunks)))
+        if workers == 1:
+            return [translate_chunk(i) for i in range(len(chunks))]
+        
+        translated_chunks = [None] * len(chunks)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk") as executor:
+            futures = {executor.submit(translate_chunk, i): i for i in range(len(chunks))}
+            try:
+                for future in as_completed(futures):
+                    translated_chunks[futures[future]] = future.result()
+            except BaseException:
+                # One failed chunk fails the document - drop the queued ones
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        return translated_chunks
     
-    def translate_document_with_deepseek(self, content: str, context: str = "", is_html: bool = False) -> str:
+    def translate_document_with_deepseek(self, content: str, context: str = "", is_html: bool = False,
+                                         usage: Dict = None, deadline: Deadline = None) -> str:
         """Translate entire document using Azure AI DeepSeek with glossary"""
         
         if not self.use_azure_deepseek:
             raise TranslationFailedException("Azure AI DeepSeek not available")
         
         if is_html:
-            return self.translate_html_document(content, context)
+            return self.translate_html_document(content, context, usage, deadline)
         else:
             print(f"🌐 Using Azure AI DeepSeek for direct Korean→English translation...")
             
@@ -992,27 +4368,165 @@ class DeepSeekOnlyTranslator:
             glossary_terms = self.prepare_glossary_for_translation()
             
             # Split text into manageable chunks
-            chunks = self.split_text_for_translation(content, 1800)
-            translated_chunks = []
+            chunks, layout = self.plan_text_chunks(content)
             
-            for i, chunk in enumerate(chunks):
-                print(f"   🔄 Translating chunk {i+1}/{len(chunks)} ({len(chunk)} chars)...")
-                
-                # This can now raise TranslationFailedException
-                translated_chunk = self.azure_translator.translate_with_glossary(
-                    chunk, glossary_terms, context, "paragraph"
-                )
-                
-                # Track glossary usage
-                self.track_glossary_usage(chunk, translated_chunk)
-                
-                translated_chunks.append(translated_chunk)
+            # This can now raise TranslationFailedException
+            translated_chunks = self.translate_chunks_concurrently(
+                chunks, glossary_terms, context, "paragraph", deadline, tuned=True
+            )
             
-            final_translation = '\n\n'.join(translated_chunks)
+            # Reassemble with shared paragraphs, tracking glossary usage
+            final_translation = self.assemble_text_translation(layout, chunks, translated_chunks, usage)
             print(f"✅ DeepSeek translation completed! Processed {len(chunks)} chunks")
             
             return final_translation
     
+    # ========== BATCH DEDUPLICATION ==========
+    
+    def find_shared_paragraphs(self, documents: List[Dict]) -> Dict:
+        """Find paragraphs and HTML elements that appear in more than one of the documents
+        
+        Returns a summary with the shared texts packed into request-sized
+        chunks, how often they occur, and the characters and requests that
+        translating them once saves. A text file only gives up its shared
+        paragraphs when that doesn't split it into more chunks (see
+        plan_text_chunks); texts fewer than two files would give up aren't shared.
+        """
+        file_texts = []
+        for doc_info in documents:
+            content = self.read_document(str(doc_info["path"]))
+            if content.startswith("Error"):
+                continue
+            if Path(doc_info["path"]).suffix.lower() in {'.html', '.htm'}:
+                soup = BeautifulSoup(content, 'html.parser')
+                file_texts.append((True, [elem['original_text'] for elem in self.extract_translatable_elements(soup)]))
+            else:
+                file_texts.append((False, [p.strip() for p in content.split('\n\n') if p.strip()]))
+        
+        # First occurrence order, so texts that sit together in the files are translated together
+        files_containing = Counter()
+        for _, texts in file_texts:
+            files_containing.update(set(texts))
+        # Shared texts are packed one per line, and paragraphs too big for one request are cut to fit in their files
+        chunk_limit = self.chunk_budget.limit(self.chunk_budget.text_tokens)
+        candidates = [text for text in dict.fromkeys(text for _, texts in file_texts for text in texts)
+                      if files_containing[text] > 1 and len(text) >= self.min_shared_paragraph_chars
+                      and '\n' not in text and self.chunk_budget.count(text) <= chunk_limit]
+        
+        # Requests each file sends without dedup
+        plain_requests = []
+        for is_html, texts in file_texts:
+            if is_html:
+                plain_requests.append(len(self.group_elements_for_translation([{'original_text': t} for t in texts])))
+            else:
+                plain_requests.append(len(self.plan_paragraphs(texts, ())[0]))
+        
+        # Drop texts that fewer than two files would give up, until the choice settles
+        shared_set = set(candidates)
+        while True:
+            uses = Counter()  # Occurrences given up
+            givers = Counter()  # Files giving a text up
+            file_requests = []
+            for (is_html, texts), plain in zip(file_texts, plain_requests):
+                if is_html:
+                    requests = len(self.group_elements_for_translation(
+                        [{'original_text': t} for t in texts if t not in shared_set]
+                    ))
+                else:
+                    requests = len(self.plan_paragraphs(texts, shared_set)[0])
+                    if requests > plain:
+                        file_requests.append(plain)
+                        continue
+                given_up = [text for text in texts if text in shared_set]
+                uses.update(given_up)
+                givers.update(set(given_up))
+                file_requests.append(requests)
+            used = {text for text in shared_set if givers[text] > 1}
+            if used == shared_set:
+                break
+            shared_set = used
+        
+        shared = [text for text in candidates if text in shared_set]
+        chunks = [[elem['original_text'] for elem in chunk] for chunk in self.group_elements_for_translation(
+            [{'original_text': text} for text in shared], self.chunk_budget.text_tokens
+        )]
+        
+        return {
+            "chunks": chunks,
+            "shared": len(shared),
+            "occurrences": sum(uses[text] for text in shared),
+            "chars_saved": sum(len(text) * (uses[text] - 1) for text in shared),
+            "requests_before": sum(plain_requests),
+            "requests_after": len(chunks) + sum(file_requests)
+        }
+    
+    def worth_deduplicating(self, summary: Dict) -> bool:
+        """Whether a dedup summary saves requests - logs why not otherwise"""
+        if not summary["shared"]:
+            return False
+        if summary["requests_after"] >= summary["requests_before"]:
+            self.log_translation_message(
+                f"♻️ Batch dedup skipped: {summary['shared']} shared paragraphs would take "
+                f"{summary['requests_before']} → {summary['requests_after']} requests"
+            )
+            return False
+        return True
+    
+    def translate_shared_paragraphs(self, documents: List[Dict], context: str, deadline: Deadline = None) -> Dict:
+        """Translate paragraphs repeated across the documents once, before the files themselves
+        
+        The files then reuse these translations instead of sending the text
+        again. Returns the dedup summary, or None when nothing is shared or
+        sharing wouldn't cut the number of requests.
+        """
+        self.shared_translations = {}
+        if not self.deduplicate_batches or len(documents) < 2 or not self.use_azure_deepseek:
+            return None
+        
+        summary = self.find_shared_paragraphs(documents)
+        if not self.worth_deduplicating(summary):
+            return None
+        
+        self.log_translation_message(f"♻️ Translating {summary['shared']} paragraphs shared across files once "
+                                     f"in {len(summary['chunks'])} requests...")
+        try:
+            translations = self.translate_chunks_concurrently(
+                ['\n'.join(chunk) for chunk in summary["chunks"]], self.prepare_glossary_for_translation(),
+                context, "paragraph", deadline
+            )
+        except TranslationFailedException as e:
+            self.log_translation_message(f"⚠️ Shared paragraphs will be translated per file instead: {e}")
+            return None
+        
+        return self.finish_shared_paragraphs(summary, translations)
+    
+    def finish_shared_paragraphs(self, summary: Dict, translations: List[str]) -> Dict:
+        """Map the translated lines back to the shared texts and log what they save
+        
+        A chunk whose translation came back with a different number of lines
+        can't be matched up; its texts are left to the files.
+        """
+        self.shared_translations = {}
+        unmatched = 0
+        for chunk, translation in zip(summary.pop("chunks"), translations):
+            lines = [line.strip() for line in translation.splitlines() if line.strip()]
+            if len(lines) == len(chunk):
+                self.shared_translations.update(zip(chunk, lines))
+            else:
+                unmatched += len(chunk)
+        if unmatched:
+            self.log_translation_message(f"⚠️ {unmatched} shared paragraphs came back merged or split - "
+                                         f"they will be translated in their files")
+            summary["unmatched"] = unmatched
+        self.log_translation_message(f"♻️ Batch dedup: {self.describe_dedup(summary)}")
+        return summary
+    
+    def describe_dedup(self, summary: Dict) -> str:
+        """One-line summary of a batch dedup pre-pass"""
+        return (f"{summary['shared']} shared paragraphs translated once for {summary['occurrences']} occurrences - "
+                f"{summary['chars_saved']:,} characters not re-sent, "
+                f"{summary['requests_before']} → {summary['requests_after']} requests")
+    
     # ========== FOLDER PROCESSING ==========
     
     def create_output_structure(self, source_lang: str, target_lang: str) -> Path:
@@ -1051,9 +4565,11 @@ class DeepSeekOnlyTranslator:
         return sorted_docs
     
     def process_single_document(self, doc_path: Path, source_lang: str, target_lang: str, 
-                               context: str, output_folder: Path) -> Dict:
+                               context: str, output_folder: Path, run_deadline: Deadline = None) -> Dict:
         """Process single document with DeepSeek direct translation - supports HTML"""
         
+        deadline = Deadline(self.file_timeout, "file deadline", run_deadline)
+        
         try:
             # Read document
             content = self.read_document(str(doc_path))
@@ -1069,26 +4585,20 @@ class DeepSeekOnlyTranslator:
             # Direct translation with Azure AI DeepSeek
             start_time = time.time()
             
+            # Glossary usage for this document only
+            file_usage = {}
+            
             try:
-                final_translation = self.translate_document_with_deepseek(content, context, is_html)
+                final_translation = self.translate_document_with_deepseek(content, context, is_html, file_usage, deadline)
                 translation_time = time.time() - start_time
                 
                 # Save translated document
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                
-                if is_html:
-                    # For HTML files, keep the original filename
-                    output_file = output_folder / "translations" / doc_path.name
-                else:
-                    # For other files, add language info
-                    output_file = output_folder / "translations" / f"{doc_path.stem}_{source_lang}_to_{target_lang}_{timestamp}.txt"
-                
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    # Write ONLY the translation - no metadata headers!
-                    f.write(final_translation)
+                output_file = self.save_translation_output(
+                    doc_path, final_translation, is_html, source_lang, target_lang, output_folder
+                )
                 
                 # Update glossary usage after each file
-                self.update_glossary_after_file(doc_path.name)
+                self.update_glossary_after_file(doc_path.name, file_usage)
                 
                 return {
                     "success": True,
@@ -1100,11 +4610,133 @@ class DeepSeekOnlyTranslator:
                 }
                 
             except TranslationFailedException as e:
-                return {"success": False, "error": str(e)}
+                # Configuration errors mean no other document can succeed either
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "fatal": isinstance(e, TranslationConfigurationError),
+                    "deferred": isinstance(e, TranslationDeferredException),
+                    "timed_out": isinstance(e, TranslationTimeoutError)
+                }
             
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def save_translation_output(self, doc_path: Path, final_translation: str, is_html: bool,
+                                source_lang: str, target_lang: str, output_folder: Path) -> Path:
+        """Write a translated document into the output folder"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        if is_html:
+            # For HTML files, keep the original filename
+            output_file = output_folder / "translations" / doc_path.name
+        else:
+            # For other files, add language info
+            output_file = output_folder / "translations" / f"{doc_path.stem}_{source_lang}_to_{target_lang}_{timestamp}.txt"
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            # Write ONLY the translation - no metadata headers!
+            f.write(final_translation)
+        
+        return output_file
+    
+    def record_file_result(self, results: Dict, doc_info: Dict, file_result: Dict):
+        """Add one document's outcome to the run results"""
+        if file_result["success"]:
+            results["processed_files"].append(file_result)
+            results["total_chars"] += file_result["char_count"]
+        elif file_result.get("deferred"):
+            # Not a failure - can be picked up again with resume_deferred()
+            results.setdefault("deferred_files", []).append({
+                "file": doc_info["name"],
+                "path": str(doc_info["path"]),
+                "type": doc_info.get("type", Path(doc_info["path"]).suffix.lower()),
+                "reason": file_result["error"]
+            })
+        else:
+            results["failed_files"].append({
+                "file": doc_info["name"],
+                "error": file_result["error"],
+                "timed_out": file_result.get("timed_out", False)
+            })
+    
+    def process_documents(self, documents: List[Dict], source_lang: str, target_lang: str, context: str,
+                          output_folder: Path, results: Dict, on_file_done=None) -> Dict:
+        """Translate several documents at once and gather outcomes into the results dict
+        
+        on_file_done(completed, total, doc_info, file_result) is called from the
+        calling thread as each document finishes, so GUIs can update safely.
+        """
+        results["context"] = context
+        results.setdefault("deferred_files", [])
+        if self.azure_translator:
+            for backend in self.azure_translator.backends:
+                backend.circuit_breaker.reset()
+            self.azure_translator.retry_budget.reset()
+            self.azure_translator.language_pair = f"{source_lang}-{target_lang}"
+        if self.translation_memory:
+            self.translation_memory.reset_stats()
+        if self.output_sizing:
+            self.output_sizing.reset_stats()
+        self.tune_chunk_size(self.azure_translator)
+        
+        run_deadline = Deadline(self.run_timeout, "run deadline")
+        self.shared_translations = {}
+        results["dedup"] = None
+        if len(documents) > 1:
+            results["dedup"] = self.translate_shared_paragraphs(documents, context, run_deadline)
+        
+        def process(doc_info: Dict) -> Dict:
+            if run_deadline.expired:
+                return {"success": False, "error": str(run_deadline.error()), "timed_out": True}
+            try:
+                return self.process_single_document(
+                    doc_info["path"], source_lang, target_lang, context, output_folder, run_deadline
+                )
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+        
+        recorded = set()
+        
+        def record(future, file_result: Dict):
+            recorded.add(future)
+            doc_info = futures[future]
+            self.record_file_result(results, doc_info, file_result)
+            if on_file_done:
+                on_file_done(len(recorded), len(documents), doc_info, file_result)
+        
+        workers = max(1, min(self.file_workers, len(documents)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file") as executor:
+            futures = {executor.submit(process, doc_info): doc_info for doc_info in documents}
+            
+            for future in as_completed(futures):
+                file_result = future.result()
+                record(future, file_result)
+                
+                if file_result.get("fatal"):
+                    # Stop the run - queued documents would fail the same way
+                    results["aborted"] = file_result["error"]
+                    for pending in futures:
+                        pending.cancel()
+                    break
+            
+            # After an abort, report documents that never started and collect ones still running
+            for future in futures:
+                if future not in recorded:
+                    if future.cancelled():
+                        record(future, {"success": False, "error": f"Not started - run aborted: {results['aborted']}"})
+                    else:
+                        record(future, future.result())
+        
+        # Shared translations belong to this batch only
+        self.shared_translations = {}
+        if self.output_sizing:
+            self.output_sizing.save()
+        if self.chunk_tuning:
+            self.chunk_tuning.end_run()
+            self.chunk_tuning.save()
+        return results
+    
     def ask_about_html_processing(self, html_count: int) -> bool:
         """Ask user if they want to process HTML files"""
         if html_count == 0:
@@ -1117,18 +4749,34 @@ class DeepSeekOnlyTranslator:
         return choice != 'n'
     
     def process_folder(self, folder_path: str, source_lang: str, target_lang: str, 
-                      context: str = "", skip_existing: bool = True) -> Dict:
+                      context: str = "", skip_existing: bool = True, chunk_workers: int = None,
+                      file_workers: int = None, max_in_flight: int = None) -> Dict:
         """Main method to process entire folder with DeepSeek - includes HTML support"""
         
         # Initialize translation logs
         self.translation_logs = []
         
+        self.set_concurrency(chunk_workers, file_workers, max_in_flight)
+        
         self.log_translation_message(f"🚀 DEEPSEEK FOLDER TRANSLATION WITH HTML SUPPORT")
         self.log_translation_message("=" * 60)
         self.log_translation_message(f"📂 Folder: {folder_path}")
         self.log_translation_message(f"🔄 Languages: {source_lang.upper()} → {target_lang.upper()}")
         self.log_translation_message(f"🧠 Method: Azure AI DeepSeek direct translation")
         self.log_translation_message(f"🌐 HTML support: Structure + image preservation")
+        self.log_translation_message(f"⚡ Parallel chunks per document: {self.chunk_workers}")
+        self.log_translation_message(f"⚡ Parallel documents: {self.file_workers} (adaptive, up to {self.max_in_flight_requests} requests in flight)")
+        if self.azure_translator:
+            backends = self.azure_translator.backends
+            if len(backends) > 1:
+                self.log_translation_message(f"🔀 Endpoints: {len(backends)}, {self.azure_translator.routing} routing")
+            for backend in backends:
+                prefix = f"[{backend.name}] " if len(backends) > 1 else ""
+                self.log_translation_message(f"🚦 {prefix}Rate limits: {backend.rate_limiter.describe()}")
+            self.log_translation_message(f"🪁 Hedged requests: {backends[0].hedge_policy.describe()}")
+        if self.translation_memory:
+            self.log_translation_message(f"🧠 Translation memory: {self.translation_memory.entries:,} cached chunks")
+        self.log_translation_message(f"⏰ Timeouts: {self.describe_timeouts()}")
         self.log_translation_message("=" * 60)
         
         start_time = time.time()
@@ -1163,50 +4811,104 @@ class DeepSeekOnlyTranslator:
             "total_time": 0,
             "total_chars": 0,
             "output_folder": output_folder,
+            "deferred_files": [],
             "glossaries_used": list(self.glossaries.keys()),
             "method": "Azure AI DeepSeek with HTML support",
             "source_lang": source_lang,
-            "target_lang": target_lang
+            "target_lang": target_lang,
+            "context": context
         }
         
         self.log_translation_message(f"🔄 Processing {len(sorted_documents)} documents...")
         
-        for i, doc_info in enumerate(sorted_documents):
-            doc_path = doc_info["path"]
+        def on_file_done(completed, total, doc_info, file_result):
             doc_name = doc_info["name"]
             
-            self.log_translation_message(f"📄 Processing file {i+1}/{len(sorted_documents)}: {doc_name}")
+            self.log_translation_message(f"📄 Finished file {completed}/{total}: {doc_name}")
             self.log_translation_message("─" * 50)
             
-            try:
-                # Process single document
-                file_result = self.process_single_document(
-                    doc_path, source_lang, target_lang, context, output_folder
-                )
-                
-                if file_result["success"]:
-                    results["processed_files"].append(file_result)
-                    results["total_chars"] += file_result["char_count"]
-                    self.log_translation_message(f"✅ Completed: {doc_name}")
-                else:
-                    results["failed_files"].append({
-                        "file": doc_name,
-                        "error": file_result["error"]
-                    })
-                    self.log_translation_message(f"❌ Failed: {doc_name} - {file_result['error']}")
-                
-            except Exception as e:
-                error_msg = str(e)
-                results["failed_files"].append({
-                    "file": doc_name,
-                    "error": error_msg
-                })
-                self.log_translation_message(f"❌ Error processing {doc_name}: {error_msg}")
+            if file_result["success"]:
+                self.log_translation_message(f"✅ Completed: {doc_name}")
+            elif file_result.get("deferred"):
+                self.log_translation_message(f"⏸️ Deferred: {doc_name} - {file_result['error']}")
+            elif file_result.get("timed_out"):
+                self.log_translation_message(f"⏰ Timed out: {doc_name} - {file_result['error']}")
+            else:
+                self.log_translation_message(f"❌ Failed: {doc_name} - {file_result['error']}")
             
             # Progress update
-            progress = (i + 1) / len(sorted_documents) * 100
+            progress = completed / total * 100
             self.log_translation_message(f"📊 Overall progress: {progress:.1f}%")
+            self.log_concurrency_status()
+        
+        self.process_documents(
+            sorted_documents, source_lang, target_lang, context, output_folder, results, on_file_done
+        )
+        
+        return self.finish_folder_run(results, output_folder, start_time)
+    
+    def resume_deferred(self, manifest_path: str) -> Dict:
+        """Translate the files a previous run deferred, into that run's output folder"""
+        
+        # Initialize translation logs
+        self.translation_logs = []
+        
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            return {"error": f"Could not read deferred manifest: {e}"}
+        
+        documents = [
+            {"path": Path(info["path"]), "name": info["file"], "type": info["type"]}
+            for info in manifest["files"] if Path(info["path"]).exists()
+        ]
+        if not documents:
+            return {"error": "No deferred documents left to translate"}
+        
+        source_lang, target_lang = manifest["source_lang"], manifest["target_lang"]
+        output_folder = Path(manifest["output_folder"])
+        for subfolder in ("translations", "glossaries", "logs"):
+            (output_folder / subfolder).mkdir(parents=True, exist_ok=True)
+        
+        self.log_translation_message(f"▶️ RESUMING {len(documents)} DEFERRED DOCUMENTS")
+        self.log_translation_message(f"📋 Manifest: {manifest_path}")
+        
+        start_time = time.time()
+        results = {
+            "processed_files": [],
+            "skipped_files": [],
+            "failed_files": [],
+            "total_time": 0,
+            "total_chars": 0,
+            "output_folder": output_folder,
+            "deferred_files": [],
+            "glossaries_used": list(self.glossaries.keys()),
+            "method": "Azure AI DeepSeek (resumed deferred files)",
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "context": manifest.get("context", "")
+        }
+        
+        def on_file_done(completed, total, doc_info, file_result):
+            if file_result["success"]:
+                self.log_translation_message(f"✅ Completed {completed}/{total}: {doc_info['name']}")
+            elif file_result.get("deferred"):
+                self.log_translation_message(f"⏸️ Deferred again: {doc_info['name']} - {file_result['error']}")
+            else:
+                self.log_translation_message(f"❌ Failed: {doc_info['name']} - {file_result['error']}")
+            self.log_concurrency_status()
         
+        self.process_documents(
+            documents, source_lang, target_lang, results["context"], output_folder, results, on_file_done
+        )
+        
+        return self.finish_folder_run(results, output_folder, start_time)
+    
+    def finish_folder_run(self, results: Dict, output_folder: Path, start_time: float,
+                          translator: "AzureDeepSeekTranslator" = None) -> Dict:
+        """Save glossary and logs for a folder run and print the final summary"""
+        translator = translator or self.azure_translator
         # Step 7: Save glossary and logs
         if self.glossaries:
             self.save_updated_glossary(output_folder)
@@ -1216,21 +4918,355 @@ class DeepSeekOnlyTranslator:
         results["total_time"] = total_time
         
         # Save translation logs
-        self.save_translation_logs(output_folder, results)
+        self.save_translation_logs(output_folder, results, translator)
         
         # Step 8: Final summary
-        self.log_translation_message(f"🎉 FOLDER PROCESSING COMPLETED!")
+        if results.get("aborted"):
+            self.log_translation_message(f"🛑 RUN ABORTED: {results['aborted']}")
+        else:
+            self.log_translation_message(f"🎉 FOLDER PROCESSING COMPLETED!")
         self.log_translation_message(f"✅ Successfully processed: {len(results['processed_files'])} files")
         self.log_translation_message(f"❌ Failed: {len(results['failed_files'])} files")
         if results["failed_files"]:
             self.log_translation_message(f"   Failed files: {', '.join([f['file'] for f in results['failed_files']])}")
+            timed_out = [f['file'] for f in results['failed_files'] if f.get('timed_out')]
+            if timed_out:
+                self.log_translation_message(f"⏰ Timed out: {len(timed_out)} of the failed files")
+        if results.get("deferred_files"):
+            self.log_translation_message(f"⏸️ Deferred: {len(results['deferred_files'])} files (see the deferred manifest in logs)")
         self.log_translation_message(f"📊 Total characters: {results['total_chars']:,}")
         self.log_translation_message(f"⏱️ Total time: {total_time:.2f} seconds")
-        self.log_translation_message(f"🧠 Method: Azure AI DeepSeek with HTML support")
+        self.log_translation_message(f"🧠 Method: {results['method']}")
+        if results.get("dedup"):
+            self.log_translation_message(f"♻️ Batch dedup: {self.describe_dedup(results['dedup'])}")
+        if translator:
+            backends = translator.backends
+            if len(backends) > 1:
+                self.log_translation_message(f"🔀 Load balancing: {translator.describe_routing()}")
+            for backend in backends:
+                prefix = f"[{backend.name}] " if len(backends) > 1 else ""
+                self.log_translation_message(f"🚦 {prefix}Rate limiting: {backend.rate_limiter.describe()}")
+                self.log_translation_message(f"⚡ {prefix}Concurrency: {backend.concurrency_limiter.describe()}")
+                self.log_translation_message(f"🔌 {prefix}Circuit breaker: {backend.circuit_breaker.describe()}")
+                if backend.hedge_policy.enabled:
+                    self.log_translation_message(f"🪁 {prefix}Hedging: {backend.hedge_policy.describe()}")
+            self.log_translation_message(f"🔁 Retry budget: {translator.retry_budget.describe()}")
+        if self.translation_memory:
+            self.log_translation_message(f"🧠 Translation memory: {self.translation_memory.describe()}")
+        if self.output_sizing:
+            self.log_translation_message(f"📏 Output sizing: {self.output_sizing.describe()}")
+        if self.chunk_tuning and translator:
+            self.log_translation_message(f"📐 Chunk size: {self.chunk_tuning.describe(translator.backends)}")
         self.log_translation_message(f"📄 Output: Clean files with preserved structure")
         self.log_translation_message(f"📁 Output folder: {output_folder}")
         
         return results
+    
+    # ========== ASYNC TRANSLATION ==========
+    
+    def open_async_translator(self) -> AsyncAzureDeepSeekTranslator:
+        """Create an async translator from the configured credentials - use with 'async with'"""
+        if not self.use_azure_deepseek:
+            raise TranslationFailedException("Azure AI DeepSeek not available")
+        
+        if not self.azure_translator:
+            translator = AsyncAzureDeepSeekTranslator(self.azure_endpoint, self.azure_api_key, self.async_max_in_flight)
+            translator.translation_memory = self.translation_memory
+            translator.output_sizing = self.output_sizing
+            translator.chunk_tuning = self.chunk_tuning
+            return translator
+        
+        # Mirror the sync backends, with the same routing and per-endpoint settings
+        members = []
+        for backend in self.azure_translator.backends:
+            member = AsyncAzureDeepSeekTranslator(backend.endpoint, backend.api_key, self.async_max_in_flight)
+            member.weight = backend.weight
+            member.config_suffix = backend.config_suffix
+            member.connect_timeout = backend.connect_timeout
+            member.read_timeout = backend.read_timeout
+            member.hedge_policy.configure(backend.hedge_policy.percentile or 0, backend.hedge_policy.max_hedge_ratio)
+            members.append(member)
+        
+        translator = members[0] if len(members) == 1 else AsyncAzureDeepSeekPool(members, self.azure_translator.routing)
+        translator.translation_memory = self.translation_memory
+        translator.output_sizing = self.output_sizing
+        translator.chunk_tuning = self.chunk_tuning
+        return translator
+    
+    async def translate_chunks_async(self, translator: AsyncAzureDeepSeekTranslator, chunks: List[str],
+                                     glossary_terms: str, context: str, element_type: str = "paragraph",
+                                     deadline: Deadline = None, tuned: bool = False) -> List[str]:
+        """Translate all chunks on the event loop, returning results in the original order"""
+        
+        async def translate_chunk(chunk: str) -> str:
+            text, chunk_terms, placeholders = self.prepare_chunk_request(chunk, glossary_terms)
+            try:
+                return await translator.translate_with_glossary(
+                    text, chunk_terms, context, element_type, deadline=deadline, placeholders=placeholders, tuned=tuned
+                )
+            except TranslationFailedException as e:
+                if not isinstance(e.__cause__, PlaceholderMismatchError):
+                    raise
+                # The model dropped or invented placeholders - list the terms instead (one request, no retries of the same prompt)
+                print(f"   ↩️ Placeholders not preserved - retrying chunk with the glossary listed")
+                return await translator.translate_with_glossary(
+                    chunk, self.chunk_glossary(chunk, glossary_terms), context, element_type, deadline=deadline, tuned=tuned
+                )
+        
+        tasks = [asyncio.ensure_future(translate_chunk(chunk)) for chunk in chunks]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # One failed chunk fails the document - stop the others
+            for task in tasks:
+                task.cancel()
+            raise
+    
+    async def translate_shared_paragraphs_async(self, translator: AsyncAzureDeepSeekTranslator, documents: List[Dict],
+                                                context: str, deadline: Deadline = None) -> Dict:
+        """Async counterpart of translate_shared_paragraphs"""
+        self.shared_translations = {}
+        if not self.deduplicate_batches or len(documents) < 2:
+            return None
+        
+        # Reading and parsing every file is blocking - keep it off the event loop
+        summary = await asyncio.to_thread(self.find_shared_paragraphs, documents)
+        if not self.worth_deduplicating(summary):
+            return None
+        
+        self.log_translation_message(f"♻️ Translating {summary['shared']} paragraphs shared across files once "
+                                     f"in {len(summary['chunks'])} requests...")
+        try:
+            translations = await self.translate_chunks_async(
+                translator, ['\n'.join(chunk) for chunk in summary["chunks"]], self.prepare_glossary_for_translation(),
+                context, "paragraph", deadline
+            )
+        except TranslationFailedException as e:
+            self.log_translation_message(f"⚠️ Shared paragraphs will be translated per file instead: {e}")
+            return None
+        
+        return self.finish_shared_paragraphs(summary, translations)
+    
+    async def translate_document_async(self, content: str, context: str = "", is_html: bool = False,
+                                       usage: Dict = None, translator: AsyncAzureDeepSeekTranslator = None,
+                                       deadline: Deadline = None) -> str:
+        """Async counterpart of translate_document_with_deepseek
+        
+        Pass an open AsyncAzureDeepSeekTranslator to share its connection and
+        in-flight cap across documents; otherwise one is opened for this call.
+        """
+        if translator is None:
+            async with self.open_async_translator() as translator:
+                return await self.translate_document_async(content, context, is_html, usage, translator, deadline)
+        
+        # Prepare glossary terms
+        glossary_terms = self.prepare_glossary_for_translation()
+        
+        if is_html:
+            print(f"🌐 Translating HTML document with structure preservation (async)...")
+            try:
+                soup, element_chunks, combined_texts, shared_elements = self.prepare_html_chunks(content)
+                
+                if not element_chunks and not shared_elements:
+                    return content
+                
+                translated_texts = await self.translate_chunks_async(
+                    translator, combined_texts, glossary_terms, context, "paragraph", deadline
+                )
+                self.apply_html_translations(element_chunks, combined_texts, translated_texts, usage, shared_elements)
+                return str(soup)
+                
+            except TranslationFailedException as e:
+                print(f"   ❌ HTML translation error: {e}")
+                raise
+            except Exception as e:
+                print(f"   ❌ HTML translation error: {e}")
+                raise TranslationFailedException(f"HTML translation failed: {e}")
+        
+        print(f"🌐 Using Azure AI DeepSeek for direct Korean→English translation (async)...")
+        
+        chunks, layout = self.plan_text_chunks(content)
+        translated_chunks = await self.translate_chunks_async(
+            translator, chunks, glossary_terms, context, "paragraph", deadline, tuned=True
+        )
+        
+        # Reassemble with shared paragraphs, tracking glossary usage
+        final_translation = self.assemble_text_translation(layout, chunks, translated_chunks, usage)
+        
+        print(f"✅ DeepSeek translation completed! Processed {len(chunks)} chunks")
+        return final_translation
+    
+    async def process_single_document_async(self, translator: AsyncAzureDeepSeekTranslator, doc_path: Path,
+                                            source_lang: str, target_lang: str, context: str,
+                                            output_folder: Path, run_deadline: Deadline = None) -> Dict:
+        """Async counterpart of process_single_document"""
+        deadline = Deadline(self.file_timeout, "file deadline", run_deadline)
+        
+        try:
+            # File reading is blocking - keep it off the event loop
+            content = await asyncio.to_thread(self.read_document, str(doc_path))
+            if content.startswith("Error:"):
+                return {"success": False, "error": content}
+            
+            char_count = len(content)
+            is_html = doc_path.suffix.lower() in {'.html', '.htm'}
+            start_time = time.time()
+            file_usage = {}
+            
+            try:
+                final_translation = await self.translate_document_async(
+                    content, context, is_html, file_usage, translator, deadline
+                )
+                translation_time = time.time() - start_time
+                
+                output_file = self.save_translation_output(
+                    doc_path, final_translation, is_html, source_lang, target_lang, output_folder
+                )
+                self.update_glossary_after_file(doc_path.name, file_usage)
+                
+                return {
+                    "success": True,
+                    "file": doc_path.name,
+                    "output_file": output_file.name,
+                    "char_count": char_count,
+                    "translation_time": translation_time,
+                    "method": f"Azure AI DeepSeek async {'HTML' if is_html else 'text'} translation"
+                }
+                
+            except TranslationFailedException as e:
+                # Configuration errors mean no other document can succeed either
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "fatal": isinstance(e, TranslationConfigurationError),
+                    "deferred": isinstance(e, TranslationDeferredException),
+                    "timed_out": isinstance(e, TranslationTimeoutError)
+                }
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    async def process_folder_async(self, folder_path: str, source_lang: str, target_lang: str,
+                                   context: str = "", process_html: bool = True,
+                                   max_in_flight: int = None) -> Dict:
+        """Async counterpart of process_folder - non-interactive, for embedding in async services"""
+        
+        # Initialize translation logs
+        self.translation_logs = []
+        
+        if max_in_flight:
+            self.async_max_in_flight = max_in_flight
+        
+        self.log_translation_message(f"🚀 DEEPSEEK ASYNC FOLDER TRANSLATION")
+        self.log_translation_message("=" * 60)
+        self.log_translation_message(f"📂 Folder: {folder_path}")
+        self.log_translation_message(f"🔄 Languages: {source_lang.upper()} → {target_lang.upper()}")
+        self.log_translation_message(f"⚡ Requests in flight: adaptive, up to {self.async_max_in_flight}")
+        self.log_translation_message(f"⏰ Timeouts: {self.describe_timeouts()}")
+        self.log_translation_message("=" * 60)
+        
+        start_time = time.time()
+        
+        analysis = self.analyze_folder(folder_path)
+        if "error" in analysis:
+            return analysis
+        
+        all_documents = analysis["documents"].copy()
+        if process_html:
+            all_documents.extend(analysis["html_files"])
+        
+        sorted_documents = self.sort_documents_by_priority(all_documents)
+        
+        if not sorted_documents:
+            return {"error": "No translatable documents found in folder"}
+        
+        output_folder = self.create_output_structure(source_lang, target_lang)
+        
+        results = {
+            "processed_files": [],
+            "skipped_files": [],
+            "failed_files": [],
+            "total_time": 0,
+            "total_chars": 0,
+            "output_folder": output_folder,
+            "deferred_files": [],
+            "glossaries_used": list(self.glossaries.keys()),
+            "method": "Azure AI DeepSeek async engine",
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "context": context
+        }
+        
+        self.log_translation_message(f"🔄 Processing {len(sorted_documents)} documents...")
+        
+        # Bound open documents so files finish steadily instead of all at the end
+        file_limit = asyncio.Semaphore(self.async_file_workers)
+        
+        run_deadline = Deadline(self.run_timeout, "run deadline")
+        if self.translation_memory:
+            self.translation_memory.reset_stats()
+        if self.output_sizing:
+            self.output_sizing.reset_stats()
+        
+        async with self.open_async_translator() as translator:
+            translator.language_pair = f"{source_lang}-{target_lang}"
+            self.tune_chunk_size(translator)
+            self.shared_translations = {}
+            results["dedup"] = None
+            if len(sorted_documents) > 1:
+                results["dedup"] = await self.translate_shared_paragraphs_async(
+                    translator, sorted_documents, context, run_deadline
+                )
+            
+            async def process(doc_info: Dict):
+                async with file_limit:
+                    if run_deadline.expired:
+                        return doc_info, {"success": False, "error": str(run_deadline.error()), "timed_out": True}
+                    file_result = await self.process_single_document_async(
+                        translator, doc_info["path"], source_lang, target_lang, context, output_folder, run_deadline
+                    )
+                    return doc_info, file_result
+            
+            tasks = {asyncio.ensure_future(process(doc_info)): doc_info for doc_info in sorted_documents}
+            pending = set(tasks)
+            completed = 0
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    completed += 1
+                    doc_info = tasks[task]
+                    if task.cancelled():
+                        file_result = {"success": False, "error": f"Not started - run aborted: {results['aborted']}"}
+                    else:
+                        file_result = task.result()[1]
+                    self.record_file_result(results, doc_info, file_result)
+                    
+                    if file_result["success"]:
+                        self.log_translation_message(f"✅ Completed {completed}/{len(sorted_documents)}: {doc_info['name']}")
+                    elif file_result.get("deferred"):
+                        self.log_translation_message(f"⏸️ Deferred: {doc_info['name']} - {file_result['error']}")
+                    elif file_result.get("timed_out"):
+                        self.log_translation_message(f"⏰ Timed out: {doc_info['name']} - {file_result['error']}")
+                    else:
+                        self.log_translation_message(f"❌ Failed: {doc_info['name']} - {file_result['error']}")
+                    
+                    if file_result.get("fatal") and not results.get("aborted"):
+                        # Stop the run - remaining documents would fail the same way
+                        results["aborted"] = file_result["error"]
+                        for remaining in pending:
+                            remaining.cancel()
+                
+                self.log_concurrency_status(translator)
+            
+        # Shared translations belong to this batch only
+        self.shared_translations = {}
+        if self.output_sizing:
+            self.output_sizing.save()
+        if self.chunk_tuning:
+            self.chunk_tuning.end_run()
+            self.chunk_tuning.save()
+        return self.finish_folder_run(results, output_folder, start_time, translator)
 
 
 def main():
@@ -1263,9 +5299,10 @@ def main():
         print("1. 📁 Process Single Folder")
         print("2. 🔍 Analyze Folder (Preview)")
         print("3. ⚙️ View Settings")
-        print("4. 🚪 Exit")
+        print("4. ▶️ Resume Deferred Files")
+        print("5. 🚪 Exit")
         
-        choice = input("\nEnter choice (1-4): ").strip()
+        choice = input("\nEnter choice (1-5): ").strip()
         
         if choice == "1":
             # Single folder processing
@@ -1281,10 +5318,13 @@ def main():
             
             context = input("Novel context (e.g., 'Fantasy light novel'): ").strip()
             
+            chunk_workers = input(f"Parallel chunks per document ({translator.chunk_workers}): ").strip()
+            chunk_workers = int(chunk_workers) if chunk_workers.isdigit() and int(chunk_workers) > 0 else None
+            
             if source_lang and target_lang:
                 print(f"\n🚀 Starting DeepSeek translation...")
                 results = translator.process_folder(
-                    folder_path, source_lang, target_lang, context
+                    folder_path, source_lang, target_lang, context, chunk_workers=chunk_workers
                 )
                 
                 if "error" not in results:
@@ -1321,14 +5361,46 @@ def main():
             print(f"   📁 Output location: Application directory")
             print(f"   🌐 HTML support: ENABLED")
             print(f"   📚 Glossary system: Manual loading")
+            print(f"   📚 Glossary per request: {'terms found in the chunk' if translator.glossary_per_chunk else 'whole glossary'}"
+                  f"{f' (max {translator.max_glossary_terms})' if translator.max_glossary_terms else ''}"
+                  f"{' as ⟦A⟧ placeholders' if translator.glossary_placeholders else ''}")
             print(f"   🔄 Translation failure: Proper error handling")
+            print(f"   ⚡ Parallel chunks per document: {translator.chunk_workers}")
+            if translator.azure_translator:
+                print(f"   🔀 Endpoints: {len(translator.azure_translator.backends)}")
+                print(f"   🪁 Hedged requests: {translator.azure_translator.backends[0].hedge_policy.describe()}")
+            print(f"   ⏰ Timeouts: {translator.describe_timeouts()}")
+            print(f"   📦 Chunk size: {translator.chunk_budget.describe()}"
+                  f"{' - tuned per run from measured throughput' if translator.chunk_tuning else ''}")
+            if translator.output_sizing:
+                print(f"   📏 Output sizing: {translator.output_sizing.describe()}")
+            if translator.translation_memory:
+                tm = translator.translation_memory
+                print(f"   🧠 Translation memory: {tm.entries:,}/{tm.max_entries:,} chunks in {tm.path}")
+            else:
+                print(f"   🧠 Translation memory: OFF")
             
         elif choice == "4":
+            # Resume deferred files
+            print("\n▶️ RESUME DEFERRED FILES")
+            print("─" * 30)
+            
+            manifest_path = input("Enter deferred manifest path (logs/deferred_*.json): ").strip().strip('"')
+            if manifest_path:
+                results = translator.resume_deferred(manifest_path)
+                
+                if "error" not in results:
+                    print(f"\n✅ Resume completed!")
+                    print(f"📊 Check output folder: {results['output_folder']}")
+                else:
+                    print(f"❌ Error: {results['error']}")
+        
+        elif choice == "5":
             print("👋 Goodbye!")
             break
             
         else:
-            print("❌ Invalid choice. Please enter 1-4.")
+            print("❌ Invalid choice. Please enter 1-5.")
 
 
 if __name__ == "__main__":